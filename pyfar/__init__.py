@@ -6,6 +6,7 @@ __author__ = """The pyfar developers"""
 __email__ = ''
 __version__ = '0.7.2'
 
+import importlib
 
 from .classes.audio import Signal, TimeData, FrequencyData
 from .classes.audio import (add, subtract, multiply, divide, power,
@@ -16,13 +17,22 @@ from .classes.orientations import Orientations
 from .classes.filter import FilterFIR, FilterIIR, FilterSOS
 from .classes.transmission_matrix import TransmissionMatrix
 
-from . import plot
-from . import samplings
-from . import io
-from . import dsp
-from . import signals
 from . import utils
 
+# Sub-packages that depend on heavy third party packages, e.g., matplotlib or
+# sofar, are imported on first access, e.g., when calling `pyfar.plot.time`.
+_lazy_submodules = ['plot', 'samplings', 'io', 'dsp', 'signals']
+
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_submodules))
+
 
 __all__ = [
     'Signal',
@@ -31,7 +31,6 @@ iterates the channels of a `Signal` object
 
 from copy import deepcopy
 import warnings
-import deepdiff
 import numpy as np
 import pyfar.dsp.fft as fft
 from typing import Callable
@@ -65,7 +64,11 @@ class _Audio():
 
     def __eq__(self, other):
         """Check for equality of two objects."""
-        return not deepdiff.DeepDiff(self.__dict__, other.__dict__)
+        import deepdiff
+        # the domain cache of Signal objects does not contain information
+        return not deepdiff.DeepDiff(
+            self.__dict__, other.__dict__,
+            exclude_paths=["root['_cached_data']", "root['cache_domains']"])
 
     @property
     def domain(self):
@@ -96,6 +99,19 @@ class _Audio():
         """
         return len(self.cshape)
 
+    @property
+    def dtype(self):
+        """
+        Return the floating point precision of the data.
+
+        This is ``float32`` (single precision) or ``float64`` (double
+        precision). Real-valued data are stored with this type and
+        complex-valued data with the corresponding complex type, i.e.,
+        ``complex64`` or ``complex128``. The precision is kept when the
+        data are set or transformed between the time and frequency domain.
+        """
+        return np.dtype(self._dtype)
+
     def reshape(self, newshape):
         """
         Return reshaped copy of the audio object.
@@ -327,9 +343,23 @@ class TimeData(_Audio):
     is_complex : bool, optional
         A flag which indicates if the time data are real or complex-valued.
         The default is ``False``.
+    dtype : str, numpy dtype, optional
+        The floating point precision of the data. Can be ``'float32'`` or
+        ``'float64'``. Complex-valued data are stored as ``'complex64'`` or
+        ``'complex128'``, which can also be passed. The default is ``None``,
+        which uses :py:attr:`default_dtype` if it is not ``None`` and single
+        precision if `data` is ``float32`` or ``complex64`` and double
+        precision otherwise.
     """
 
-    def __init__(self, data, times, comment="", is_complex=False):
+    #: The default floating point precision of new TimeData objects if no
+    #: `dtype` is given. Set ``pyfar.TimeData.default_dtype = 'float32'``
+    #: to store the data of all TimeData objects with single precision. The
+    #: default is ``None``, which uses the precision of the input data.
+    default_dtype = None
+
+    def __init__(self, data, times, comment="", is_complex=False,
+                 dtype=None):
         """Create TimeData object with data, and times."""
 
         _Audio.__init__(self, 'time', comment)
@@ -340,6 +370,7 @@ class TimeData(_Audio):
                             "but must be a boolean")
 
         self._complex = is_complex
+        self._dtype = _get_dtype(dtype, self.default_dtype, data)
         self.time = data
 
         self._times = np.atleast_1d(np.asarray(times).flatten())
@@ -360,14 +391,10 @@ class TimeData(_Audio):
         # check and set the data and meta data
         data = np.atleast_2d(np.asarray(value))
         self._check_input_type_is_numeric(data)
-        if self.complex:
-            data = np.atleast_2d(np.asarray(value, dtype=complex))
-        else:
-            if data.dtype.kind in ["i", "u"]:
-                data = np.atleast_2d(np.asarray(value, dtype=float))
-            elif data.dtype.kind == "c":
-                raise ValueError("time data is complex, set is_complex "
-                                 "flag or pass real-valued data.")
+        if not self.complex and data.dtype.kind == "c":
+            raise ValueError("time data is complex, set is_complex "
+                             "flag or pass real-valued data.")
+        data = _cast(data, self._dtype, self.complex, copy=False)
 
         self._data = data
         self._n_samples = data.shape[-1]
@@ -388,11 +415,11 @@ class TimeData(_Audio):
                 raise ValueError("Signal has complex-valued time data"
                                  " is_complex flag cannot be `False`.")
             self._complex = value
-            self._data = self._data.astype(float)
+            self._data = _cast(self._data, self._dtype, False)
         # from complex=False to complex=True
         if not self._complex and value:
             self._complex = value
-            self._data = self._data.astype(complex)
+            self._data = _cast(self._data, self._dtype, True)
 
     @property
     def n_samples(self):
@@ -442,7 +469,7 @@ class TimeData(_Audio):
         """Return new :py:func:`TimeData` object with data."""
         item = TimeData(
             data, times=self.times, comment=self.comment,
-            is_complex=self.complex)
+            is_complex=self.complex, dtype=self.dtype)
         return item
 
     def __repr__(self):
@@ -459,7 +486,8 @@ class TimeData(_Audio):
         obj = cls(
             obj_dict['_data'],
             obj_dict['_times'],
-            obj_dict['_comment'])
+            obj_dict['_comment'],
+            dtype=_infer_dtype(obj_dict['_data']))
         obj.__dict__.update(obj_dict)
         return obj
 
@@ -513,6 +541,31 @@ class TimeData(_Audio):
         return matrix_multiplication(
             (data, self), 'time')
 
+    def __iadd__(self, data):
+        """In-place addition of two TimeData objects."""
+        return _arithmetic(
+            (self, data), 'time', _add, out=self, inplace=True)
+
+    def __isub__(self, data):
+        """In-place subtraction of two TimeData objects."""
+        return _arithmetic(
+            (self, data), 'time', _subtract, out=self, inplace=True)
+
+    def __imul__(self, data):
+        """In-place multiplication of two TimeData objects."""
+        return _arithmetic(
+            (self, data), 'time', _multiply, out=self, inplace=True)
+
+    def __itruediv__(self, data):
+        """In-place division of two TimeData objects."""
+        return _arithmetic(
+            (self, data), 'time', _divide, out=self, inplace=True)
+
+    def __ipow__(self, data):
+        """In-place power of two TimeData objects."""
+        return _arithmetic(
+            (self, data), 'time', _power, out=self, inplace=True)
+
 
 class FrequencyData(_Audio):
     """
@@ -535,6 +588,13 @@ class FrequencyData(_Audio):
     comment : str, optional
         A comment related to the data. The default is ``""``, which
         initializes an empty string.
+    dtype : str, numpy dtype, optional
+        The floating point precision of the data. Can be ``'float32'`` or
+        ``'float64'``. Complex-valued data are stored as ``'complex64'`` or
+        ``'complex128'``, which can also be passed. The default is ``None``,
+        which uses :py:attr:`default_dtype` if it is not ``None`` and single
+        precision if `data` is ``float32`` or ``complex64`` and double
+        precision otherwise.
 
 
     Notes
@@ -552,7 +612,14 @@ class FrequencyData(_Audio):
 
     """
 
-    def __init__(self, data, frequencies, comment=""):
+    #: The default floating point precision of new FrequencyData objects if
+    #: no `dtype` is given. Set ``pyfar.FrequencyData.default_dtype =
+    #: 'float32'`` to store the data of all FrequencyData objects with single
+    #: precision. The default is ``None``, which uses the precision of the
+    #: input data.
+    default_dtype = None
+
+    def __init__(self, data, frequencies, comment="", dtype=None):
         """Create audio object with frequency data and frequencies."""
 
         _Audio.__init__(self, 'freq', comment)
@@ -560,6 +627,7 @@ class FrequencyData(_Audio):
         # init
         freqs = np.atleast_1d(np.asarray(frequencies).flatten())
         self._frequencies = freqs
+        self._dtype = _get_dtype(dtype, self.default_dtype, data)
         self.freq = data
 
         # check frequencies
@@ -581,8 +649,7 @@ class FrequencyData(_Audio):
         # check data type
         data = np.atleast_2d(np.asarray(value))
         self._check_input_type_is_numeric(data)
-        if data.dtype.kind in ["i", "u"]:
-            data = data.astype("float")
+        data = _cast(data, self._dtype, data.dtype.kind == "c", copy=False)
 
         # match shape of frequencies
         if self.frequencies.size != data.shape[-1]:
@@ -634,7 +701,7 @@ class FrequencyData(_Audio):
         """Return new FrequencyData object with data."""
         item = FrequencyData(
             data, frequencies=self.frequencies,
-            comment=self.comment)
+            comment=self.comment, dtype=self.dtype)
         return item
 
     def __repr__(self):
@@ -651,7 +718,8 @@ class FrequencyData(_Audio):
         obj = cls(
             obj_dict['_data'],
             obj_dict['_frequencies'],
-            obj_dict['_comment'])
+            obj_dict['_comment'],
+            dtype=_infer_dtype(obj_dict['_data']))
         obj.__dict__.update(obj_dict)
         return obj
 
@@ -705,6 +773,31 @@ class FrequencyData(_Audio):
         return matrix_multiplication(
             (data, self), 'freq')
 
+    def __iadd__(self, data):
+        """In-place addition of two FrequencyData objects."""
+        return _arithmetic(
+            (self, data), 'freq', _add, out=self, inplace=True)
+
+    def __isub__(self, data):
+        """In-place subtraction of two FrequencyData objects."""
+        return _arithmetic(
+            (self, data), 'freq', _subtract, out=self, inplace=True)
+
+    def __imul__(self, data):
+        """In-place multiplication of two FrequencyData objects."""
+        return _arithmetic(
+            (self, data), 'freq', _multiply, out=self, inplace=True)
+
+    def __itruediv__(self, data):
+        """In-place division of two FrequencyData objects."""
+        return _arithmetic(
+            (self, data), 'freq', _divide, out=self, inplace=True)
+
+    def __ipow__(self, data):
+        """In-place power of two FrequencyData objects."""
+        return _arithmetic(
+            (self, data), 'freq', _power, out=self, inplace=True)
+
 
 class Signal(FrequencyData, TimeData):
     """
@@ -749,6 +842,24 @@ class Signal(FrequencyData, TimeData):
         Specifies if the underlying time domain data are complex
         or real-valued. If ``True`` and `domain` is ``'time'``, the
         input data will be cast to complex. The default is ``False``.
+    dtype : str, numpy dtype, optional
+        The floating point precision of the data. Can be ``'float32'`` or
+        ``'float64'``. The time data of real-valued signals are stored with
+        this type and the frequency data and complex-valued time data with
+        the corresponding complex type, i.e., ``'complex64'`` or
+        ``'complex128'``, which can also be passed. The precision is kept
+        when switching between the time and frequency domain. The default is
+        ``None``, which uses :py:attr:`default_dtype` if it is not ``None``
+        and single precision if `data` is ``float32`` or ``complex64`` and
+        double precision otherwise.
+
+    Notes
+    -----
+    Signal objects only store their data in the current `domain`. Accessing
+    the data in the other domain triggers a Fourier transform. If
+    :py:attr:`cache_domains` is ``True``, the data of the previous domain is
+    kept after the transform and switching back does not require another
+    transform.
 
     References
     ----------
@@ -758,6 +869,32 @@ class Signal(FrequencyData, TimeData):
             Austria, May 2020, p. e-Brief 600.
     """
 
+    #: Keep the data of both domains once they were computed to avoid
+    #: repeated Fourier transforms when switching between ``time`` and
+    #: ``freq``. This doubles the memory of signals whose data were accessed
+    #: in both domains (see :py:attr:`cache_nbytes`). While the data of both
+    #: domains are kept, the arrays returned by :py:attr:`time` and
+    #: :py:attr:`freq_raw` are read-only and must be changed by assigning
+    #: new data, e.g., ``signal.time = signal.time * 2``. Arrays that were
+    #: passed to the signal stay writeable, because the signal caches a copy
+    #: of them. Setting the data discards the cached domain. The default is
+    #: ``False``.
+    #: Set ``pyfar.Signal.cache_domains = True`` to enable the cache for all
+    #: signals or set the attribute of single signals.
+    cache_domains = False
+
+    #: The default floating point precision of new signals if no `dtype` is
+    #: given. Single precision halves the memory of the data, e.g., of large
+    #: sets of impulse responses, at the cost of a relative numerical error
+    #: in the order of ``1e-7``. Set ``pyfar.Signal.default_dtype =
+    #: 'float32'`` to store the data of all signals with single precision.
+    #: The default is ``None``, which uses the precision of the input data.
+    default_dtype = None
+
+    # skip checking the values of the data for inf and NaN if they are known
+    # to be numeric, e.g., for the results of arithmetic operations
+    _trusted_values = False
+
     def __init__(
             self,
             data,
@@ -766,7 +903,8 @@ class Signal(FrequencyData, TimeData):
             domain='time',
             fft_norm='none',
             comment="",
-            is_complex=False):
+            is_complex=False,
+            dtype=None):
         """
         Create audio Signal with time or frequency data and sampling rate.
         """
@@ -808,7 +946,8 @@ class Signal(FrequencyData, TimeData):
             self._n_samples = data.shape[-1]
             times = np.atleast_1d(
                 np.arange(0, self._n_samples) / sampling_rate)
-            TimeData.__init__(self, data, times, comment, is_complex)
+            TimeData.__init__(
+                self, data, times, comment, is_complex, dtype)
         elif domain == 'freq':
             # check and set n_samples
             if n_samples is None:
@@ -828,14 +967,14 @@ class Signal(FrequencyData, TimeData):
                                   "sided Fourier spectrum"))
             self._n_samples = n_samples
             # Init remaining parameters
-            FrequencyData.__init__(self, data, self.frequencies, comment)
+            FrequencyData.__init__(
+                self, data, self.frequencies, comment, dtype)
             delattr(self, '_frequencies')
         else:
             raise ValueError("Invalid domain. Has to be 'time' or 'freq'.")
 
-        # additional input data check required for Signal objects and not done
-        # in FrequencyData and TimeData __init__ methods
-        self._check_input_values_are_numeric(data)
+        # Note that the values of the input data were already checked by the
+        # time and freq setters, which are called by the parent classes.
 
     @property
     def time(self):
@@ -851,11 +990,13 @@ class Signal(FrequencyData, TimeData):
     def time(self, value):
         """Return or set the data in the time domain."""
         # this overrides the setter TimeData.time
+        self._clear_cache()
 
         # set data using parent class
         TimeData.time.fset(self, value)
         # additional check required for signal objects
-        self._check_input_values_are_numeric(self.time)
+        if not self._trusted_values:
+            self._check_input_values_are_numeric(self.time)
 
     @FrequencyData.freq.getter
     def freq(self):
@@ -903,7 +1044,8 @@ class Signal(FrequencyData, TimeData):
         # check data type
         data = np.atleast_2d(np.asarray(value))
         self._check_input_type_is_numeric(data)
-        self._check_input_values_are_numeric(data)
+        if not self._trusted_values:
+            self._check_input_values_are_numeric(data)
         # Check n_samples
         if data.shape[-1] != self.n_bins:
             self._n_samples = fft._n_samples_from_n_bins(
@@ -912,14 +1054,16 @@ class Signal(FrequencyData, TimeData):
                 f"Number of samples not given, assuming {self.n_samples} "
                 f"samples from {data.shape[-1]} frequency bins.", stacklevel=2)
         # set domain
+        self._clear_cache()
         self._domain = 'freq'
+        data = _cast(data, self._dtype, True)
         if not raw:
             # remove normalization
             data = fft.normalization(
                 data, self._n_samples, self._sampling_rate,
                 self._fft_norm, inverse=True,
                 single_sided=not self.complex)
-        self._data = data.astype(complex)
+        self._data = data
 
     @_Audio.domain.setter
     def domain(self, new_domain):
@@ -927,7 +1071,13 @@ class Signal(FrequencyData, TimeData):
         if new_domain not in self._VALID_DOMAINS:
             raise ValueError("Incorrect domain, needs to be time/freq.")
 
-        if self._domain != new_domain:
+        if self._domain != new_domain and \
+                self.__dict__.get('_cached_data') is not None:
+            # swap data of current and cached domain
+            self._data, self._cached_data = self._cached_data, self._data
+            self._domain = new_domain
+        elif self._domain != new_domain:
+            data = self._data
             # Only process if we change domain
             if new_domain == 'time':
                 # If the new domain should be time, we had a saved spectrum
@@ -960,8 +1110,44 @@ class Signal(FrequencyData, TimeData):
                     self._data = fft.rfft(
                         self._data, self.n_samples, self._sampling_rate,
                         fft_norm='none')
+            if self.cache_domains:
+                # data is read-only as long as both domains are kept to avoid
+                # an invalid cache due to in-place changes. The data of the
+                # previous domain is copied, because it might be shared with
+                # arrays that must stay writeable, e.g., the input data
+                cached_data = data.copy()
+                cached_data.flags.writeable = False
+                self._data.flags.writeable = False
+                self._cached_data = cached_data
             self._domain = new_domain
 
+    @property
+    def cache_nbytes(self):
+        """
+        Number of bytes used for caching the data of the inactive domain.
+
+        This is ``0`` if :py:attr:`cache_domains` is ``False`` or if the data
+        were only accessed in a single domain.
+        """
+        cached_data = self.__dict__.get('_cached_data')
+        return 0 if cached_data is None else cached_data.nbytes
+
+    def _clear_cache(self, writeable=False):
+        """
+        Discard the cached data of the inactive domain.
+
+        The data of the current domain is copied to make it writeable if
+        `writeable` is ``True`` and a cache existed.
+        """
+        if self.__dict__.pop('_cached_data', None) is not None and writeable:
+            self._data = self._data.copy()
+
+    def __getstate__(self):
+        """Exclude the cached domain from copies and pickles."""
+        state = self.__dict__.copy()
+        state.pop('_cached_data', None)
+        return state
+
     @property
     def sampling_rate(self):
         """The sampling rate of the signal."""
@@ -978,6 +1164,8 @@ class Signal(FrequencyData, TimeData):
 
     @complex.setter
     def complex(self, value):
+        if self._complex != value:
+            self._clear_cache()
         # from complex=True to complex=False
         if self._complex and not value:
             if self._domain == 'time':
@@ -1056,6 +1244,21 @@ class Signal(FrequencyData, TimeData):
                               "not valid for complex time signals"))
         self._fft_norm = value
 
+    def __setitem__(self, key, value):
+        """
+        Set channels of audio object at key.
+
+        Examples
+        --------
+        Set the first channel of a multi channel audio object
+
+        >>> import pyfar as pf
+        >>> signal = pf.signals.noise(10, rms=[1, 1])
+        >>> signal[0] = pf.signals.noise(10, rms=2)
+        """
+        self._clear_cache(writeable=True)
+        super().__setitem__(key, value)
+
     def _assert_matching_meta_data(self, other):
         """Check if the meta data matches across two Signal objects."""
         if not isinstance(other, Signal):
@@ -1072,7 +1275,7 @@ class Signal(FrequencyData, TimeData):
         item = Signal(data, sampling_rate=self.sampling_rate,
                       n_samples=self.n_samples, domain=self.domain,
                       fft_norm=self.fft_norm, comment=self.comment,
-                      is_complex=self.complex)
+                      is_complex=self.complex, dtype=self.dtype)
         return item
 
     def _encode(self):
@@ -1085,10 +1288,14 @@ class Signal(FrequencyData, TimeData):
     @classmethod
     def _decode(cls, obj_dict):
         """Decode object based on its respective `_encode` counterpart."""
+        # The data are replaced by obj_dict['_data'] below. Initializing with
+        # the first sample avoids checking all values, which would read all
+        # data of memory mapped arrays (see pyfar.io.read).
         obj = cls(
-            obj_dict['_data'],
+            obj_dict['_data'][..., :1],
             obj_dict['_sampling_rate'],
-            obj_dict['_n_samples'])
+            obj_dict['_n_samples'],
+            dtype=_infer_dtype(obj_dict['_data']))
         obj.__dict__.update(obj_dict)
         return obj
 
@@ -1153,7 +1360,8 @@ class _SignalIterator(object):
             n_samples=signal.n_samples,
             domain=signal.domain,
             fft_norm=signal.fft_norm,
-            is_complex=signal.complex)
+            is_complex=signal.complex,
+            dtype=signal.dtype)
 
     def __next__(self):
         if self._signal.domain == self._iterated_sig.domain:
@@ -1165,7 +1373,7 @@ class _SignalIterator(object):
         return self._iterated_sig
 
 
-def add(data: tuple, domain='freq'):
+def add(data: tuple, domain='freq', out=None):
     """Add pyfar audio objects, array likes, and scalars.
 
     Pyfar audio objects are: :py:func:`Signal`, :py:func:`TimeData`, and
@@ -1185,13 +1393,20 @@ def add(data: tuple, domain='freq'):
         frequency domain. Frequency domain operations work on the raw
         spectrum (see :py:func:`pyfar.dsp.fft.normalization`). The default is
         ``'freq'``.
+    out : Signal, TimeData, FrequencyData, optional
+        Audio object to which the result is written in place. It must be of
+        the same type, channel shape, FFT normalization and complex flag as
+        the result. The result is written to the existing memory of `out`.
+        For signals, it is computed in a temporary array to leave `out`
+        unchanged if the result contains inf or NaN values. The default is
+        ``None``, which returns the result as a new object.
 
     Returns
     -------
     results : Signal, TimeData, FrequencyData, numpy array
         Result of the operation as numpy array, if `data` contains only array
         likes and numbers. Result as pyfar audio object if `data` contains an
-        audio object.
+        audio object. This is `out` if `out` is given.
 
     Notes
     -----
@@ -1208,10 +1423,10 @@ def add(data: tuple, domain='freq'):
       same normalization.
     * Other combinations raise an error.
     """  # noqa: E501
-    return _arithmetic(data, domain, _add)
+    return _arithmetic(data, domain, _add, out=out)
 
 
-def subtract(data: tuple, domain='freq'):
+def subtract(data: tuple, domain='freq', out=None):
     """Subtract pyfar audio objects, array likes, and scalars.
 
     Pyfar audio objects are: :py:func:`Signal`, :py:func:`TimeData`, and
@@ -1232,13 +1447,20 @@ def subtract(data: tuple, domain='freq'):
         frequency domain. Frequency domain operations work on the raw
         spectrum (See :py:func:`pyfar.dsp.fft.normalization`). The default is
         ``'freq'``.
+    out : Signal, TimeData, FrequencyData, optional
+        Audio object to which the result is written in place. It must be of
+        the same type, channel shape, FFT normalization and complex flag as
+        the result. The result is written to the existing memory of `out`.
+        For signals, it is computed in a temporary array to leave `out`
+        unchanged if the result contains inf or NaN values. The default is
+        ``None``, which returns the result as a new object.
 
     Returns
     -------
     results : Signal, TimeData, FrequencyData, numpy array
         Result of the operation as numpy array, if `data` contains only array
         likes and numbers. Result as pyfar audio object if `data` contains an
-        audio object.
+        audio object. This is `out` if `out` is given.
 
     Notes
     -----
@@ -1255,10 +1477,10 @@ def subtract(data: tuple, domain='freq'):
       same normalization.
     * Other combinations raise an error.
     """  # noqa: E501
-    return _arithmetic(data, domain, _subtract)
+    return _arithmetic(data, domain, _subtract, out=out)
 
 
-def multiply(data: tuple, domain='freq'):
+def multiply(data: tuple, domain='freq', out=None):
     """Multiply pyfar audio objects, array likes, and scalars.
 
     Pyfar audio objects are: :py:func:`Signal`, :py:func:`TimeData`, and
@@ -1279,13 +1501,20 @@ def multiply(data: tuple, domain='freq'):
         frequency domain. Frequency domain operations work on the raw
         spectrum (See :py:func:`pyfar.dsp.fft.normalization`). The default is
         ``'freq'``.
+    out : Signal, TimeData, FrequencyData, optional
+        Audio object to which the result is written in place. It must be of
+        the same type, channel shape, FFT normalization and complex flag as
+        the result. The result is written to the existing memory of `out`.
+        For signals, it is computed in a temporary array to leave `out`
+        unchanged if the result contains inf or NaN values. The default is
+        ``None``, which returns the result as a new object.
 
     Returns
     -------
     results : Signal, TimeData, FrequencyData, numpy array
         Result of the operation as numpy array, if `data` contains only array
         likes and numbers. Result as pyfar audio object if `data` contains an
-        audio object.
+        audio object. This is `out` if `out` is given.
 
     Notes
     -----
@@ -1302,10 +1531,10 @@ def multiply(data: tuple, domain='freq'):
       same normalization.
     * Other combinations raise an error.
     """  # noqa: E501
-    return _arithmetic(data, domain, _multiply)
+    return _arithmetic(data, domain, _multiply, out=out)
 
 
-def divide(data: tuple, domain='freq'):
+def divide(data: tuple, domain='freq', out=None):
     """Divide pyfar audio objects, array likes, and scalars.
 
     Pyfar audio objects are: :py:func:`Signal`, :py:func:`TimeData`, and
@@ -1325,13 +1554,20 @@ def divide(data: tuple, domain='freq'):
         frequency domain. Frequency domain operations work on the raw
         spectrum (See :py:func:`pyfar.dsp.fft.normalization`). The default is
         ``'freq'``.
+    out : Signal, TimeData, FrequencyData, optional
+        Audio object to which the result is written in place. It must be of
+        the same type, channel shape, FFT normalization and complex flag as
+        the result. The result is written to the existing memory of `out`.
+        For signals, it is computed in a temporary array to leave `out`
+        unchanged if the result contains inf or NaN values. The default is
+        ``None``, which returns the result as a new object.
 
     Returns
     -------
     results : Signal, TimeData, FrequencyData, numpy array
         Result of the operation as numpy array, if `data` contains only array
         likes and numbers. Result as pyfar audio object if `data` contains an
-        audio object.
+        audio object. This is `out` if `out` is given.
 
     Notes
     -----
@@ -1348,10 +1584,10 @@ def divide(data: tuple, domain='freq'):
       normalization ``'none'``.
     * Other combinations raise an error.
     """  # noqa: E501
-    return _arithmetic(data, domain, _divide)
+    return _arithmetic(data, domain, _divide, out=out)
 
 
-def power(data: tuple, domain='freq'):
+def power(data: tuple, domain='freq', out=None):
     """Power of pyfar audio objects, array likes, and scalars.
 
     Pyfar audio objects are: :py:func:`Signal`, :py:func:`TimeData`, and
@@ -1371,13 +1607,20 @@ def power(data: tuple, domain='freq'):
         frequency domain. Frequency domain operations work on the raw
         spectrum (See :py:func:`pyfar.dsp.fft.normalization`). The default is
         ``'freq'``.
+    out : Signal, TimeData, FrequencyData, optional
+        Audio object to which the result is written in place. It must be of
+        the same type, channel shape, FFT normalization and complex flag as
+        the result. The result is written to the existing memory of `out`.
+        For signals, it is computed in a temporary array to leave `out`
+        unchanged if the result contains inf or NaN values. The default is
+        ``None``, which returns the result as a new object.
 
     Returns
     -------
     results : Signal, TimeData, FrequencyData, numpy array
         Result of the operation as numpy array, if `data` contains only array
         likes and numbers. Result as pyfar audio object if `data` contains an
-        audio object.
+        audio object. This is `out` if `out` is given.
 
     Notes
     -----
@@ -1394,7 +1637,7 @@ def power(data: tuple, domain='freq'):
       same normalization.
     * Other combinations raise an error.
     """  # noqa: E501
-    return _arithmetic(data, domain, _power)
+    return _arithmetic(data, domain, _power, out=out)
 
 
 def matrix_multiplication(
@@ -1565,8 +1808,16 @@ def matrix_multiplication(
     return _arithmetic(data, domain, _matrix_multiplication, axes=axes)
 
 
-def _arithmetic(data: tuple, domain: str, operation: Callable, **kwargs):
-    """Apply arithmetic operations."""
+def _arithmetic(data: tuple, domain: str, operation: Callable, out=None,
+                inplace=False, **kwargs):
+    """
+    Apply arithmetic operations.
+
+    The result is written to the audio object `out` if it is not ``None``. If
+    `inplace` is ``True``, a new object is returned instead of raising an
+    error if the result can not be written to `out`, which is required for
+    in-place operators such as ``+=``.
+    """
     #NOTE: The import is done here to avoid a circular import
     from pyfar.classes.transmission_matrix import TransmissionMatrix
 
@@ -1577,37 +1828,186 @@ def _arithmetic(data: tuple, domain: str, operation: Callable, **kwargs):
         cshape, contains_complex = _assert_match_for_arithmetic(
             data, domain, division, matmul)
 
+    # make sure that the data of out is in the correct domain before getting
+    # the data of all operands, which might include out
+    if out is not None and type(out) is audio_type and \
+            isinstance(out, Signal):
+        out.domain = domain
+
+    # get data of all operands without copying or changing them
+    operands = [_get_arithmetic_data(
+        d, domain, cshape, matmul, audio_type, contains_complex)
+        for d in data]
+
+    # the result has single precision if all audio objects have single
+    # precision. Other operands are cast to avoid promotion to double
+    # precision, e.g., by Python scalars that are converted to numpy arrays
+    dtypes = [d.dtype for d in data if isinstance(d, _Audio)]
+    dtype = np.result_type(*dtypes) if dtypes else None
+    if dtype == np.float32:
+        operands = [
+            operand if isinstance(d, _Audio) else
+            _cast(operand, dtype, operand.dtype.kind == "c", copy=False)
+            for d, operand in zip(data, operands)]
+
+    if out is not None:
+        try:
+            _assert_match_for_out(
+                out, audio_type, fft_norm, contains_complex, operands)
+        except ValueError:
+            if not inplace:
+                raise
+            out = None
+
+    if matmul:
+        kwargs['audio_type'] = audio_type
+
+    # The values of signals are checked when they are set. Element-wise
+    # operations on numeric values thus give numeric results unless a
+    # floating point error occurs. In this case, the values of the result
+    # need not be checked again
+    trusted = audio_type is Signal \
+        and operation in (_add, _subtract, _multiply, _divide, _power) \
+        and all(isinstance(d, Signal) or np.all(np.isfinite(operand))
+                for d, operand in zip(data, operands))
+
+    if out is not None:
+        # apply arithmetic operation in place. A new array is required if the
+        # data of out is read-only, e.g., due to a cached domain of a Signal,
+        # if out is read by an operand after being written, or if the values
+        # of a Signal must be checked before out is changed
+        in_place = out._data.flags.writeable \
+            and not isinstance(out, Signal) \
+            and not any(np.shares_memory(out._data, operand)
+                        for operand in operands[1:])
+        result = out._data if in_place else np.empty_like(out._data)
+        result, trusted = _apply_operation(
+            operation, operands, trusted, result)
+        if isinstance(out, Signal):
+            if not trusted:
+                out._check_input_values_are_numeric(result)
+            out._clear_cache()
+        if not in_place and out._data.flags.writeable:
+            # keep the memory of out, which might be referenced elsewhere
+            np.copyto(out._data, result)
+        else:
+            out._data = result
+        return out
+
     # apply arithmetic operation
-    result = _get_arithmetic_data(
-        data[0], domain, cshape, matmul, audio_type, contains_complex)
-
-    for d in range(1, len(data)):
-        if matmul:
-            kwargs['audio_type'] = audio_type
-        result = operation(
-            result,
-            _get_arithmetic_data(data[d], domain, cshape, matmul, audio_type,
-                                 contains_complex),
-            **kwargs)
+    result, trusted = _apply_operation(
+        operation, operands, trusted, **kwargs)
 
     # check if to return an audio object
     if audio_type == Signal:
-        # Set unnormalized spectrum
-        result = Signal(
+        # Set unnormalized spectrum without checking the values again if they
+        # are known to be numeric
+        signal = Signal.__new__(Signal)
+        signal._trusted_values = trusted
+        signal.__init__(
             result, sampling_rate, n_samples, domain, fft_norm='none',
-            is_complex=contains_complex)
+            is_complex=contains_complex, dtype=dtype)
+        del signal._trusted_values
+        result = signal
         # Set fft norm
         result.fft_norm = fft_norm
     elif audio_type == TimeData:
-        result = TimeData(result, times, is_complex=contains_complex)
+        result = TimeData(
+            result, times, is_complex=contains_complex, dtype=dtype)
     elif audio_type == FrequencyData:
-        result = FrequencyData(result, frequencies)
+        result = FrequencyData(result, frequencies, dtype=dtype)
     elif audio_type == TransmissionMatrix:
         result = TransmissionMatrix(result, frequencies)
 
     return result
 
 
+def _apply_operation(operation, operands, trusted, out=None, **kwargs):
+    """
+    Apply an arithmetic operation to all operands.
+
+    The result is written to the array `out` if it is not ``None``. If
+    `trusted` is ``True``, the operation raises floating point errors, i.e.,
+    overflows, divisions by zero, and invalid values. If an error occurs, the
+    operation is applied again without raising it and `trusted` is set to
+    ``False``. This way, the values of the result only need to be checked for
+    non-numeric values if `trusted` is ``False``.
+
+    Returns
+    -------
+    result : numpy array
+        The result of the operation.
+    trusted : bool
+        ``True`` if the result is known to contain only numeric values.
+    """
+    if trusted:
+        try:
+            with np.errstate(over='raise', divide='raise', invalid='raise'):
+                return _apply_operation(
+                    operation, operands, False, out, **kwargs)[0], True
+        except FloatingPointError:
+            pass
+
+    if out is None:
+        result = operands[0]
+        for operand in operands[1:]:
+            result = operation(result, operand, **kwargs)
+        if len(operands) == 1:
+            # the data is not a copy if only one operand is given
+            result = result.copy()
+    elif len(operands) == 1:
+        np.copyto(out, operands[0])
+        result = out
+    else:
+        result = operation(operands[0], operands[1], out=out)
+        for operand in operands[2:]:
+            result = operation(result, operand, out=result)
+    return result, False
+
+
+def _assert_match_for_out(out, audio_type, fft_norm, contains_complex,
+                          operands):
+    """
+    Check if the result of an arithmetic operation can be written to `out`.
+
+    Parameters
+    ----------
+    out : Signal, TimeData, FrequencyData
+        The audio object to which the result is written.
+    audio_type : type
+        Type of the audio class of the operation's result.
+    fft_norm : str, None
+        FFT normalization of the result.
+    contains_complex : bool
+        Flag which indicates if the operation involves complex-valued pyfar
+        audio objects.
+    operands : list of numpy arrays
+        The data of all operands as returned by `_get_arithmetic_data`.
+    """
+    if type(out) is not audio_type:
+        raise ValueError(
+            "out must be of the same type as the audio objects in data.")
+    if isinstance(out, Signal) and out.fft_norm != fft_norm:
+        raise ValueError(
+            f"The FFT normalization of out is '{out.fft_norm}' but must be "
+            f"'{fft_norm}'.")
+    if isinstance(out, (Signal, TimeData)) and \
+            out.complex != contains_complex:
+        raise ValueError(
+            "out must be complex if and only if the data contains complex "
+            "audio objects.")
+    shape = np.broadcast_shapes(*[o.shape for o in operands])
+    if shape != out._data.shape:
+        raise ValueError(
+            f"The shape of the result is {shape} but the shape of the data "
+            f"in out is {out._data.shape}.")
+    if not np.can_cast(np.result_type(*operands), out._data.dtype,
+                       'same_kind'):
+        raise ValueError(
+            f"The result of type {np.result_type(*operands)} can not be "
+            f"written to out of type {out._data.dtype}")
+
+
 def _assert_match_for_arithmetic(data: tuple, domain: str, division: bool,
                                  matmul: bool):
     """Check if type and meta data of input is fine for arithmetic operations.
@@ -1771,22 +2171,21 @@ def _get_arithmetic_data(data, domain, cshape, matmul, audio_type,
         Data in desired domain without any fft normalization if data is a
         Signal. `np.asarray(data)` otherwise.
     """
-    if isinstance(data, (Signal, TimeData, FrequencyData)):
-        data = data.copy()
-        # check if complex casting of any input signal is necessary
-        if type(data) is not FrequencyData:
-            data.complex = contains_complex
-        # get signal in correct domain
-        if domain == "time":
-            data_out = data.time
-        elif domain == "freq":
-            if type(data) is Signal:
-                data_out = data.freq_raw
-            else:
-                data_out = data.freq
-        else:
+    if isinstance(data, Signal):
+        data_out = _get_signal_data(data, domain, contains_complex)
+    elif isinstance(data, TimeData):
+        if domain != "time":
+            raise ValueError(
+                f"domain must be 'time' but found {domain}")
+        data_out = data.time
+        # check if complex casting is necessary
+        if contains_complex and not data.complex:
+            data_out = _cast(data_out, data.dtype, True)
+    elif isinstance(data, FrequencyData):
+        if domain != "freq":
             raise ValueError(
-                f"domain must be 'time' or 'freq' but found {domain}")
+                f"domain must be 'freq' but found {domain}")
+        data_out = data.freq
     else:
         data_out = np.asarray(data)
         if data_out.ndim <= len(cshape) or\
@@ -1800,24 +2199,79 @@ def _get_arithmetic_data(data, domain, cshape, matmul, audio_type,
     return data_out
 
 
-def _add(a, b):
-    return a + b
+def _get_signal_data(signal, domain, contains_complex):
+    """
+    Return the data of a Signal in a domain without fft normalization.
+
+    The data is neither copied nor is the Signal changed. This means that the
+    returned data must not be changed in place.
+
+    Parameters
+    ----------
+    signal : Signal
+        Input signal
+    domain : 'time', 'freq'
+        Domain in which the data is returned
+    contains_complex : bool
+        Flag which indicates if the data must be complex, i.e., if the
+        operation involves complex-valued pyfar audio objects
+
+    Returns
+    -------
+    data : numpy array
+        The time data or the unnormalized spectrum
+    """
+    if domain not in ["time", "freq"]:
+        raise ValueError(
+            f"domain must be 'time' or 'freq' but found {domain}")
+
+    is_complex = signal.complex or contains_complex
+    data = signal._data
+
+    # use the cached domain if possible
+    if signal.domain != domain and signal.complex == is_complex and \
+            signal.__dict__.get('_cached_data') is not None:
+        return signal._cached_data
+
+    # cast data to complex in the current domain (see Signal.complex)
+    if is_complex and not signal.complex:
+        if signal.domain == 'time':
+            data = _cast(data, signal.dtype, True)
+        else:
+            data = fft.add_mirror_spectrum(
+                data, not fft._is_odd(signal.n_samples))
+
+    # transform to desired domain (see Signal.domain)
+    if signal.domain == 'freq' and domain == 'time':
+        transform = fft.ifft if is_complex else fft.irfft
+        data = transform(
+            data, signal.n_samples, signal.sampling_rate, fft_norm='none')
+    elif signal.domain == 'time' and domain == 'freq':
+        transform = fft.fft if is_complex else fft.rfft
+        data = transform(
+            data, signal.n_samples, signal.sampling_rate, fft_norm='none')
 
+    return data
 
-def _subtract(a, b):
-    return a - b
 
+def _add(a, b, out=None):
+    return np.add(a, b, out=out)
 
-def _multiply(a, b):
-    return a * b
 
+def _subtract(a, b, out=None):
+    return np.subtract(a, b, out=out)
 
-def _divide(a, b):
-    return a / b
 
+def _multiply(a, b, out=None):
+    return np.multiply(a, b, out=out)
 
-def _power(a, b):
-    return a**b
+
+def _divide(a, b, out=None):
+    return np.divide(a, b, out=out)
+
+
+def _power(a, b, out=None):
+    return np.power(a, b, out=out)
 
 
 def _matrix_multiplication(a, b, axes, audio_type):
@@ -1911,3 +2365,53 @@ def _match_fft_norm(fft_norm_1, fft_norm_2, division=False):
                               f"they are {fft_norm_1} and {fft_norm_2}."))
 
     return fft_norm_result
+
+
+def _get_dtype(dtype, default_dtype, data):
+    """
+    Return the floating point precision of an audio object.
+
+    Parameters
+    ----------
+    dtype : str, numpy dtype, None
+        The precision passed to the audio object.
+    default_dtype : str, numpy dtype, None
+        The default precision of the audio class, which is used if `dtype` is
+        ``None``.
+    data : array like
+        The data of the audio object, which gives the precision if `dtype`
+        and `default_dtype` are ``None``.
+
+    Returns
+    -------
+    dtype : str
+        ``'float32'`` or ``'float64'``.
+    """
+    if dtype is None:
+        dtype = default_dtype
+    if dtype is None:
+        return _infer_dtype(data)
+
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        dtype = None
+    if dtype not in [np.float32, np.float64, np.complex64, np.complex128]:
+        raise ValueError(
+            "dtype must be 'float32', 'float64', 'complex64', 'complex128', "
+            "or None")
+    return np.finfo(dtype).dtype.name
+
+
+def _infer_dtype(data):
+    """Return ``'float32'`` for single precision data and ``'float64'``."""
+    if np.asarray(data).dtype in [np.float32, np.complex64]:
+        return 'float32'
+    return 'float64'
+
+
+def _cast(data, dtype, is_complex, copy=True):
+    """Cast `data` to the real or complex type of precision `dtype`."""
+    if is_complex:
+        dtype = np.result_type(dtype, np.complex64)
+    return data.astype(dtype, copy=copy)
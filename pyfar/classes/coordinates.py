@@ -123,6 +123,7 @@ from scipy.spatial import cKDTree
 from scipy.spatial.transform import Rotation as sp_rot
 import re
 from copy import deepcopy
+from itertools import chain
 import warnings
 from pyfar.classes.warnings import PyfarDeprecationWarning
 
@@ -233,6 +234,8 @@ class Coordinates():
     _sh_order: int = None
     _comment: str = None
     _system: dict = None
+    _kdtree: cKDTree = None
+    _converted: dict = None
 
     def __init__(
             self, points_1: np.array = np.asarray([]),
@@ -1152,8 +1155,7 @@ class Coordinates():
         see :ref:`coordinate_systems` and :ref:`coordinates` for
         more information.
         """
-        return np.atleast_2d(np.moveaxis(
-            np.array([self.x, self.y, self.z]), 0, -1))
+        return self._converted_points('cartesian').copy()
 
     @cartesian.setter
     def cartesian(self, value):
@@ -1168,10 +1170,7 @@ class Coordinates():
         see :ref:`coordinate_systems` and :ref:`coordinates` for
         more information.
         """
-        azimuth, elevation, radius = cart2sph(self.x, self.y, self.z)
-        elevation = np.pi / 2 - elevation
-        return np.atleast_2d(np.moveaxis(
-            np.array([azimuth, elevation, radius]), 0, -1))
+        return self._converted_points('spherical_elevation').copy()
 
     @spherical_elevation.setter
     def spherical_elevation(self, value):
@@ -1191,9 +1190,7 @@ class Coordinates():
         see :ref:`coordinate_systems` and :ref:`coordinates` for
         more information.
         """
-        azimuth, colatitude, radius = cart2sph(self.x, self.y, self.z)
-        return np.atleast_2d(np.moveaxis(
-            np.array([azimuth, colatitude, radius]), 0, -1))
+        return self._converted_points('spherical_colatitude').copy()
 
     @spherical_colatitude.setter
     def spherical_colatitude(self, value):
@@ -1210,11 +1207,7 @@ class Coordinates():
         see :ref:`coordinate_systems` and :ref:`coordinates` for
         more information.
         """
-        polar, lateral, radius = cart2sph(self.x, self.z, -self.y)
-        lateral = lateral - np.pi / 2
-        polar = np.mod(polar + np.pi / 2, 2 * np.pi) - np.pi / 2
-        return np.atleast_2d(np.moveaxis(
-            np.array([lateral, polar, radius]), 0, -1))
+        return self._converted_points('spherical_side').copy()
 
     @spherical_side.setter
     def spherical_side(self, value):
@@ -1232,10 +1225,7 @@ class Coordinates():
         see :ref:`coordinate_systems` and :ref:`coordinates` for
         more information.
         """
-
-        frontal, upper, radius = cart2sph(self.y, self.z, self.x)
-        return np.atleast_2d(np.moveaxis(
-            np.array([frontal, upper, radius]), 0, -1))
+        return self._converted_points('spherical_front').copy()
 
     @spherical_front.setter
     def spherical_front(self, value):
@@ -1252,9 +1242,7 @@ class Coordinates():
         see :ref:`coordinate_systems` and :ref:`coordinates` for
         more information.
         """
-        azimuth, z, rho = cart2cyl(self.x, self.y, self.z)
-        return np.atleast_2d(np.moveaxis(
-            np.array([azimuth, z, rho]), 0, -1))
+        return self._converted_points('cylindrical').copy()
 
     @cylindrical.setter
     def cylindrical(self, value):
@@ -1306,7 +1294,7 @@ class Coordinates():
         Radial distance to the the z-axis of the right handed Cartesian
         coordinate system (:math:`0` < rho < :math:`\infty`).
         """
-        return self.cylindrical[..., 2]
+        return self._converted_points('cylindrical')[..., 2].copy()
 
     @rho.setter
     def rho(self, rho):
@@ -1320,7 +1308,7 @@ class Coordinates():
         Distance to the origin of the right handed Cartesian coordinate system
         in meters (:math:`0` < radius < :math:`\infty`).
         """
-        return np.sqrt(self.x**2 + self.y**2 + self.z**2)
+        return self._converted_points('spherical_colatitude')[..., 2].copy()
 
     @radius.setter
     def radius(self, radius):
@@ -1336,7 +1324,7 @@ class Coordinates():
         x-direction, :math:`\pi/2` radians in positive y-direction and so on
         (:math:`-\infty` < azimuth < :math:`\infty`, :math:`2\pi`-cyclic).
         """
-        return self.spherical_colatitude[..., 0]
+        return self._converted_points('spherical_colatitude')[..., 0].copy()
 
     @azimuth.setter
     def azimuth(self, azimuth):
@@ -1354,7 +1342,7 @@ class Coordinates():
         (:math:`-\pi/2\leq` elevation :math:`\leq\pi/2`). The elevation is a
         variation of the colatitude.
         """
-        return self.spherical_elevation[..., 1]
+        return self._converted_points('spherical_elevation')[..., 1].copy()
 
     @elevation.setter
     def elevation(self, elevation):
@@ -1372,7 +1360,7 @@ class Coordinates():
         (:math:`0\leq` colatitude :math:`\leq\pi`). The colatitude is a
         variation of the elevation angle.
         """
-        return self.spherical_colatitude[..., 1]
+        return self._converted_points('spherical_colatitude')[..., 1].copy()
 
     @colatitude.setter
     def colatitude(self, colatitude):
@@ -1389,7 +1377,7 @@ class Coordinates():
         :math:`\pi` in negative y-direction and so on
         (:math:`-\infty` < frontal < :math:`\infty`, :math:`2\pi`-cyclic).
         """
-        return self.spherical_front[..., 0]
+        return self._converted_points('spherical_front')[..., 0].copy()
 
     @frontal.setter
     def frontal(self, frontal):
@@ -1406,7 +1394,7 @@ class Coordinates():
         :math:`\pi` in negative x-direction
         (:math:`0\leq` upper :math:`\leq\pi`).
         """
-        return self.spherical_front[..., 1]
+        return self._converted_points('spherical_front')[..., 1].copy()
 
     @upper.setter
     def upper(self, upper):
@@ -1423,7 +1411,7 @@ class Coordinates():
         :math:`-\pi/2` in negative y-direction
         (:math:`-\pi/2\leq` lateral :math:`\leq\pi/2`).
         """
-        return self.spherical_side[..., 0]
+        return self._converted_points('spherical_side')[..., 0].copy()
 
     @lateral.setter
     def lateral(self, lateral):
@@ -1440,7 +1428,7 @@ class Coordinates():
         :math:`\pi` in negative x-direction and so on
         (:math:`-\infty` < polar < :math:`\infty`, :math:`2\pi`-cyclic).
         """
-        return self.spherical_side[..., 1]
+        return self._converted_points('spherical_side')[..., 1].copy()
 
     @polar.setter
     def polar(self, polar):
@@ -1675,7 +1663,7 @@ class Coordinates():
 
         # check the input
         if radius_tol is None:
-            radius_tol = 2 * np.finfo(self.x.dtype).resolution
+            radius_tol = 2 * np.finfo(self._x.dtype).resolution
         if not isinstance(radius_tol, float) or radius_tol < 0:
             raise ValueError("radius_tol must be a non negative number.")
         if not isinstance(k, int) or k <= 0 or k > self.csize:
@@ -1730,14 +1718,7 @@ class Coordinates():
             else:
                 index = (index, )
         else:
-            index_array = np.arange(self.csize).reshape(self.cshape)
-            index_multi = []
-            for dim in range(self.cdim):
-                index_multi.append([])
-                for i in index.flatten():
-                    index_multi[dim].append(np.where(i == index_array)[dim][0])
-                index_multi[dim] = np.asarray(
-                    index_multi[dim]).reshape(index.shape)
+            index_multi = np.unravel_index(index, self.cshape)
             if k > 1:
                 index_multi = np.moveaxis(index_multi, -1, 0)
                 index = np.empty((k), dtype=tuple)
@@ -1753,7 +1734,8 @@ class Coordinates():
 
     def find_within(
             self, find, distance=0., distance_measure='euclidean',
-            atol=None, return_sorted=True, radius_tol=None):
+            atol=None, return_sorted=True, radius_tol=None,
+            return_csr=False):
         """
         Find coordinates within a certain distance to the query points.
 
@@ -1793,12 +1775,30 @@ class Coordinates():
             The default ``None`` uses a tolerance of two times the decimal
             resolution, which is determined from the data type of the
             coordinate points using :py:class:`numpy.finfo`.
+        return_csr : bool, optional
+            Return the indices in a compressed sparse row (CSR) like format
+            instead of a tuple per query point (see below). This is faster
+            and avoids Python objects if searching for many points. The
+            default is ``False``.
 
         Returns
         -------
         index : tuple of array
             Indices of the containing coordinates. Arrays of shape
-            (find.cshape).
+            (find.cshape). If `find` contains more than one point, this is
+            an array of shape (find.csize, ) that contains the tuple of
+            indices for each point. Only returned if `return_csr` is
+            ``False``.
+        offsets : numpy array of int
+            Array of shape (find.csize + 1, ). The indices of the coordinates
+            found for the `i`-th point in the flattened `find` object are
+            ``[idx[offsets[i]:offsets[i+1]] for idx in index]``. Only
+            returned if `return_csr` is ``True``.
+        index : tuple of array
+            Indices of the coordinates found for all points in `find`
+            concatenated in a tuple of `self.cdim` arrays. The tuple can
+            directly be used to index the Coordinates object. Only returned
+            if `return_csr` is ``True``.
 
         Notes
         -----
@@ -1826,13 +1826,24 @@ class Coordinates():
             >>> find = pf.Coordinates([2, 3], 0, 0)
             >>> index = coords.find_within(find, 1)
             >>> coords.show(index[0])
+
+        Find all points with 1m distance from many points and get the
+        indices in the CSR-like format
+
+        .. plot::
+
+            >>> import pyfar as pf
+            >>> coords = pf.Coordinates(np.arange(6), 0, 0)
+            >>> find = pf.Coordinates([2, 3, 4], 0, 0)
+            >>> offsets, index = coords.find_within(find, 1, return_csr=True)
+            >>> coords.show(index[0][offsets[1]:offsets[2]])
         """
 
         # check the input
         if radius_tol is None:
-            radius_tol = 2 * np.finfo(self.x.dtype).resolution
+            radius_tol = 2 * np.finfo(self._x.dtype).resolution
         if atol is None:
-            atol = 2 * np.finfo(self.x.dtype).resolution
+            atol = 2 * np.finfo(self._x.dtype).resolution
         if float(distance) < 0:
             raise ValueError("distance must be a non negative number.")
         if not isinstance(atol, float) or atol < 0:
@@ -1843,6 +1854,8 @@ class Coordinates():
             raise ValueError("coords must be an pf.Coordinates object.")
         if not isinstance(return_sorted, bool):
             raise ValueError("return_sorted must be a bool.")
+        if not isinstance(return_csr, bool):
+            raise ValueError("return_csr must be a bool.")
         allowed_measures = [
             'euclidean', 'spherical_radians', 'spherical_meter']
         if distance_measure not in allowed_measures:
@@ -1885,33 +1898,37 @@ class Coordinates():
             index = kdtree.query_ball_point(
                 points, distance + atol, return_sorted=return_sorted)
 
+        if return_csr:
+            # concatenate the flat indices of all query points
+            index = [index] if find.csize == 1 else index.ravel()
+            counts = np.fromiter(map(len, index), dtype=int, count=len(index))
+            offsets = np.zeros(len(index) + 1, dtype=int)
+            np.cumsum(counts, out=offsets[1:])
+            index = np.fromiter(
+                chain.from_iterable(index), dtype=int, count=offsets[-1])
+            return offsets, np.unravel_index(index, self.cshape)
+
         if self.cdim == 1:
             if find.csize > 1:
+                index = index.ravel()
                 for i in range(len(index)):
                     index[i] = (index[i], )
             else:
                 index = (index, )
 
         else:
-            index_array = np.arange(self.csize).reshape(self.cshape)
-            index_new = np.empty((find.csize), dtype=tuple)
-            for i in range(find.csize):
-                index_multi = []
-                if find.csize > 1:
-                    for j in index[i]:
-                        index_multi.append(np.where(j == index_array))
-                else:
-                    for j in index:
-                        index_multi.append(np.where(j == index_array))
-
-                index_multi = np.moveaxis(np.squeeze(
-                    np.asarray(index_multi)), -1, 0)
-                if find.csize > 1:
-                    index_new[i] = tuple(index_multi)
-                else:
-                    index_new = tuple(index_multi)
-
-            index = index_new
+            def unravel(flat_index):
+                # multi-dimensional indices, scalars if only one was found
+                return tuple(np.squeeze(idx) for idx in np.unravel_index(
+                    np.asarray(flat_index, dtype=int), self.cshape))
+
+            if find.csize > 1:
+                index_new = np.empty((find.csize), dtype=tuple)
+                for i, flat_index in enumerate(index.ravel()):
+                    index_new[i] = unravel(flat_index)
+                index = index_new
+            else:
+                index = unravel(index)
 
         return index
 
@@ -2381,6 +2398,13 @@ class Coordinates():
         """Return a deep copy of the Coordinates object."""
         return deepcopy(self)
 
+    def __getstate__(self):
+        """Exclude cached data from copies and pickles."""
+        state = self.__dict__.copy()
+        state.pop('_kdtree', None)
+        state.pop('_converted', None)
+        return state
+
     def _encode(self):
         """Return dictionary for the encoding."""
         return self.copy().__dict__
@@ -2390,6 +2414,7 @@ class Coordinates():
         """Decode object based on its respective ``_encode`` counterpart."""
         obj = cls()
         obj.__dict__.update(obj_dict)
+        obj._clear_cache()
         return obj
 
     @staticmethod
@@ -2731,6 +2756,66 @@ class Coordinates():
         self._y = y
         self._z = z
 
+        # data derived from the points is not valid anymore
+        self._clear_cache()
+
+    def _clear_cache(self):
+        """Discard data that is derived from and cached for the points."""
+        self._kdtree = None
+        self._converted = {}
+
+    def _converted_points(self, system):
+        """
+        Return the points in the coordinate system `system`.
+
+        The converted points are cached until the points change and returned
+        as read-only arrays. Public properties must return copies.
+
+        Parameters
+        ----------
+        system : str
+            ``'cartesian'``, ``'spherical_elevation'``,
+            ``'spherical_colatitude'``, ``'spherical_side'``,
+            ``'spherical_front'``, or ``'cylindrical'``.
+
+        Returns
+        -------
+        points : numpy array
+            The points of shape ``cshape + (3, )``.
+        """
+        if self._converted is None:
+            self._converted = {}
+        if system in self._converted:
+            return self._converted[system]
+
+        self._check_empty()
+        x, y, z = self._x, self._y, self._z
+        if system == 'cartesian':
+            points = [x, y, z]
+        elif system == 'spherical_elevation':
+            azimuth, elevation, radius = cart2sph(x, y, z)
+            elevation = np.pi / 2 - elevation
+            points = [azimuth, elevation, radius]
+        elif system == 'spherical_colatitude':
+            points = cart2sph(x, y, z)
+        elif system == 'spherical_side':
+            polar, lateral, radius = cart2sph(x, z, -y)
+            lateral = lateral - np.pi / 2
+            polar = np.mod(polar + np.pi / 2, 2 * np.pi) - np.pi / 2
+            points = [lateral, polar, radius]
+        elif system == 'spherical_front':
+            frontal, upper, radius = cart2sph(y, z, x)
+            points = [frontal, upper, radius]
+        elif system == 'cylindrical':
+            points = cart2cyl(x, y, z)
+        else:
+            raise ValueError(f"Coordinate system {system} is not cached.")
+
+        points = np.atleast_2d(np.moveaxis(np.array(points), 0, -1))
+        points.setflags(write=False)
+        self._converted[system] = points
+        return points
+
     def _set_weights(self, weights):
         """
         Check and set sampling weights.
@@ -2811,12 +2896,17 @@ class Coordinates():
         return distance, index, mask
 
     def _make_kdtree(self):
-        """Make a numpy KDTree for fast search of nearest points."""
+        """
+        Make a numpy KDTree for fast search of nearest points.
+
+        The tree is cached until the points change.
+        """
 
-        xyz = self.cartesian
-        kdtree = cKDTree(xyz.reshape((self.csize, 3)))
+        if self._kdtree is None:
+            xyz = self.cartesian
+            self._kdtree = cKDTree(xyz.reshape((self.csize, 3)))
 
-        return kdtree
+        return self._kdtree
 
     def __getitem__(self, index):
         """Return copied slice of Coordinates object at index."""
@@ -2826,6 +2916,7 @@ class Coordinates():
         new._x = np.atleast_1d(new._x[index])
         new._y = np.atleast_1d(new._y[index])
         new._z = np.atleast_1d(new._z[index])
+        new._clear_cache()
         # slice weights
         if new._weights is not None:
             new._weights = new._weights[index]
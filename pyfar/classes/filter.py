@@ -6,15 +6,31 @@ Available filters are shown in the
 :doc:`filter types examples<gallery:gallery/interactive/pyfar_filter_types>`
 and documented in :py:mod:`pyfar.dsp.filter`.
 """
-import deepdiff
+import multiprocessing
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
-import scipy.signal as spsignal
 
 import pyfar as pf
 from copy import deepcopy
 
+# minimum number of samples that are filtered (number of filter channels
+# times size of the input data) for processing filter channels in threads
+_PARALLEL_MIN_SAMPLES = 2**16
+
+# thread pool that is shared by all filters (see _get_executor)
+_executor = None
+
+
+def _get_executor():
+    """Return a thread pool for filtering that is created only once."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=multiprocessing.cpu_count())
+    return _executor
+
 
 def _atleast_3d_first_dim(arr):
     arr = np.asarray(arr)
@@ -40,6 +56,16 @@ def _atleast_4d_first_dim(arr):
         return arr
 
 
+def _use_fft(n_taps, n_samples):
+    """
+    Check if FIR filtering is faster by fast convolution than by lfilter.
+
+    The thresholds are based on benchmarks of scipy.signal.lfilter and
+    scipy.signal.oaconvolve.
+    """
+    return n_taps >= 512 and n_taps * n_samples >= 2**20
+
+
 def _pop_state_from_kwargs(**kwargs):
     kwargs.pop('zi', None)
     warnings.warn(
@@ -220,9 +246,12 @@ class Filter(object):
     def _process(coefficients, data, zi=None):
         raise NotImplementedError("Abstract class method.")
 
-    def process(self, signal, reset=False):
+    def process(self, signal, reset=False, out=None):
         """Apply the filter to a signal.
 
+        Filters with multiple channels, e.g., filter banks, process their
+        channels in parallel using one thread per CPU core.
+
         Parameters
         ----------
         signal : Signal
@@ -233,6 +262,12 @@ class Filter(object):
             is ``None``, this option will have no effect. Use ``init_state``
             to initialize a filter with no previously set state. The default
             is ``'False'``.
+        out : numpy array, optional
+            Pre-allocated array of shape ``(n_channels, *signal.cshape,
+            signal.n_samples)``, or ``signal.time.shape`` if the filter has a
+            single channel, and of the same dtype as ``signal.time``. The
+            filtered data are written to `out` and the returned signal uses
+            its memory. The default is ``None``, which allocates a new array.
 
         Returns
         -------
@@ -251,32 +286,167 @@ class Filter(object):
 
         # shape of the output signal. if n_channels is 1, it will be squeezed
         # below
-        filtered_signal_data = np.zeros(
-            (self.n_channels, *signal.time.shape),
-            dtype=signal.time.dtype)
-
-        if self.state is not None:
-            new_state = np.zeros_like(self._state)
-            for idx, (coeff, state) in enumerate(
-                    zip(self._coefficients, self._state)):
-                filtered_signal_data[idx, ...], new_state[idx, ...] = \
-                    self._process(coeff, signal.time, state)
-            self._state = new_state
+        shape = (self.n_channels, *signal.time.shape)
+        if out is None:
+            filtered_signal_data = np.empty(shape, dtype=signal.time.dtype)
         else:
-            for idx, coeff in enumerate(self._coefficients):
-                filtered_signal_data[idx, ...] = self._process(
-                    coeff, signal.time, zi=None)
-
-        # prepare output signal
-        filtered_signal = deepcopy(signal)
+            filtered_signal_data = out
+            if self.n_channels == 1 and out.shape == signal.time.shape:
+                filtered_signal_data = out[np.newaxis]
+            if filtered_signal_data.shape != shape:
+                raise ValueError(
+                    f"out must be of shape {shape} but is of shape "
+                    f"{out.shape}")
+            if out.dtype != signal.time.dtype:
+                raise ValueError(
+                    f"out must be of dtype {signal.time.dtype} but is of "
+                    f"dtype {out.dtype}")
+        self._process_data(signal.time, filtered_signal_data)
 
         # squeeze first dimension if there is only one filter channel
         if self.n_channels == 1:
-            filtered_signal.time = np.squeeze(filtered_signal_data, axis=0)
+            filtered_signal_data = filtered_signal_data[0]
+
+        # prepare output signal without copying the input data
+        return pf.Signal(
+            filtered_signal_data, signal.sampling_rate,
+            fft_norm=signal.fft_norm, comment=signal.comment,
+            is_complex=signal.complex, dtype=signal.dtype)
+
+    def process_blocks(self, blocks, reset=False, out=None):
+        """Apply the filter block-wise to a stream of signals or arrays.
+
+        The filter state is carried from one block to the next, i.e., the
+        concatenated output equals the output of :py:func:`process` applied
+        to the concatenated input. Because the blocks are processed one at a
+        time, only a single block needs to be kept in memory, which makes it
+        possible to filter recordings that are too long for :py:func:`process`.
+
+        Parameters
+        ----------
+        blocks : iterable
+            Iterable of :py:class:`~pyfar.Signal` objects or arrays of shape
+            ``(*cshape, n_samples)``. The channel shape ``cshape`` must be the
+            same for all blocks but the number of samples can differ.
+        reset : bool, optional
+            If set to ``True``, the filter state will be reset to zeros before
+            the first block is filtered. If the filter state is ``None``, it is
+            initialized with zeros using the channel shape of the first block.
+            The default is ``False``.
+        out : numpy array, optional
+            Buffer to which the filtered blocks are written. It must be of
+            shape ``(n_channels, *cshape, block_size)``, or
+            ``(*cshape, block_size)`` if the filter has a single channel, and
+            ``block_size`` must not be smaller than the number of samples of
+            any block. The dtype must match the dtype of the data of the
+            blocks. The yielded data are views into `out` and are
+            overwritten when the next block is processed. The default is
+            ``None``, which allocates new memory for each block.
+
+        Yields
+        ------
+        filtered : Signal, numpy array
+            The filtered block. A Signal is yielded if the block is a
+            Signal and a numpy array otherwise. The first dimension of the
+            filtered block is squeezed if the filter has a single channel.
+
+        Examples
+        --------
+        Filter a long noise signal in blocks of 4096 samples
+
+        >>> import pyfar as pf
+        >>> import numpy as np
+        >>> noise = pf.signals.noise(2**16, seed=1).time
+        >>> blocks = np.array_split(noise, 16, axis=-1)
+        >>> lowpass = pf.dsp.filter.butterworth(
+        ...     None, 4, 1000, 'lowpass', sampling_rate=44100)
+        >>> filtered = np.concatenate(
+        ...     list(lowpass.process_blocks(blocks)), axis=-1)
+        """
+        if reset is True:
+            self.reset()
+
+        for block in blocks:
+            if isinstance(block, pf.Signal):
+                if self.sampling_rate != block.sampling_rate:
+                    raise ValueError(
+                        "The sampling rates of filter and signal do not "
+                        "match")
+                data = block.time
+            else:
+                data = np.atleast_1d(np.asarray(block))
+                if data.dtype.kind in ["i", "u"]:
+                    data = data.astype(float)
+
+            if self.state is None:
+                self.init_state(data.shape[:-1], 'zeros')
+
+            if out is None:
+                filtered = np.zeros(
+                    (self.n_channels, *data.shape), dtype=data.dtype)
+            else:
+                if self.n_channels == 1 and out.ndim == data.ndim:
+                    out = out[np.newaxis]
+                if out.shape[1:-1] != data.shape[:-1] or \
+                        out.shape[0] != self.n_channels or \
+                        out.shape[-1] < data.shape[-1]:
+                    raise ValueError(
+                        "out must be of shape (n_channels, *cshape, "
+                        "block_size) with block_size not smaller than the "
+                        "number of samples in the block.")
+                if out.dtype != data.dtype:
+                    raise ValueError(
+                        f"out must be of dtype {data.dtype} but is of dtype "
+                        f"{out.dtype}")
+                filtered = out[..., :data.shape[-1]]
+            self._process_data(data, filtered)
+
+            # squeeze first dimension if there is only one filter channel
+            if self.n_channels == 1:
+                filtered = filtered[0]
+
+            if isinstance(block, pf.Signal):
+                yield pf.Signal(
+                    filtered, block.sampling_rate, fft_norm=block.fft_norm,
+                    comment=block.comment, is_complex=block.complex,
+                    dtype=block.dtype)
+            else:
+                yield filtered
+
+    def _process_data(self, data, out):
+        """
+        Filter `data` of shape ``(*cshape, n_samples)`` with all filter
+        channels, write the result to `out` of shape
+        ``(n_channels, *cshape, n_samples)`` and update the filter state.
+        """
+        new_state = None if self.state is None else \
+            np.zeros_like(self._state)
+
+        def process_channel(idx):
+            if new_state is not None:
+                out[idx, ...], new_state[idx, ...] = self._process(
+                    self._coefficients[idx], data, self._state[idx])
+            else:
+                out[idx, ...] = self._process(
+                    self._coefficients[idx], data, zi=None)
+
+        # scipy releases the GIL during filtering. Filter channels are thus
+        # processed in parallel threads that write to separate parts of out
+        # if this outweighs the overhead of the threads
+        parallel = min(self.n_channels, multiprocessing.cpu_count()) > 1 \
+            and self.n_channels * data.size >= _PARALLEL_MIN_SAMPLES
+        if parallel:
+            # consuming the results raises errors from the threads
+            list(_get_executor().map(
+                process_channel, range(self.n_channels)))
         else:
-            filtered_signal.time = filtered_signal_data
+            for idx in range(self.n_channels):
+                process_channel(idx)
+
+        if new_state is not None:
+            self._state = new_state
 
-        return filtered_signal
+        return out
 
     def reset(self):
         """Reset the filter state by filling it with zeros."""
@@ -316,6 +486,7 @@ class Filter(object):
 
     def __eq__(self, other):
         """Check for equality of two objects."""
+        import deepdiff
         return not deepdiff.DeepDiff(self, other)
 
 
@@ -345,6 +516,19 @@ class FilterFIR(Filter):
         The FIR filter object.
     """
 
+    #: Method for filtering with :py:func:`~Filter.process` and
+    #: :py:func:`~Filter.process_blocks`. ``'direct'`` filters in the time
+    #: domain using :py:func:`scipy.signal.lfilter`. ``'fft'`` uses fast
+    #: convolution in the frequency domain (overlap-add), which is much
+    #: faster for filters with many coefficients, e.g., linear-phase filter
+    #: banks. ``'auto'`` uses fast convolution for filters with at least 512
+    #: coefficients if the product of the number of coefficients and samples
+    #: is at least ``2**20`` and direct filtering otherwise. Both methods
+    #: give the same results except for numerical errors in the order of the
+    #: floating point precision and can be mixed in block-wise processing
+    #: because they share the filter state. The default is ``'auto'``.
+    processing_method = 'auto'
+
     def __init__(self, coefficients, sampling_rate, state=None, comment=""):
 
         if state is not None and np.asarray(state).ndim < 3:
@@ -442,6 +626,7 @@ class FilterFIR(Filter):
             an empty filter, or ``'step'`` which constructs the initial
             conditions for step response steady-state. The default is 'zeros'.
         """
+        import scipy.signal as spsignal
         self._check_state_keyword(state)
 
         new_state = np.zeros((self.n_channels, *cshape, self.order))
@@ -450,18 +635,125 @@ class FilterFIR(Filter):
                 new_state[idx, ...] = spsignal.lfilter_zi(coeff[0], coeff[1])
         super().init_state(state=new_state)
 
-    @staticmethod
-    def _process(coefficients, data, zi=None):
+    def _process(self, coefficients, data, zi=None):
         """Process a single filter channel.
-        This is a hidden static method required for a shared processing
-        function in the parent class.
+        This is a hidden method required for a shared processing function in
+        the parent class.
         """
+        import scipy.signal as spsignal
         if zi is not None and zi.shape[0:-1] != data.shape[0:-1]:
             raise ValueError("The initial state does not match the cshape of "
                              "the signal. Required shape for `state` in "
                              "FilterFIR is (n_channels, *cshape, order).")
 
-        return spsignal.lfilter(coefficients[0], 1, data, zi=zi)
+        b = coefficients[0]
+        if self.processing_method not in ['auto', 'direct', 'fft']:
+            raise ValueError(
+                f"processing_method is '{self.processing_method}' but must "
+                "be 'auto', 'direct', or 'fft'")
+        if self.processing_method == 'direct' or (
+                self.processing_method == 'auto'
+                and not _use_fft(b.size, data.shape[-1])):
+            return spsignal.lfilter(b, 1, data, zi=zi)
+
+        # fast convolution. The state holds the contributions of previous
+        # samples to the first `order` output samples (as in lfilter)
+        n_samples = data.shape[-1]
+        order = b.size - 1
+        full = spsignal.oaconvolve(
+            data, np.reshape(b, (1, ) * (data.ndim - 1) + (-1, )), axes=-1)
+        if zi is None:
+            return full[..., :n_samples]
+
+        full = full.astype(np.result_type(full, zi), copy=False)
+        overlap = min(order, n_samples)
+        full[..., :overlap] += zi[..., :overlap]
+        zf = full[..., n_samples:]
+        zf[..., :order - overlap] += zi[..., overlap:]
+
+        return full[..., :n_samples], zf
+
+    def process_partitioned(self, blocks, block_size, partition_sizes=None):
+        """
+        Apply the filter block-wise using partitioned convolution.
+
+        The filter coefficients are convolved with the blocks in the frequency
+        domain using a :py:class:`~pyfar.dsp.PartitionedConvolver`. This is
+        much faster than :py:func:`process_blocks` for filters with many
+        coefficients, e.g., room impulse responses. As for
+        :py:func:`process_blocks`, the concatenated output equals the output
+        of :py:func:`process` applied to the concatenated input, except for
+        numerical errors in the order of the floating point precision. The
+        filter state is neither used nor changed.
+
+        Parameters
+        ----------
+        blocks : iterable
+            Iterable of :py:class:`~pyfar.Signal` objects or arrays of shape
+            ``(*cshape, n_samples)``. The channel shape ``cshape`` must be the
+            same for all blocks and the number of samples must be a multiple
+            of `block_size`.
+        block_size : int
+            The number of samples that are convolved at once.
+        partition_sizes : list of int, optional
+            The sizes of the partitions of the filter coefficients in samples.
+            See :py:class:`~pyfar.dsp.PartitionedConvolver` for details. The
+            default is ``None``, which uses uniform partitions of size
+            `block_size`.
+
+        Yields
+        ------
+        filtered : Signal, numpy array
+            The filtered block. A Signal is yielded if the block is a
+            Signal and a numpy array otherwise. The first dimension of the
+            filtered block is squeezed if the filter has a single channel.
+
+        Examples
+        --------
+        Filter noise with a long FIR filter in blocks of 1024 samples
+
+        >>> import pyfar as pf
+        >>> import numpy as np
+        >>> noise = pf.signals.noise(2**16, seed=1).time
+        >>> blocks = np.split(noise, 64, axis=-1)
+        >>> fir = pf.FilterFIR(
+        ...     pf.signals.noise(2**14, seed=2).time, 44100)
+        >>> filtered = np.concatenate(
+        ...     list(fir.process_partitioned(blocks, 1024)), axis=-1)
+        """
+        coefficients = self.coefficients
+        convolver = None
+
+        for block in blocks:
+            if isinstance(block, pf.Signal):
+                if self.sampling_rate != block.sampling_rate:
+                    raise ValueError(
+                        "The sampling rates of filter and signal do not "
+                        "match")
+                data = block.time
+            else:
+                data = np.atleast_1d(np.asarray(block))
+
+            # filter channels are stacked in front of the channel shape of
+            # the input
+            if convolver is None:
+                convolver = pf.dsp.PartitionedConvolver(
+                    coefficients.reshape(
+                        self.n_channels, *[1] * (data.ndim - 1),
+                        coefficients.shape[-1]),
+                    block_size, partition_sizes)
+            filtered = convolver.process(data[np.newaxis])
+
+            # squeeze first dimension if there is only one filter channel
+            if self.n_channels == 1:
+                filtered = filtered[0]
+
+            if isinstance(block, pf.Signal):
+                yield pf.Signal(
+                    filtered, block.sampling_rate, fft_norm=block.fft_norm,
+                    comment=block.comment, dtype=block.dtype)
+            else:
+                yield filtered
 
     def __repr__(self):
         """Representation of the filter object."""
@@ -570,6 +862,7 @@ class FilterIIR(Filter):
             an empty filter, or ``'step'`` which constructs the initial
             conditions for step response steady-state. The default is 'zeros'.
         """
+        import scipy.signal as spsignal
         self._check_state_keyword(state)
 
         new_state = np.zeros((self.n_channels, *cshape, self.order))
@@ -584,6 +877,7 @@ class FilterIIR(Filter):
         This is a hidden static method required for a shared processing
         function in the parent class.
         """
+        import scipy.signal as spsignal
         if zi is not None and zi.shape[0:-1] != data.shape[0:-1]:
             raise ValueError("The initial state does not match the cshape of "
                              "the signal. Required shape for `state` in "
@@ -719,6 +1013,7 @@ class FilterSOS(Filter):
             an empty filter, or ``'step'`` which constructs the initial
             conditions for step response steady-state. The default is 'zeros'.
         """
+        import scipy.signal as spsignal
         self._check_state_keyword(state)
 
         new_state = np.zeros((self.n_channels, *cshape, self.n_sections, 2))
@@ -733,6 +1028,7 @@ class FilterSOS(Filter):
         This is a hidden static method required for a shared processing
         function in the parent class.
         """
+        import scipy.signal as spsignal
         if zi is not None and zi.shape[0:-2] != data.shape[0:-1]:
             raise ValueError("The initial state does not match the cshape of "
                              "the signal. Required shape for `state` in "
@@ -1,40 +1,59 @@
 """Digital signal processing functions."""
 
-from .dsp import (
-    minimum_phase,
-    phase,
-    group_delay,
-    wrap_to_2pi,
-    linear_phase,
-    zero_phase,
-    spectrogram,
-    regularized_spectrum_inversion,
-    pad_zeros,
-    time_shift,
-    time_window,
-    kaiser_window_beta,
-    find_impulse_response_delay,
-    find_impulse_response_start,
-    deconvolve,
-    convolve,
-    decibel,
-    soft_limit_spectrum,
-    energy,
-    power,
-    rms,
-    normalize,
-    average,
-)
+import importlib
 
-from .interpolation import (
-    smooth_fractional_octave,
-    fractional_time_shift,
-    resample,
-    InterpolateSpectrum,
-)
+# The functions and sub-modules are imported on first access to keep
+# `import pyfar` fast. `pyfar.dsp.fft` is used by the audio classes and is
+# imported without the heavier parts of scipy.signal.
+_lazy_attributes = {
+    'minimum_phase': 'dsp',
+    'phase': 'dsp',
+    'group_delay': 'dsp',
+    'wrap_to_2pi': 'dsp',
+    'linear_phase': 'dsp',
+    'zero_phase': 'dsp',
+    'spectrogram': 'dsp',
+    'regularized_spectrum_inversion': 'dsp',
+    'pad_zeros': 'dsp',
+    'time_shift': 'dsp',
+    'time_window': 'dsp',
+    'kaiser_window_beta': 'dsp',
+    'find_impulse_response_delay': 'dsp',
+    'find_impulse_response_start': 'dsp',
+    'deconvolve': 'dsp',
+    'convolve': 'dsp',
+    'PartitionedConvolver': 'dsp',
+    'decibel': 'dsp',
+    'soft_limit_spectrum': 'dsp',
+    'energy': 'dsp',
+    'power': 'dsp',
+    'rms': 'dsp',
+    'normalize': 'dsp',
+    'average': 'dsp',
+    'smooth_fractional_octave': 'interpolation',
+    'fractional_time_shift': 'interpolation',
+    'resample': 'interpolation',
+    'Resampler': 'interpolation',
+    'InterpolateSpectrum': 'interpolation',
+}
+_lazy_submodules = ['filter', 'fft', 'dsp', 'interpolation']
 
-from . import filter
-from . import fft
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        return importlib.import_module(f'.{name}', __name__)
+    if name in _lazy_attributes:
+        module = importlib.import_module(
+            f'.{_lazy_attributes[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(
+        set(globals()) | set(_lazy_attributes) | set(_lazy_submodules))
 
 
 __all__ = [
@@ -56,6 +75,7 @@ __all__ = [
     'find_impulse_response_start',
     'deconvolve',
     'convolve',
+    'PartitionedConvolver',
     'decibel',
     'soft_limit_spectrum',
     'energy',
@@ -64,6 +84,7 @@ __all__ = [
     'InterpolateSpectrum',
     'smooth_fractional_octave',
     'resample',
+    'Resampler',
     'average',
     'normalize',
     'fractional_time_shift',
@@ -1,5 +1,6 @@
 """Digital signal processing functions."""
 import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from scipy import signal as sgn
 import pyfar
@@ -1192,31 +1193,79 @@ def time_shift(
         raise ValueError(("Can not shift by more samples than signal.n_samples"
                           " if mode is 'linear'"))
 
-    shifted = signal.copy()
-    for ch in np.ndindex(signal.cshape):
-        shifted.time[ch] = np.roll(
-            shifted.time[ch],
-            shift_samples[ch],
-            axis=-1)
-
-        if mode == 'linear':
-            if shift_samples[ch] > 0:
-                samples = slice(0, shift_samples[ch])
-                shifted.time[ch + (samples, )] = pad_value
-            elif shift_samples[ch] < 0:
-                samples = slice(shifted.n_samples + shift_samples[ch],
-                                shifted.n_samples)
-                shifted.time[ch + (samples, )] = pad_value
+    # shift all channels at once and prepare the output without copying the
+    # input data
+    data = _shift_data(signal.time, shift_samples, mode, pad_value)
 
-    if np.any(np.isnan(shifted.time)):
+    if np.any(np.isnan(data)) or not isinstance(signal, pyfar.Signal):
         shifted = pyfar.TimeData(
-            shifted.time, shifted.times, comment=shifted.comment,
-            is_complex=signal.complex)
+            data, signal.times, comment=signal.comment,
+            is_complex=signal.complex, dtype=signal.dtype)
+    else:
+        shifted = pyfar.Signal(
+            data, signal.sampling_rate, fft_norm=signal.fft_norm,
+            comment=signal.comment, is_complex=signal.complex,
+            dtype=signal.dtype)
+
+    return shifted
+
+
+def _shift_data(data, shift, mode, pad_value=0.):
+    """
+    Shift data by integer numbers of samples along the last axis.
+
+    Parameters
+    ----------
+    data : numpy array
+        The data of shape ``(*cshape, n_samples)``.
+    shift : int, numpy array
+        The shift in samples. Must be broadcastable to ``cshape``.
+    mode : str
+        ``'linear'`` or ``'cyclic'`` (see :py:func:`time_shift`)
+    pad_value : number
+        The pad value for linear shifts.
+
+    Returns
+    -------
+    shifted : numpy array
+        The shifted data of the same shape as `data`.
+    """
+    n_samples = data.shape[-1]
+    shift = np.broadcast_to(shift, data.shape[:-1])
+
+    if shift.size and np.all(shift == shift.flat[0]):
+        # same shift for all channels
+        shift = int(shift.flat[0])
+        shifted = np.roll(data, shift, axis=-1)
+        if mode == 'linear' and shift > 0:
+            shifted[..., :shift] = pad_value
+        elif mode == 'linear' and shift < 0:
+            shifted[..., n_samples + shift:] = pad_value
+    else:
+        # pad the data and gather one contiguous window per channel. The
+        # window of channel c starts at sample start[c] of the padded data
+        flat = data.reshape(-1, n_samples)
+        shift = shift.reshape(-1)
+        if mode == 'cyclic':
+            # equivalent shifts between -n_samples/2 and n_samples/2
+            shift = (shift + n_samples // 2) % n_samples - n_samples // 2
+            width = np.max(np.abs(shift))
+            padded = np.concatenate(
+                (flat[:, n_samples - width:], flat, flat[:, :width]), axis=-1)
+        else:
+            width = np.max(np.abs(shift))
+            pad = np.full((flat.shape[0], width), pad_value,
+                          dtype=np.result_type(flat, pad_value))
+            padded = np.concatenate((pad, flat, pad), axis=-1)
+        start = width - shift
+        windows = np.lib.stride_tricks.sliding_window_view(
+            padded, n_samples, axis=-1)
+        shifted = windows[np.arange(flat.shape[0]), start].reshape(data.shape)
 
     return shifted
 
 
-def find_impulse_response_delay(impulse_response, N=1):
+def find_impulse_response_delay(impulse_response, N=1, processes=None):
     """Find the delay in sub-sample values of an impulse response.
 
     The method relies on the analytic part of the cross-correlation function
@@ -1240,6 +1289,14 @@ def find_impulse_response_delay(impulse_response, N=1):
         The impulse response.
     N : int, optional
         The order of the polynom used for root finding, by default 1.
+    processes : int, optional
+        Number of processes used for the polynomial root finding. The
+        minimum-phase equivalents, correlations and analytic signals are
+        computed for all channels at once and the roots of first order
+        polynomials are obtained in closed form. Only for ``N > 1`` the roots
+        are found separately for each channel, which can be distributed
+        across `processes` processes for large numbers of channels. The
+        default ``None`` finds all roots in the calling process.
 
     Returns
     -------
@@ -1277,80 +1334,197 @@ def find_impulse_response_delay(impulse_response, N=1):
 
     """
     n = int(np.ceil((N+2)/2))
+    n_samples = impulse_response.n_samples
+    cshape = impulse_response.cshape
 
-    start_samples = np.zeros(impulse_response.cshape)
-    modes = ['real', 'complex'] if impulse_response.complex else ['real']
-    start_sample = np.zeros((len(modes), 1), dtype=float)
+    # stack the real and imaginary parts along a leading axis and process all
+    # channels at once
+    time = impulse_response.time.reshape(-1, n_samples)
+    irs = [np.real(time), np.imag(time)] if impulse_response.complex \
+        else [np.real(time)]
+    irs = np.concatenate(irs, axis=0)
+
+    # check absolute maximum, because peaks can be positive or negative.
+    valid = np.max(np.abs(irs), axis=-1) > 1e-16
+    start_samples = np.full(irs.shape[0], np.nan)
+
+    if np.any(valid):
+        ir = irs[valid]
 
-    for ch in np.ndindex(impulse_response.cshape):
         # Calculate the correlation between the impulse response and its
         # minimum phase equivalent. This requires a minimum phase equivalent
         # in the strict sense, instead of the appriximation implemented in
         # pyfar.
-        n_samples = impulse_response.n_samples
-        for idx, mode in enumerate(modes):
-            ir = impulse_response.time[ch]
-            ir = np.real(ir) if mode == 'real' else np.imag(ir)
-
-            #Check absolute amximum, because peaks can be positive or negative.
-            if np.max(np.abs(ir)) > 1e-16:
-                # minimum phase warns if the input signal is not symmetric,
-                # which is not critical for this application
-                with warnings.catch_warnings():
-                    warnings.filterwarnings(
-                        "ignore", message="h does not appear to by symmetric",
-                        category=RuntimeWarning)
-                    ir_minphase = sgn.minimum_phase(
-                        ir, n_fft=4*n_samples)
-
-                correlation = sgn.correlate(
-                    ir,
-                    np.pad(ir_minphase, (0, n_samples - (n_samples + 1)//2)),
-                    mode='full')
-                lags = np.arange(-n_samples + 1, n_samples)
-
-                # calculate the analytic signal of the correlation function
-                correlation_analytic = sgn.hilbert(correlation)
-
-                # find the maximum of the analytic part of the correlation
-                # function and define the search range around the maximum
-                argmax = np.argmax(np.abs(correlation_analytic))
-                search_region_range = np.arange(argmax-n, argmax+n)
-                search_region = np.imag(
-                    correlation_analytic[search_region_range])
-
-                # If this is true, it indicates that `correlation_analytic` has
-                # a negative peak, which can happen if the absolute maximum of
-                # `impulse_response` is negative. Changing the sign of the
-                # search region makes sure that the `mask` generated below
-                # works as intended. Fixing it this way is safer because it is
-                # theoretically possible that the absolute maximum of
-                # `impulse_response` is negative but
-                # `correlation_analytic[argmax].real` is positive.
-                search_region *= np.sign(correlation_analytic[argmax].real)
-
-                # mask values with a negative gradient
-                mask = np.gradient(search_region, search_region_range) > 0
-
-                # fit a polygon and estimate its roots
-                search_region_poly = np.polyfit(
-                    search_region_range[mask]-argmax, search_region[mask], N)
-                roots = np.roots(search_region_poly)
-
-                # Use only real-valued roots
-                if np.all(np.isreal(roots)):
-                    root = roots[np.abs(roots) == np.min(np.abs(roots))]
-                    start_sample[idx] = np.squeeze(lags[argmax] + root)
-                else:
-                    start_sample[idx] = np.nan
-                    warnings.warn('Starting sample not found for channel '
-                                  f'{ch}', stacklevel=2)
-            else:
-                start_sample[idx] = np.nan
+        ir_minphase = _minimum_phase_homomorphic(ir, 4*n_samples)
+        ir_minphase = np.pad(
+            ir_minphase,
+            ((0, 0), (0, n_samples - ir_minphase.shape[-1])))
+
+        # full cross-correlation via FFT. Entry k of `correlation` belongs to
+        # the lag k - n_samples + 1
+        n_fft = sfft.next_fast_len(2*n_samples - 1, real=True)
+        workers = multiprocessing.cpu_count()
+        correlation = sfft.irfft(
+            sfft.rfft(ir, n_fft, axis=-1, workers=workers) *
+            np.conj(sfft.rfft(ir_minphase, n_fft, axis=-1, workers=workers)),
+            n_fft, axis=-1, workers=workers)
+        correlation = np.concatenate(
+            (correlation[:, n_fft - n_samples + 1:],
+             correlation[:, :n_samples]), axis=-1)
+
+        # calculate the analytic signal of the correlation function
+        correlation_analytic = sgn.hilbert(correlation, axis=-1)
+
+        # find the maximum of the analytic part of the correlation
+        # function and define the search range around the maximum
+        argmax = np.argmax(np.abs(correlation_analytic), axis=-1)
+        search_region_range = np.arange(-n, n)
+        correlation_analytic = np.take_along_axis(
+            correlation_analytic, argmax[:, None] + search_region_range,
+            axis=-1)
+        search_region = np.imag(correlation_analytic)
+
+        # If this is true, it indicates that `correlation_analytic` has
+        # a negative peak, which can happen if the absolute maximum of
+        # `impulse_response` is negative. Changing the sign of the
+        # search region makes sure that the `mask` generated below
+        # works as intended. Fixing it this way is safer because it is
+        # theoretically possible that the absolute maximum of
+        # `impulse_response` is negative but
+        # `correlation_analytic[argmax].real` is positive.
+        search_region *= np.sign(correlation_analytic[:, n:n+1].real)
+
+        # mask values with a negative gradient
+        mask = np.gradient(search_region, axis=-1) > 0
+
+        # fit a polygon and estimate its roots
+        roots = _impulse_response_delay_roots(
+            search_region_range, search_region, mask, N, processes)
+        start_samples[valid] = argmax - n_samples + 1 + roots
 
-        start_samples[ch] = np.nanmin(start_sample)
+        # Use only real-valued roots
+        for idx in np.flatnonzero(np.isnan(roots)):
+            ch = tuple(int(i) for i in np.unravel_index(
+                np.flatnonzero(valid)[idx] % int(np.prod(cshape)), cshape))
+            warnings.warn(f'Starting sample not found for channel {ch}',
+                          stacklevel=2)
 
-    return start_samples
+    start_samples = start_samples.reshape((-1, ) + cshape)
+
+    return np.nanmin(start_samples, axis=0)
+
+
+def _minimum_phase_homomorphic(ir, n_fft):
+    """
+    Homomorphic minimum phase equivalent of real impulse responses.
+
+    Applies :py:func:`scipy.signal.minimum_phase` with
+    ``method='homomorphic'`` and ``half=True`` to all rows of `ir` at once.
+
+    Parameters
+    ----------
+    ir : numpy.ndarray
+        Real impulse responses of shape ``(n_channels, n_samples)``.
+    n_fft : int
+        The FFT length.
+
+    Returns
+    -------
+    ir_minphase : numpy.ndarray
+        Minimum phase impulse responses of shape
+        ``(n_channels, (n_samples + 1) // 2)``.
+    """
+    # all spectra are Hermitian, so that only the one-sided spectra are
+    # computed
+    workers = multiprocessing.cpu_count()
+    h = np.abs(sfft.rfft(ir, n_fft, axis=-1, workers=workers))
+    # don't let log blow up
+    h += 1e-7 * np.min(np.where(h > 0, h, np.inf), axis=-1, keepdims=True)
+    h = sfft.irfft(0.5 * np.log(h), n_fft, axis=-1, workers=workers)
+    # homomorphic filter: double the positive frequencies and zero out the
+    # negative ones
+    win = np.zeros(n_fft)
+    win[0] = 1
+    win[1:n_fft // 2] = 2
+    if n_fft % 2:
+        win[n_fft // 2] = 1
+    h *= win
+    h = sfft.irfft(
+        np.exp(sfft.rfft(h, axis=-1, workers=workers)), n_fft, axis=-1,
+        workers=workers)
+    return h[:, :(ir.shape[-1] + 1) // 2]
+
+
+def _impulse_response_delay_roots(x, y, mask, N, processes=None):
+    """
+    Fit polynomials to the search regions and return the real root closest
+    to zero.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Sample positions of the search regions of shape ``(n_points, )``.
+    y : numpy.ndarray
+        Search regions of shape ``(n_channels, n_points)``.
+    mask : numpy.ndarray
+        Boolean array of the same shape as `y` marking the points used for
+        the fit.
+    N : int
+        The order of the polynomial.
+    processes : int, None
+        Number of processes used to find the roots of channels that are not
+        handled by the closed form solution. ``None`` finds the roots in the
+        calling process.
+
+    Returns
+    -------
+    roots : numpy.ndarray
+        The roots of shape ``(n_channels, )``. NaN if no real valued root
+        was found.
+    """
+    roots = np.full(y.shape[0], np.nan)
+    n_points = np.sum(mask, axis=-1)
+
+    # closed form least squares solution for a linear fit
+    linear = n_points >= 2 if N == 1 else np.zeros(y.shape[0], dtype=bool)
+    if np.any(linear):
+        weights = mask[linear]
+        x_mean = np.sum(weights * x, axis=-1) / n_points[linear]
+        y_mean = np.sum(weights * y[linear], axis=-1) / n_points[linear]
+        x_centered = weights * (x - x_mean[:, None])
+        slope = np.sum(x_centered * y[linear], axis=-1) / \
+            np.sum(x_centered**2, axis=-1)
+        roots[linear] = x_mean - y_mean / slope
+
+    # numerical root finding for all other channels
+    others = np.flatnonzero(~linear)
+    if others.size:
+        if processes is not None and processes > 1 and others.size > 1:
+            chunks = np.array_split(others, min(processes, others.size))
+            with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                results = executor.map(
+                    _polynomial_roots,
+                    *zip(*[(x, y[c], mask[c], N) for c in chunks]))
+                for chunk, result in zip(chunks, results):
+                    roots[chunk] = result
+        else:
+            roots[others] = _polynomial_roots(x, y[others], mask[others], N)
+
+    return roots
+
+
+def _polynomial_roots(x, y, mask, N):
+    """Per channel polynomial fit and root finding (see
+    :py:func:`_impulse_response_delay_roots`).
+    """
+    roots = np.full(y.shape[0], np.nan)
+    for idx in range(y.shape[0]):
+        if not np.any(mask[idx]):
+            continue
+        root = np.roots(np.polyfit(x[mask[idx]], y[idx, mask[idx]], N))
+        if root.size and np.all(np.isreal(root)):
+            roots[idx] = np.real(root[np.argmin(np.abs(root))])
+    return roots
 
 
 def find_impulse_response_start(
@@ -1464,26 +1638,26 @@ def find_impulse_response_start(
                 "Check if this is a valid impulse response with sufficient "
                 "SNR.", stacklevel=2)
 
+        # Only look for the start sample if the maximum index is bigger
+        # than 0. First sample above or at the threshold level before the
+        # maximum
+        search = max_sample > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            above_thresh = ir_squared[search] / max_value[search][..., None] \
+                >= 10**(-threshold/10)
+        above_thresh &= np.arange(ir_squared.shape[-1]) <= \
+            max_sample[search][..., None]
+        found = np.any(above_thresh, axis=-1)
+
+        # The start sample is the last sample below the threshold
         start_sample = max_sample.copy()
+        start_sample[search] = np.where(
+            found, np.argmax(above_thresh, axis=-1) - 1, 0)
 
-        for ch in np.ndindex(impulse_response.cshape):
-            # Only look for the start sample if the maximum index is bigger
-            # than 0
-            if start_sample[ch] > 0:
-                # Check samples before maximum
-                ir_before_max = np.squeeze(
-                    ir_squared[ch][:max_sample[ch]+1] / max_value[ch])
-                # First sample above or at the threshold level
-                idx_first_above_thresh = np.where(
-                    ir_before_max >= 10**(-threshold/10))[0]
-                if idx_first_above_thresh.size > 0:
-                    # The start sample is the last sample below the threshold
-                    start_sample[ch] = np.min(idx_first_above_thresh) - 1
-                else:
-                    start_sample[ch] = 0
-                    warnings.warn(
-                        'No values below threshold found found for channel '
-                        f'{ch} defaulting to 0', stacklevel=2)
+        for ch in np.argwhere(search)[~found]:
+            warnings.warn(
+                'No values below threshold found found for channel '
+                f'{tuple(int(c) for c in ch)} defaulting to 0', stacklevel=2)
 
         ir_start[idx] = start_sample
 
@@ -1753,6 +1927,309 @@ def convolve(signal1, signal2, mode='full', method='overlap_add'):
         is_complex=is_result_complex)
 
 
+class PartitionedConvolver():
+    """
+    Block-wise convolution with a partitioned impulse response.
+
+    The impulse response is split into partitions whose spectra are computed
+    once during initialization. Each call of :py:meth:`process` then
+    convolves blocks of a fixed size with the impulse response using the
+    uniformly partitioned overlap-save method, i.e., only the spectrum of the
+    newest input block has to be computed and multiplied with the stored
+    partition spectra [#]_. This makes it possible to convolve long or
+    streamed audio with long impulse responses, e.g., room impulse
+    responses, at a constant latency of one block and with a computational
+    cost that is much lower than that of direct convolution, e.g., by
+    :py:meth:`pyfar.FilterFIR.process`.
+
+    Long impulse responses can optionally be split into partitions that grow
+    in size (non-uniform partitioning). Larger partitions are processed less
+    often with longer FFTs, which further reduces the cost at the same
+    latency.
+
+    Parameters
+    ----------
+    impulse_response : Signal, array like
+        The impulse response as a :py:class:`~pyfar.Signal` or array of shape
+        ``(*cshape, n_samples)``, e.g., a set of binaural room impulse
+        responses. The impulse response must be real-valued.
+    block_size : int
+        The number of samples of the blocks that are convolved at once. This
+        is also the latency of the convolution in real-time applications.
+    partition_sizes : list of int, optional
+        The sizes of the partitions in samples in ascending order, starting
+        with the partition at the beginning of the impulse response. The last
+        size is repeated until the entire impulse response is covered. All
+        sizes must be multiples of `block_size` and a partition of size ``P``
+        must not start before sample ``P - block_size`` of the impulse
+        response to maintain the latency. A common choice is
+        ``[B, B, 2*B, 2*B, 4*B, 4*B, ...]`` with ``B = block_size``. The
+        default is ``None``, which uses uniform partitions of size
+        `block_size`.
+
+    Examples
+    --------
+    Convolve noise block-wise with an exponentially decaying impulse
+    response and compare the result to :py:func:`~pyfar.dsp.convolve`
+
+    >>> import pyfar as pf
+    >>> import numpy as np
+    >>> noise = pf.signals.noise(2**14, seed=1)
+    >>> decay = np.exp(-np.arange(8192) / 1000)
+    >>> impulse_response = pf.Signal(
+    ...     decay * pf.signals.noise(8192, seed=2).time, 44100)
+    >>> convolver = pf.dsp.PartitionedConvolver(
+    ...     impulse_response, 256, [256, 256, 512, 512, 1024])
+    >>> blocks = np.split(noise.time, 64, axis=-1)
+    >>> convolved = np.concatenate(
+    ...     [convolver.process(block) for block in blocks], axis=-1)
+    >>> reference = pf.dsp.convolve(noise, impulse_response)
+    >>> np.allclose(convolved, reference.time[..., :2**14])
+    True
+
+    References
+    ----------
+    .. [#] W. G. Gardner, "Efficient convolution without input-output delay",
+           J. Audio Eng. Soc. 43(3), 127-136 (1995).
+    """
+
+    def __init__(self, impulse_response, block_size, partition_sizes=None):
+
+        # check input
+        if isinstance(impulse_response, pyfar.Signal):
+            self._sampling_rate = impulse_response.sampling_rate
+            impulse_response = impulse_response.time
+        else:
+            self._sampling_rate = None
+            impulse_response = np.atleast_1d(np.asarray(impulse_response))
+        if np.iscomplexobj(impulse_response):
+            raise ValueError("The impulse response must be real-valued.")
+        if not isinstance(block_size, (int, np.integer)) or block_size < 1:
+            raise ValueError("block_size must be a positive integer.")
+        if partition_sizes is None:
+            partition_sizes = [block_size]
+        partition_sizes = list(partition_sizes)
+        if not partition_sizes or any(
+                not isinstance(p, (int, np.integer)) or p < block_size or
+                p % block_size for p in partition_sizes):
+            raise ValueError(
+                "partition_sizes must be multiples of the block_size.")
+
+        self._block_size = int(block_size)
+        self._ir_cshape = impulse_response.shape[:-1]
+        n_taps = impulse_response.shape[-1]
+
+        # group consecutive partitions of the same size into segments that
+        # share an FFT length and a frequency-domain delay line
+        sizes = []
+        offset = 0
+        while offset < n_taps:
+            size = partition_sizes[min(len(sizes), len(partition_sizes) - 1)]
+            sizes.append(int(size))
+            offset += size
+        self._partition_sizes = sizes
+
+        self._segments = []
+        offset = 0
+        for size in sizes:
+            if self._segments and self._segments[-1]['size'] == size:
+                self._segments[-1]['n_partitions'] += 1
+            else:
+                if offset < size - self._block_size:
+                    raise ValueError(
+                        f"The partition of size {size} starts at sample "
+                        f"{offset} but must not start before sample "
+                        f"{size - self._block_size} (partition size minus "
+                        "block size).")
+                self._segments.append(
+                    {'size': size, 'offset': offset, 'n_partitions': 1})
+            offset += size
+
+        # spectra of the partitions zero-padded to twice their size
+        workers = multiprocessing.cpu_count()
+        for segment in self._segments:
+            size = segment['size']
+            n_partitions = segment['n_partitions']
+            start = segment['offset']
+            partitions = np.zeros(
+                (*self._ir_cshape, n_partitions * size))
+            data = impulse_response[..., start:start + n_partitions * size]
+            partitions[..., :data.shape[-1]] = data
+            partitions = np.moveaxis(partitions.reshape(
+                *self._ir_cshape, n_partitions, size), -2, 0)
+            segment['spectra'] = sfft.rfft(
+                partitions, n=2 * size, axis=-1, workers=workers)
+
+        self.reset()
+
+    @property
+    def block_size(self):
+        """The number of samples that are processed at once."""
+        return self._block_size
+
+    @property
+    def partition_sizes(self):
+        """The sizes of the partitions of the impulse response in samples."""
+        return self._partition_sizes.copy()
+
+    def reset(self):
+        """
+        Reset the convolver by clearing all input and output buffers.
+
+        After a reset, the next block can have a different channel shape.
+        """
+        self._cshape = None
+        self._input = None
+        self._output = None
+        for segment in self._segments:
+            segment['delay_line'] = None
+            segment['position'] = 0
+            segment['count'] = 0
+
+    def _init_buffers(self, cshape):
+        """Allocate the buffers for input of channel shape `cshape`."""
+        try:
+            out_cshape = np.broadcast_shapes(cshape, self._ir_cshape)
+        except ValueError as error:
+            raise ValueError(
+                f"The cshape of the input {cshape} can not be broadcasted "
+                f"to the cshape of the impulse response {self._ir_cshape}.",
+            ) from error
+
+        # the input is stored twice in a ring buffer so that the newest
+        # samples can always be accessed as a contiguous slice. The output is
+        # accumulated in a ring buffer that covers the latest output sample
+        # to which the last segment contributes
+        n_input = 2 * max(segment['size'] for segment in self._segments)
+        n_output = max(segment['offset'] for segment in self._segments) + \
+            self._block_size
+        self._cshape = cshape
+        self._input = np.zeros((*cshape, 2 * n_input))
+        self._input_position = 0
+        self._output = np.zeros((*out_cshape, n_output))
+        self._output_position = 0
+        for segment in self._segments:
+            segment['delay_line'] = np.zeros(
+                (segment['n_partitions'], *cshape, segment['size'] + 1),
+                dtype=complex)
+
+    def process(self, block):
+        """
+        Convolve the next block(s) of the input with the impulse response.
+
+        The convolver keeps track of the previous input. The concatenated
+        output of subsequent calls thus equals the linear convolution of the
+        concatenated input and the impulse response truncated to the length
+        of the input.
+
+        Parameters
+        ----------
+        block : Signal, array like
+            The input as a :py:class:`~pyfar.Signal` or array of shape
+            ``(*cshape, n_samples)``. The channel shape ``cshape`` must be
+            broadcastable to the channel shape of the impulse response and
+            must be the same for all blocks until :py:meth:`reset` is called.
+            The number of samples must be a multiple of the
+            :py:attr:`block_size`.
+
+        Returns
+        -------
+        convolved : Signal, numpy array
+            The convolved input of shape ``(*cshape, n_samples)``, with
+            ``cshape`` being the broadcasted channel shape of the input and
+            impulse response. A Signal is returned if `block` is a Signal and
+            a numpy array otherwise.
+        """
+        if isinstance(block, pyfar.Signal):
+            if self._sampling_rate is not None and \
+                    self._sampling_rate != block.sampling_rate:
+                raise ValueError("The sampling rates do not match")
+            data = block.time
+        else:
+            data = np.atleast_1d(np.asarray(block))
+        if np.iscomplexobj(data):
+            raise ValueError("The input must be real-valued.")
+        if data.shape[-1] % self._block_size:
+            raise ValueError(
+                f"The number of samples ({data.shape[-1]}) must be a "
+                f"multiple of the block size ({self._block_size}).")
+
+        if self._cshape is None:
+            self._init_buffers(data.shape[:-1])
+        elif data.shape[:-1] != self._cshape:
+            raise ValueError(
+                f"The cshape of the input {data.shape[:-1]} does not match "
+                f"the cshape of the previous input {self._cshape}. Call "
+                "reset() to process input with a different cshape.")
+
+        convolved = np.empty((*self._output.shape[:-1], data.shape[-1]))
+        for start in range(0, data.shape[-1], self._block_size):
+            stop = start + self._block_size
+            convolved[..., start:stop] = self._process_block(
+                data[..., start:stop])
+
+        if isinstance(block, pyfar.Signal):
+            return pyfar.Signal(
+                convolved, block.sampling_rate, fft_norm=block.fft_norm,
+                comment=block.comment)
+        return convolved
+
+    def _process_block(self, data):
+        """Convolve a single block and return the next output block."""
+        block_size = self._block_size
+        workers = multiprocessing.cpu_count()
+
+        n_input = self._input.shape[-1] // 2
+        n_output = self._output.shape[-1]
+
+        # write the block to the input ring buffer
+        start = self._input_position
+        self._input[..., start:start + block_size] = data
+        self._input[..., n_input + start:n_input + start + block_size] = data
+        self._input_position = (start + block_size) % n_input
+        end = n_input + start + block_size
+
+        for segment in self._segments:
+            segment['count'] += block_size
+            size = segment['size']
+            if segment['count'] < size:
+                continue
+            segment['count'] = 0
+
+            # the delay line is a ring buffer in which the spectrum of the
+            # newest input is followed by the spectra of older inputs
+            delay_line = segment['delay_line']
+            position = (segment['position'] - 1) % delay_line.shape[0]
+            segment['position'] = position
+            delay_line[position] = sfft.rfft(
+                self._input[..., end - 2 * size:end], axis=-1,
+                workers=workers)
+
+            spectra = segment['spectra']
+            n_newer = delay_line.shape[0] - position
+            spectrum = np.einsum(
+                'k...,k...->...', delay_line[position:], spectra[:n_newer])
+            if position:
+                spectrum += np.einsum(
+                    'k...,k...->...', delay_line[:position],
+                    spectra[n_newer:])
+
+            # overlap-save: the last half of the cyclic convolution is valid
+            valid = sfft.irfft(
+                spectrum, n=2 * size, axis=-1, workers=workers)[..., size:]
+            start = (self._output_position + segment['offset'] - size +
+                     block_size) % n_output
+            n_first = min(size, n_output - start)
+            self._output[..., start:start + n_first] += valid[..., :n_first]
+            self._output[..., :size - n_first] += valid[..., n_first:]
+
+        start = self._output_position
+        convolved = self._output[..., start:start + block_size].copy()
+        self._output[..., start:start + block_size] = 0
+        self._output_position = (start + block_size) % n_output
+        return convolved
+
+
 def decibel(signal, domain='freq', log_prefix=None, log_reference=1,
             return_prefix=False):
     r"""Convert data of the selected signal domain into decibels (dB).
@@ -2062,7 +2539,8 @@ def soft_limit_spectrum(signal, limit, knee, frequency_range=None,
 
     # get spectral data
     signal_limited = signal.copy()
-    freq = signal_limited.freq
+    # copy, because the data is changed in place below
+    freq = signal_limited.freq.copy()
 
     # handle 'inverse' limiting
     if direction == 'lower':
@@ -300,8 +300,10 @@ def normalization(spec, n_samples, sampling_rate, fft_norm='none',
             raise ValueError((f"window must be {n_samples} long "
                               f"but is {len(window)} long."))
 
+    # the normalization has the precision of the spectrum, e.g., to keep
+    # single precision spectra in single precision
     n_bins = spec.shape[-1]
-    norm = np.ones(n_bins)
+    norm = np.ones(n_bins, dtype=np.result_type(spec.real.dtype, np.float32))
 
     # account for type of normalization
     if fft_norm == "amplitude":
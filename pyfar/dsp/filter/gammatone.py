@@ -1,9 +1,11 @@
 """Gammatone filter bank for pyfar."""
+import multiprocessing
 import numpy as np
 import scipy.signal as sgn
 from copy import deepcopy
 from deepdiff import DeepDiff
 import pyfar as pf
+import pyfar.classes.filter as fo
 import warnings
 from pyfar.classes.warnings import PyfarDeprecationWarning
 from pyfar._utils import rename_arg
@@ -152,6 +154,7 @@ class GammatoneBands():
             frequency_range, resolution, reference_frequency)
         # compute filter coefficients
         self._coefficients, self._normalizations = self._get_coefficients()
+        self._sos = self._get_sos()
         # initialize the internal filter state
         self._state = None
         # compute the filter delay, phase factor, and gains
@@ -295,6 +298,28 @@ class GammatoneBands():
 
         return coefficients, normalizations
 
+    def _get_sos(self):
+        """
+        Get the second order sections of all bands.
+
+        Each band is a cascade of four complex one-pole filters, i.e., four
+        second order sections of which only the first order part is used.
+        Using second order sections is faster than a manual call of
+        sgn.lfilter four times in a row.
+
+        Returns
+        -------
+        sos : numpy array
+            The second order sections of shape ``(n_bands, 4, 6)``.
+        """
+        sos = np.zeros((self.n_bands, 4, 6), dtype=complex)
+        sos[..., 0] = 1
+        sos[..., 3] = 1
+        sos[..., 4] = -self._coefficients[:, np.newaxis]
+        sos[:, 3, 0] = self._normalizations
+
+        return sos
+
     def _get_delays_and_phase_factors(self):
         """
         Section 4 in Hohmann 2002 describes how to derive these values. This
@@ -362,7 +387,7 @@ class GammatoneBands():
 
         return gains.flatten()
 
-    def process(self, signal, reset=True):
+    def process(self, signal, reset=True, output="complex"):
         """
         Filter an input signal.
 
@@ -384,15 +409,33 @@ class GammatoneBands():
             If true the internal state of the filter bank is reset before the
             filters are applied. Not resetting the state can be useful for
             blockwise processing. The default is ``True``.
+        output : str, optional
+            Specifies the returned data
+
+            ``'complex'``
+                Return the real and imaginary part of the output.
+            ``'real'``
+                Return only the real part of the output. This requires half
+                the memory of ``'complex'``.
+            ``'envelope'``
+                Return only the envelope, i.e., the absolute value of the
+                output. This requires half the memory of ``'complex'``.
+
+            The default is ``'complex'``.
 
         Returns
         -------
         real : Signal
             The real part of the complex output signal. This represents the
-            band-limited Gammatone filter output.
+            band-limited Gammatone filter output. Only returned if `output` is
+            ``'complex'`` or ``'real'``.
         imag : Signal
             The imaginary part of the complex output signal. This approximates
             the Hilbert transform of the band-limited Gammatone filter output.
+            Only returned if `output` is ``'complex'``.
+        envelope : Signal
+            The envelope of the complex output signal. Only returned if
+            `output` is ``'envelope'``.
 
         Notes
         -----
@@ -403,22 +446,99 @@ class GammatoneBands():
         - An exception to this occurs if ``signal.cshape`` is ``(1, )``, i.e.,
           signal is a single channel signal. In this case the cshape of the
           output signals is ``(self.n_bands)`` and `not` ``(self.n_bands, 1)``.
+        - The bands are filtered in parallel threads.
         """
 
-        # check input
+        if output not in ["complex", "real", "envelope"]:
+            raise ValueError(
+                f"output is '{output}' but must be 'complex', 'real', or "
+                "'envelope'")
+
+        self._check_signal(signal)
+        if reset:
+            self._state = None
+
+        time_out = self._process_data(signal, output)
+
+        # return output as pyfar Signal objects
+        out = [pf.Signal(
+            data, signal.sampling_rate, fft_norm=signal.fft_norm,
+            comment=signal.comment, is_complex=signal.complex,
+            dtype=signal.dtype) for data in time_out]
+
+        return tuple(out) if output == "complex" else out[0]
+
+    def process_blocks(self, blocks, reset=True, output="complex"):
+        """
+        Filter a stream of input signals block-wise.
+
+        The filter state is carried from one block to the next, i.e., the
+        concatenated output equals the output of :py:func:`process` applied
+        to the concatenated input. Because the blocks are processed one at a
+        time, only a single block needs to be kept in memory, which makes it
+        possible to filter recordings that are too long for
+        :py:func:`process`.
+
+        Parameters
+        ----------
+        blocks : iterable
+            Iterable of :py:class:`~pyfar.Signal` objects. The channel shape
+            must be the same for all blocks but the number of samples can
+            differ.
+        reset : bool, optional
+            If true the internal state of the filter bank is reset before the
+            first block is filtered. The default is ``True``.
+        output : str, optional
+            Specifies the returned data (see :py:func:`process`). The default
+            is ``'complex'``.
+
+        Yields
+        ------
+        filtered : tuple, Signal
+            The filtered block as returned by :py:func:`process`.
+
+        Examples
+        --------
+        Get the envelope of a long noise signal in blocks of 4096 samples
+
+        >>> import pyfar as pf
+        >>> import numpy as np
+        >>> noise = pf.signals.noise(2**16, seed=1)
+        >>> blocks = [pf.Signal(block, 44100) for block in np.array_split(
+        ...     noise.time, 16, axis=-1)]
+        >>> GFB = pf.dsp.filter.GammatoneBands([0, 22050])
+        >>> envelope = np.concatenate(
+        ...     [block.time for block in GFB.process_blocks(
+        ...         blocks, output='envelope')], axis=-1)
+        """
+        for idx, block in enumerate(blocks):
+            yield self.process(block, reset and idx == 0, output)
+
+    def _check_signal(self, signal):
+        """Check the type and sampling rate of the input signal."""
         if not isinstance(signal, pf.Signal):
             raise TypeError("signal must be a pyfar Signal object")
         if signal.sampling_rate != self.sampling_rate:
             raise ValueError(("The sampling rates of the signal and Gammatone"
                               " filter bank do not match"))
 
-        # prepare multi-dimensional signals
-        time_in = signal.flatten().time
-        time_out = np.zeros((self.n_bands, ) + time_in.shape, dtype=complex)
+    def _process_data(self, signal, output):
+        """
+        Filter `signal` with all bands and update the internal state.
+
+        Returns a list containing the real and imaginary part, the real part,
+        or the envelope of the output depending on `output`. The data is of
+        shape ``(n_bands, *signal.cshape, n_samples)``.
+        """
 
-        # reset or initialize the state as a list of as many zero arrays as
-        # the filter bank has bands
-        if reset or self._state is None:
+        # prepare multi-dimensional signals. The conversion to complex is
+        # done once instead of once per band inside sosfilt
+        time_in = np.reshape(signal.time, (-1, signal.n_samples)).astype(
+            complex)
+
+        # initialize the state as a list of as many zero arrays as the filter
+        # bank has bands
+        if self._state is None:
             state = np.zeros((4, time_in.shape[0], 2), dtype=complex)
             self._state = [state for _ in range(self.n_bands)]
         elif len(self._state) != self.n_bands \
@@ -429,29 +549,39 @@ class GammatoneBands():
                 "or with the signal that it was previously used with."
             ))
 
-        # apply the filter band by band
-        # using second order sections is faster than a manual call of
-        # sgn.lfilter four time in a row
-        for bb in range(self.n_bands):
-
-            sos_section = np.tile(np.atleast_2d(
-                [1, 0, 0, 1, -self._coefficients[bb], 0]),
-                (4, 1))
-            sos_section[3, 0] = self._normalizations[bb]
-            time_out[bb], self._state[bb] = sgn.sosfilt(
-                sos_section, time_in, axis=-1, zi=self._state[bb])
+        # only allocate the requested real-valued output
+        time_out = [
+            np.empty((self.n_bands, ) + time_in.shape, dtype=signal.dtype)
+            for _ in range(2 if output == "complex" else 1)]
+        new_state = [None] * self.n_bands
+
+        def process_band(bb):
+            filtered, new_state[bb] = sgn.sosfilt(
+                self._sos[bb], time_in, axis=-1, zi=self._state[bb])
+            if output == "envelope":
+                time_out[0][bb] = np.abs(filtered)
+            else:
+                time_out[0][bb] = filtered.real
+            if output == "complex":
+                time_out[1][bb] = filtered.imag
+
+        # scipy releases the GIL during filtering. Bands are thus processed in
+        # parallel threads that write to separate parts of time_out if the
+        # data is large enough to outweigh the overhead of the threads
+        parallel = min(self.n_bands, multiprocessing.cpu_count()) > 1 \
+            and self.n_bands * time_in.size >= fo._PARALLEL_MIN_SAMPLES
+        if parallel:
+            # consuming the results raises errors from the threads
+            list(fo._get_executor().map(process_band, range(self.n_bands)))
+        else:
+            for bb in range(self.n_bands):
+                process_band(bb)
+
+        self._state = new_state
 
         # restore original channel shape
-        time_out = np.reshape(time_out,
-                              (self.n_bands, ) + signal.cshape + (-1, ))
-
-        # return real and immaginary part of output as pyfar Signal objects
-        real = signal.copy()
-        real.time = np.real(time_out)
-        imag = signal.copy()
-        imag.time = np.imag(time_out)
-
-        return real, imag
+        return [np.reshape(data, (self.n_bands, ) + signal.cshape + (-1, ))
+                for data in time_out]
 
     def reconstruct(self, real, imag):
         """
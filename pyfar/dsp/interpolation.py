@@ -1,44 +1,98 @@
 """Signal processing functions related to interpolation and resampling."""
 import numpy as np
-from scipy.special import iv as bessel_first_mod
-from scipy.interpolate import interp1d
+from scipy.special import iv as bessel_first_mod, i0, j0
+from scipy.interpolate import interp1d, BSpline
+from scipy import sparse
+from scipy.linalg import lapack
 import scipy.signal as sgn
+import scipy.fft as sfft
 import matplotlib.pyplot as plt
 import pyfar as pf
-from scipy.ndimage import generic_filter1d
+from pyfar.dsp.dsp import _shift_data
 from fractions import Fraction
 from decimal import Decimal
+from functools import lru_cache
 import warnings
 
+# interpolation kinds of InterpolateSpectrum that only use the two
+# neighboring input frequencies and thus have sparse interpolation weights
+_LOCAL_KINDS = (
+    'linear', 'nearest', 'nearest-up', 'zero', 'slinear', 'previous', 'next')
 
-def _weighted_moving_average(input_data, output, weights):
-    """Moving average filter of length N and arbitrary.
+# maximum number of elements of dense interpolation weights of
+# InterpolateSpectrum. Larger interpolations are done directly on the data
+_MAX_DENSE_WEIGHTS = 2**21
 
-    Parameters
-    ----------
-    input_data : numpy.ndarray
-        The input array
-    output : numpy.ndarray
-        The output buffer
-    N : int
-        Length of the filter
-    weights : numpy.ndarray
-        The weights used for averaging. The length of the weights also
-        specifies the length of the filter.
-
-    Note
-    ----
-    This function is primarily intended to be used in combination with
-    :py:func:`scipy.ndimage.generic_filter1d`. The input is strided instead of
-    reshaped, leaving the memory layout unchanged. The function does also not
-    return it's output but requires the output buffer as function input, which
-    is required by :py:func:`scipy.ndimage.generic_filter1d`.
+# maximum memory of the interpolation weights cached by an InterpolateSpectrum
+# object in bytes
+_MAX_CACHED_WEIGHTS_BYTES = 2**26
+
+
+def _spline_interpolation_operator(x, x_new):
+    """
+    Cubic spline interpolation from `x` to `x_new` as sparse linear operator.
+
+    The interpolation is identical to :py:class:`scipy.interpolate.interp1d`
+    with ``kind='cubic'``, i.e., it uses a not-a-knot spline. Returns a
+    function that computes the spline coefficients of data sampled at `x`
+    (along the first dimension) and the sparse matrix that evaluates the
+    spline at `x_new`.
+    """
+    # not-a-knot knots as used by scipy.interpolate.make_interp_spline
+    t = np.r_[(x[0], ) * 4, x[2:-2], (x[-1], ) * 4]
+    evaluation = BSpline.design_matrix(x_new, t, 3).tocsr()
 
+    # LU factorization of the banded collocation matrix (LAPACK band storage
+    # with l=u=3 sub- and super-diagonals and l extra rows for pivoting)
+    collocation = BSpline.design_matrix(x, t, 3).tocoo()
+    bands = 3
+    banded = np.zeros((3 * bands + 1, x.size))
+    banded[2 * bands + collocation.row - collocation.col, collocation.col] = \
+        collocation.data
+    lu, pivots, info = lapack.dgbtrf(banded, bands, bands)
+    if info != 0:
+        raise ValueError("The collocation matrix is singular.")
+
+    def solve(data):
+        return lapack.dgbtrs(lu, bands, bands, data, pivots)[0]
+
+    return solve, evaluation
+
+
+@lru_cache(maxsize=32)
+def _smoothing_operators(n_bins, n_window, window):
     """
-    strided = np.lib.stride_tricks.as_strided(
-        input_data, strides=input_data.strides*2,
-        shape=(weights.size, input_data.size - (weights.size-1)))
-    output[:] = np.average(strided, weights=weights, axis=0)
+    Linear operators for fractional octave smoothing of `n_bins` bins.
+
+    The smoothing (see :py:func:`smooth_fractional_octave`) is linear in the
+    data. The interpolation to logarithmically spaced frequencies, the
+    weighted moving average with the `window` of length `n_window` and the
+    interpolation back to linearly spaced frequencies are thus precomputed as
+    sparse matrices and cached for repeated smoothing of data with the same
+    number of bins. `window` is the name of the window or a tuple containing
+    the window.
+    """
+    if isinstance(window, str):
+        window = sgn.windows.get_window(window, n_window, fftbins=False)
+
+    # linearly and logarithmically spaced frequency bins
+    n_lin = np.arange(n_bins) + 1
+    n_log = n_bins**(np.arange(n_bins) / (n_bins - 1))
+
+    # weighted moving average with 'nearest' padding at the edges
+    weights = np.asarray(window) / np.sum(window)
+    offsets = np.arange(n_window) - n_window // 2
+    rows = np.repeat(np.arange(n_bins), n_window)
+    columns = np.clip(
+        rows + np.tile(offsets, n_bins), 0, n_bins - 1)
+    average = sparse.csr_matrix(
+        (np.tile(weights, n_bins), (rows, columns)), shape=(n_bins, n_bins))
+
+    # lin -> log interpolation followed by the moving average and log -> lin
+    # interpolation
+    to_log, evaluate_log = _spline_interpolation_operator(n_lin, n_log)
+    to_lin, evaluate_lin = _spline_interpolation_operator(n_log, n_lin)
+    return to_log, (average @ evaluate_log).tocsr(), to_lin, evaluate_lin
 
 
 def smooth_fractional_octave(signal, num_fractions, mode="magnitude_zerophase",
@@ -192,37 +246,27 @@ def smooth_fractional_octave(signal, num_fractions, mode="magnitude_zerophase",
             " resolution of the signal. Increase the signal length or decrease"
             " num_fractions"))
 
-    # generate the smoothing window
-    if isinstance(window, str):
-        window = sgn.windows.get_window(window, n_window, fftbins=False)
-    elif isinstance(window, (list, np.ndarray)):
+    # check the smoothing window (generated with the smoothing operators)
+    if isinstance(window, (list, np.ndarray)):
         # undocumented possibility for testing
         window = np.asanyarray(window, dtype=float)
         if window.shape != (n_window, ):
             raise ValueError(
                 f"window.shape is {window.shape} but must be ({n_window}, )")
-    else:
+        window = tuple(window)
+    elif not isinstance(window, str):
         raise ValueError(f"window is of type {str(type(window))} but must be "
                          "of type string")
 
-    for nn in range(len(data)):
-        # interpolate to logarithmically spaced frequencies
-        interpolator = interp1d(
-            n_lin + 1, data[nn], "cubic", copy=False, assume_sorted=True)
-        data[nn] = interpolator(n_log)
-
-        # apply a moving average filter based on the window function
-        data[nn] = generic_filter1d(
-            data[nn],
-            function=_weighted_moving_average,
-            filter_size=n_window,
-            mode='nearest',
-            extra_arguments=(window,))
-
-        # interpolate to original frequency axis
-        interpolator = interp1d(
-            n_log, data[nn], "cubic", copy=False, assume_sorted=True)
-        data[nn] = interpolator(n_lin + 1)
+    # smooth all channels at once. The bins are along the first dimension for
+    # applying the sparse operators
+    to_log, average, to_lin, evaluate = _smoothing_operators(
+        N, n_window, window)
+    shape = data[0].shape
+    stacked = np.concatenate([d.reshape(-1, N) for d in data]).T
+    stacked = evaluate @ to_lin(average @ to_log(
+        np.asarray(stacked, dtype=float, order='F')))
+    data = [d.T.reshape(shape) for d in np.split(stacked, len(data), axis=-1)]
 
     # generate return signal --------------------------------------------------
     if mode == "magnitude_zerophase":
@@ -246,15 +290,17 @@ def smooth_fractional_octave(signal, num_fractions, mode="magnitude_zerophase",
 
 
 def fractional_time_shift(signal, shift, unit="samples", order=30,
-                          side_lobe_suppression=60, mode="linear"):
+                          side_lobe_suppression=60, mode="linear",
+                          method="fir"):
     """
     Apply fractional time shift to input data.
 
-    This function uses a windowed Sinc filter (Method FIR-2 in [#]_ according
-    to Equations 21 and 22) to apply fractional delays, i.e., non-integer
-    delays to an input signal. A Kaiser window according to [#]_ Equations
-    (10.12) and (10.13) is used, which offers the possibility to control the
-    side lobe suppression.
+    By default, this function uses a windowed Sinc filter (Method FIR-2 in
+    [#]_ according to Equations 21 and 22) to apply fractional delays, i.e.,
+    non-integer delays to an input signal. A Kaiser window according to [#]_
+    Equations (10.12) and (10.13) is used, which offers the possibility to
+    control the side lobe suppression. Alternatively, the shift can be applied
+    as a linear phase in the frequency domain.
 
     Parameters
     ----------
@@ -272,10 +318,11 @@ def fractional_time_shift(signal, shift, unit="samples", order=30,
         The order of the fractional shift (sinc) filter. The precision of the
         filter increases with the order. High frequency errors decrease with
         increasing order. The order must be smaller than
-        ``signal.n_samples``. The default is ``30``.
+        ``signal.n_samples``. Only used if `method` is ``'fir'``. The default
+        is ``30``.
     side_lobe_suppression : float, optional
-        The side lobe suppression of the Kaiser window in dB. The default is
-        ``60``.
+        The side lobe suppression of the Kaiser window in dB. Only used if
+        `method` is ``'fir'``. The default is ``60``.
     mode : str, optional
         The filtering mode
 
@@ -290,6 +337,21 @@ def fractional_time_shift(signal, shift, unit="samples", order=30,
             around to the beginning.
 
         The default is ``"linear"``
+    method : str, optional
+        The method for applying the fractional shift
+
+        ``"fir"``
+            Convolve with a windowed Sinc filter as described above.
+        ``"frequency"``
+            Multiply the spectrum with the linear phase of the shift. This
+            is an ideal band-limited shift that does not attenuate high
+            frequencies, but the Sinc function of the shift is not windowed.
+            For linear shifts, the signal is zero-padded before the shift
+            to avoid cyclic wrap around of the shifted signal. Parts of
+            the Sinc function that are longer than the padding still wrap
+            around.
+
+        The default is ``"fir"``.
 
     Returns
     -------
@@ -361,7 +423,10 @@ def fractional_time_shift(signal, shift, unit="samples", order=30,
     if mode not in ["linear", "cyclic"]:
         raise ValueError(
             f"The mode is '{mode}' but must be 'linear' or 'cyclic'")
-    if order + 1 > signal.n_samples:
+    if method not in ["fir", "frequency"]:
+        raise ValueError(
+            f"The method is '{method}' but must be 'fir' or 'frequency'")
+    if method == "fir" and order + 1 > signal.n_samples:
         raise ValueError((f"The order is {order} but must not exceed "
                           f"{signal.n_samples-1} (signal.n_samples-1)"))
 
@@ -371,6 +436,27 @@ def fractional_time_shift(signal, shift, unit="samples", order=30,
         raise ValueError(
             f"Unit is '{unit}' but has to be 'samples' or 's'.")
 
+    # apply the shift to the time data of all channels at once
+    if method == "fir":
+        data = _fractional_time_shift_fir(
+            signal.time, shift, order, side_lobe_suppression, mode)
+    else:
+        data = _fractional_time_shift_frequency(
+            signal.time, shift, mode, signal.complex)
+
+    return pf.Signal(
+        data, signal.sampling_rate, fft_norm=signal.fft_norm,
+        is_complex=signal.complex, dtype=signal.dtype)
+
+
+def _fractional_time_shift_fir(data, shift, order, side_lobe_suppression,
+                               mode):
+    """
+    Apply a fractional shift to `data` of shape ``(*cshape, n_samples)`` by
+    convolution with windowed Sinc filters (see
+    :py:func:`fractional_time_shift`).
+    """
+
     # separate integer and fractional shift -----------------------------------
     delay_int = np.atleast_1d(shift).astype(int)
     delay_frac = np.atleast_1d(shift - delay_int)
@@ -390,13 +476,9 @@ def fractional_time_shift(signal, shift, unit="samples", order=30,
     else:
         M_opt = np.round(delay_frac) - order / 2
 
-    # get matrix versions of the fractional shift and M_opt
-    delay_frac_matrix = np.tile(
-        delay_frac[..., np.newaxis],
-        tuple(np.ones(delay_frac.ndim, dtype="int")) + (order + 1, ))
-    M_opt_matrix = np.tile(
-        M_opt[..., np.newaxis],
-        tuple(np.ones(M_opt.ndim, dtype="int")) + (order + 1, ))
+    # broadcastable versions of the fractional shift and M_opt
+    delay_frac_matrix = delay_frac[..., np.newaxis]
+    M_opt_matrix = M_opt[..., np.newaxis]
 
     # discrete time vector
     n = np.arange(order + 1) + M_opt_matrix - delay_frac_matrix
@@ -420,34 +502,66 @@ def fractional_time_shift(signal, shift, unit="samples", order=30,
     if order % 2:
         L += .5
     else:
-        L[delay_frac_matrix > .5] += 1
-    Z = beta * np.sqrt(np.array(1 - ((L - alpha) / alpha)**2, dtype="complex"))
-    # suppress small imaginary parts
-    kaiser = np.real(bessel_first_mod(0, Z)) / bessel_first_mod(0, beta)
+        L[np.broadcast_to(delay_frac_matrix > .5, L.shape)] += 1
+    # The argument of the square root becomes negative outside the window.
+    # The real part of the Bessel function for imaginary arguments is then
+    # given by the Bessel function of the first kind, i.e.,
+    # Re(I_0(j x)) = J_0(x)
+    Z = 1 - ((L - alpha) / alpha)**2
+    kaiser = np.where(
+        Z >= 0, i0(beta * np.sqrt(np.abs(Z))),
+        j0(beta * np.sqrt(np.abs(Z)))) / bessel_first_mod(0, beta)
 
     # apply fractional shift --------------------------------------------------
     # compute filter and match dimensions
     frac_delay_filter = sinc * kaiser
-    while frac_delay_filter.ndim < signal.time.ndim:
+    while frac_delay_filter.ndim < data.ndim:
         frac_delay_filter = frac_delay_filter[np.newaxis]
-    # apply filter
-    convolve_mode = mode if mode == "cyclic" else "full"
-    n_samples = signal.n_samples
-
-    signal = pf.dsp.convolve(
-        signal, pf.Signal(frac_delay_filter, signal.sampling_rate),
-        mode=convolve_mode)
+    # apply filter (broadcasts across channels)
+    n_samples = data.shape[-1]
+    shifted = sgn.oaconvolve(data, frac_delay_filter, mode='full', axes=-1)
+    if mode == "cyclic":
+        shifted[..., :order] += shifted[..., n_samples:]
+        shifted = shifted[..., :n_samples]
 
     # apply integer shift -----------------------------------------------------
     # account for shift from applying the fractional filter
     delay_int += M_opt.astype("int")
-    signal = pf.dsp.time_shift(signal, delay_int, mode)
+    if mode == "linear" and np.any(np.abs(delay_int) > shifted.shape[-1]):
+        raise ValueError(("Can not shift by more samples than signal.n_samples"
+                          " if mode is 'linear'"))
+    shifted = _shift_data(shifted, delay_int, mode)
 
     # truncate signal (got padded during convolution with mode='full')
-    if mode == "linear":
-        signal.time = signal.time[..., :n_samples]
+    return shifted[..., :n_samples]
+
+
+def _fractional_time_shift_frequency(data, shift, mode, is_complex):
+    """
+    Apply a fractional shift to `data` of shape ``(*cshape, n_samples)`` by
+    a linear phase in the frequency domain (see
+    :py:func:`fractional_time_shift`).
+    """
+    shift = np.asarray(shift, dtype=float)
+    while shift.ndim < data.ndim - 1:
+        shift = shift[np.newaxis]
+    shift = shift[..., np.newaxis]
+
+    # zero pad linear shifts to avoid cyclic wrap around
+    n_samples = data.shape[-1]
+    n_fft = n_samples if mode == "cyclic" else sfft.next_fast_len(
+        2 * n_samples + int(np.ceil(np.max(np.abs(shift)))))
+
+    if is_complex:
+        spectrum = sfft.fft(data, n_fft, axis=-1)
+        spectrum *= np.exp(-2j * np.pi * sfft.fftfreq(n_fft) * shift)
+        shifted = sfft.ifft(spectrum, n_fft, axis=-1)
+    else:
+        spectrum = sfft.rfft(data, n_fft, axis=-1)
+        spectrum *= np.exp(-2j * np.pi * sfft.rfftfreq(n_fft) * shift)
+        shifted = sfft.irfft(spectrum, n_fft, axis=-1)
 
-    return signal
+    return shifted[..., :n_samples]
 
 
 def resample(signal, sampling_rate, match_amplitude="auto", frac_limit=None,
@@ -563,74 +677,309 @@ def resample(signal, sampling_rate, match_amplitude="auto", frac_limit=None,
     # check input
     if not isinstance(signal, (pf.Signal)):
         raise TypeError("Input data has to be of type pyfar.Signal")
-    # calculate factor L for up- or downsampling
-    sampling_rate_old = signal.sampling_rate
-    L = sampling_rate / sampling_rate_old
-    # set match_amplitude domain depending on signal.signal_type
-    if match_amplitude == "auto":
-        match_amplitude = "freq" if signal.signal_type == "energy" else "time"
-    # set gain depending on domain to match aplitude in
-    if match_amplitude == "time":
-        gain = 1
-    elif match_amplitude == "freq":
-        gain = 1/L
+
+    resampler = Resampler(
+        signal.sampling_rate, sampling_rate, match_amplitude, frac_limit,
+        post_filter)
+    return resampler(signal)
+
+
+class Resampler():
+    """
+    Resample signals or streams of blocks to a new sampling rate.
+
+    The resampler designs the polyphase anti-aliasing filter (and the
+    optional post filter) once and can then be applied to any number of
+    signals with the same sampling rate. Calling the resampler gives the
+    same result as :py:func:`~pyfar.dsp.resample`. In addition,
+    :py:meth:`process` resamples a signal block by block, e.g., to resample
+    recordings that are too long to be kept in memory.
+
+    Parameters
+    ----------
+    sampling_rate_in : number
+        The sampling rate of the input in Hz.
+    sampling_rate_out : number
+        The new sampling rate in Hz.
+    match_amplitude : string
+        Define the domain to match the amplitude of the resampled data. See
+        :py:func:`~pyfar.dsp.resample`. ``'auto'`` uses ``'time'`` if the
+        input is a numpy array. The default is ``'auto'``.
+    frac_limit : int
+        Limit the denominator for approximating the resampling factor. See
+        :py:func:`~pyfar.dsp.resample`. The default is ``None``, which uses
+        ``frac_limit = 1e6``.
+    post_filter : bool, optional
+        Suppress artifacts above the Nyquist frequency of the input in case
+        of up-sampling. See :py:func:`~pyfar.dsp.resample`. The filter is
+        applied with zero phase when calling the resampler and causal (not
+        zero phase) by :py:meth:`process`, which can not access future
+        samples. The default is ``False``.
+
+    Examples
+    --------
+    Resample multiple signals from 44.1 kHz to 48 kHz
+
+    >>> import pyfar as pf
+    >>> resampler = pf.dsp.Resampler(44100, 48000)
+    >>> signals = [pf.signals.noise(4410, seed=seed) for seed in range(10)]
+    >>> resampled = [resampler(signal) for signal in signals]
+
+    Resample a stream of blocks and remove the delay of the filter
+
+    >>> import numpy as np
+    >>> noise = pf.signals.noise(44100, seed=1).time
+    >>> blocks = np.split(noise, 10, axis=-1)
+    >>> resampler = pf.dsp.Resampler(44100, 48000)
+    >>> streamed = np.concatenate(
+    ...     [resampler.process(block) for block in blocks], axis=-1)
+    >>> np.allclose(streamed[..., resampler.delay:],
+    ...             resampler(noise)[..., :48000 - resampler.delay])
+    True
+    """
+
+    def __init__(self, sampling_rate_in, sampling_rate_out,
+                 match_amplitude="auto", frac_limit=None, post_filter=False):
+
+        # check input
+        if match_amplitude not in ["auto", "time", "freq"]:
+            raise ValueError((f"match_amplitude is '{match_amplitude}' but "
+                              "must be 'auto', 'time' or 'freq'"))
+        self._sampling_rate_in = sampling_rate_in
+        self._sampling_rate_out = sampling_rate_out
+        self._match_amplitude = match_amplitude
+        # calculate factor L for up- or downsampling
+        self._L = sampling_rate_out / sampling_rate_in
+
+        # check if one of the sampling rates is not divisible by 10
+        if sampling_rate_out % 10 or sampling_rate_in % 10:
+            warnings.warn((
+                'At least one sampling rate is not divisible by 10, , which '
+                'can cause a infinite loop in `scipy.resample_poly`. If this '
+                'occurs, interrupt and choose different sampling rates or '
+                'decrease frac_limit. However, this can cause an error in the '
+                'target sampling rate realisation.'), stacklevel=2)
+        # give the numerator and denomitor of the fraction for factor L
+        if frac_limit is None:
+            frac = Fraction(Decimal(self._L)).limit_denominator()
+        else:
+            frac = Fraction(Decimal(self._L)).limit_denominator(frac_limit)
+        up, down = frac.numerator, frac.denominator
+        self._up, self._down = up, down
+        # calculate an error depending on samplings rates and fraction
+        error = abs(sampling_rate_in * up / down - sampling_rate_out)
+        if error != 0.0:
+            warnings.warn((
+                'The target sampling rate was realized with an error of '
+                f'{error}.The error might be decreased by setting '
+                f'`frac_limit` to a value larger than {down} (This warning is '
+                'not shown, if the target sampling rate can exactly be '
+                'realized).'), stacklevel=2)
+
+        # design the anti-aliasing filter as done by scipy.resample_poly
+        max_rate = max(up, down)
+        half_len = 10 * max_rate
+        self._window = sgn.firwin(
+            2 * half_len + 1, 1 / max_rate, window=('kaiser', 5.0))
+        # the filter used for streaming is zero-padded to delay the output
+        # by an integer number of samples
+        n_pre_pad = down - half_len % down
+        self._delay = (half_len + n_pre_pad) // down
+        self._h = np.concatenate((np.zeros(n_pre_pad), self._window * up))
+
+        # design the elliptic post filter
+        # (pass band is given by nyquist frequency of input signal, other
+        # parameters are freely chosen)
+        self._post_filter = None
+        if post_filter and self._L > 1:
+            wp = sampling_rate_in / 2 / sampling_rate_out * 2
+            ws = min(1, 1.05 * wp)
+            gpass = .1
+            gstop = 60
+
+            # calculate the required order and -3 dB cut-off frequency
+            N, f_c = sgn.ellipord(wp, ws, gpass, gstop/2, fs=sampling_rate_out)
+            f_c *= sampling_rate_out / 2
+            self._post_filter = pf.dsp.filter.elliptic(
+                None, N, gpass, gstop/2, f_c, 'lowpass',
+                sampling_rate=sampling_rate_out)
+
+        self.reset()
+
+    @property
+    def sampling_rate_in(self):
+        """The sampling rate of the input in Hz."""
+        return self._sampling_rate_in
+
+    @property
+    def sampling_rate_out(self):
+        """The sampling rate of the output in Hz."""
+        return self._sampling_rate_out
+
+    @property
+    def up(self):
+        """The up-sampling factor."""
+        return self._up
+
+    @property
+    def down(self):
+        """The down-sampling factor."""
+        return self._down
+
+    @property
+    def delay(self):
+        """
+        The delay of the output of :py:meth:`process` in samples.
+
+        The output of :py:meth:`process` is delayed by the group delay of the
+        anti-aliasing filter to be causal, i.e., it starts with ``delay``
+        samples of the onset of the filter.
+        """
+        return self._delay
+
+    def _get_gain(self, signal):
+        """Return the gain for matching the amplitude of `signal`."""
+        match_amplitude = self._match_amplitude
+        # set match_amplitude domain depending on signal.signal_type
+        if match_amplitude == "auto":
+            match_amplitude = "freq" if isinstance(signal, pf.Signal) and \
+                signal.signal_type == "energy" else "time"
+        if match_amplitude == "time":
+            return 1
         # the aplitude of signals with signal_type "power" must be matched in
         # the time domain
-        if signal.signal_type == "power":
+        if isinstance(signal, pf.Signal) and signal.signal_type == "power":
             raise ValueError((
                 'match_amplitude must be "time" if signal.signal_type is '
                 '"power".'))
-    else:
-        raise ValueError((f"match_amplitude is '{match_amplitude}' but must be"
-                          " 'auto', 'time' or 'freq'"))
-    # check if one of the sampling rates is not divisible by 10
-    if sampling_rate % 10 or sampling_rate_old % 10:
-        warnings.warn((
-            'At least one sampling rate is not divisible by 10, , which can '
-            'cause a infinite loop in `scipy.resample_poly`. If this occurs, '
-            'interrupt and choose different sampling rates or decrease '
-            'frac_limit. However, this can cause an error in the target '
-            'sampling rate realisation.'), stacklevel=2)
-    # give the numerator and denomitor of the fraction for factor L
-    if frac_limit is None:
-        frac = Fraction(Decimal(L)).limit_denominator()
-    else:
-        frac = Fraction(Decimal(L)).limit_denominator(frac_limit)
-    up, down = frac.numerator, frac.denominator
-    # calculate an error depending on samplings rates and fraction
-    error = abs(sampling_rate_old * up / down - sampling_rate)
-    if error != 0.0:
-        warnings.warn((
-            f'The target sampling rate was realized with an error of {error}.'
-            f'The error might be decreased by setting `frac_limit` to a value '
-            f'larger than {down} (This warning is not shown, if the target '
-            'sampling rate can exactly be realized).'), stacklevel=2)
-    # resample data with scipy resampe_poly function
-    data = sgn.resample_poly(signal.time, up, down, axis=-1)
-    data = pf.Signal(data * gain, sampling_rate, fft_norm=signal.fft_norm,
-                     comment=signal.comment, is_complex=signal.complex)
-
-    if post_filter and L > 1:
-
-        # Design elliptic filter
-        # (pass band is given by nyquist frequency of input signal, other
-        # parameters are freely chosen)
-        wp = sampling_rate_old / 2 / sampling_rate * 2
-        ws = min(1, 1.05 * wp)
-        gpass = .1
-        gstop = 60
+        return 1 / self._L
+
+    def _check_input(self, signal):
+        """Return the time data of `signal` as numpy array."""
+        if isinstance(signal, pf.Signal):
+            if signal.sampling_rate != self._sampling_rate_in:
+                raise ValueError(
+                    f"The sampling rate of the signal ({signal.sampling_rate} "
+                    "Hz) does not match the input sampling rate of the "
+                    f"resampler ({self._sampling_rate_in} Hz).")
+            return signal.time
+        return np.atleast_1d(np.asarray(signal))
+
+    def _return_data(self, data, signal):
+        """Return `data` as Signal if `signal` is a Signal."""
+        if isinstance(signal, pf.Signal):
+            return pf.Signal(
+                data, self._sampling_rate_out, fft_norm=signal.fft_norm,
+                comment=signal.comment, is_complex=signal.complex,
+                dtype=signal.dtype)
+        return data
+
+    def __call__(self, signal):
+        """
+        Resample a signal.
+
+        Parameters
+        ----------
+        signal : Signal, array like
+            The input signal as :py:class:`~pyfar.Signal` or array of shape
+            ``(*cshape, n_samples)``.
+
+        Returns
+        -------
+        resampled : Signal, numpy array
+            The resampled signal with a length of
+            ``ceil(up/down * n_samples)`` samples. A Signal is returned if
+            `signal` is a Signal and a numpy array otherwise.
+        """
+        data = self._check_input(signal)
+        gain = self._get_gain(signal)
+
+        # resample data with scipy resampe_poly function
+        data = sgn.resample_poly(
+            data, self._up, self._down, axis=-1, window=self._window) * gain
 
-        # calculate the required order and -3 dB cut-off frequency
-        N, f_c = sgn.ellipord(wp, ws, gpass, gstop/2, fs=sampling_rate)
-        f_c *= sampling_rate / 2
+        if self._post_filter is not None:
+            # apply zero-phase filter
+            post_filter = self._post_filter.copy()
+            for _ in range(2):
+                post_filter.state = None
+                data = np.flip(
+                    next(post_filter.process_blocks([data])), axis=-1)
 
-        # apply zero-phase filter
-        data = pf.dsp.filter.elliptic(data, N, gpass, gstop/2, f_c, 'lowpass')
-        data.time = np.flip(data.time, axis=-1)
-        data = pf.dsp.filter.elliptic(data, N, gpass, gstop/2, f_c, 'lowpass')
-        data.time = np.flip(data.time, axis=-1)
+        return self._return_data(data, signal)
 
-    return data
+    def process(self, block):
+        """
+        Resample the next block of a stream.
+
+        The resampler keeps track of the previous input. The concatenated
+        output of subsequent calls thus equals the resampled concatenated
+        input that is delayed by :py:attr:`delay` samples. Without post
+        filter, the output after the delay equals the output of calling the
+        resampler with the concatenated input.
+
+        Parameters
+        ----------
+        block : Signal, array like
+            The next block of the input as :py:class:`~pyfar.Signal` or array
+            of shape ``(*cshape, n_samples)``. The channel shape ``cshape``
+            must be the same for all blocks until :py:meth:`reset` is called
+            but the number of samples can differ.
+
+        Returns
+        -------
+        resampled : Signal, numpy array
+            The resampled block. The total number of output samples after
+            processing `N` input samples is ``ceil(up/down * N)``. A Signal is
+            returned if `block` is a Signal and a numpy array otherwise.
+        """
+        data = self._check_input(block)
+        gain = self._get_gain(block)
+
+        if self._input is None:
+            self._input = np.zeros((*data.shape[:-1], 0), dtype=data.dtype)
+        elif data.shape[:-1] != self._input.shape[:-1]:
+            raise ValueError(
+                f"The cshape of the block {data.shape[:-1]} does not match "
+                f"the cshape of the previous blocks "
+                f"{self._input.shape[:-1]}. Call reset() to process blocks "
+                "with a different cshape.")
+        n_input = self._n_input + data.shape[-1]
+        data = np.concatenate((self._input, data), axis=-1)
+
+        # output samples that can be computed from the input received so far
+        up, down = self._up, self._down
+        n_output = -(-n_input * up // down)
+
+        # the buffered input starts at a multiple of down. The first output
+        # of the polyphase filter is thus aligned with an output sample
+        first = self._start * up // down
+        resampled = sgn.upfirdn(self._h, data, up, down, axis=-1)
+        resampled = resampled[..., self._n_output - first:n_output - first]
+
+        # keep the input required for the next output sample
+        start = max(0, -(-(n_output * down - self._h.size + 1) // up))
+        start = start // down * down
+        self._input = data[..., start - self._start:]
+        self._start = start
+        self._n_input = n_input
+        self._n_output = n_output
+
+        if self._stream_filter is not None:
+            resampled = next(self._stream_filter.process_blocks([resampled]))
+
+        return self._return_data(resampled * gain, block)
+
+    def reset(self):
+        """
+        Reset the state of :py:meth:`process` to start a new stream.
+        """
+        self._input = None
+        self._start = 0
+        self._n_input = 0
+        self._n_output = 0
+        self._stream_filter = None if self._post_filter is None else \
+            self._post_filter.copy()
 
 
 class InterpolateSpectrum():
@@ -706,6 +1055,10 @@ class InterpolateSpectrum():
         `show` : bool, optional
             Show a plot of the input and output data. The default is ``False``.
 
+        Use :py:meth:`~InterpolateSpectrum.interpolate_lengths` to interpolate
+        to multiple lengths at once. The interpolation weights are cached for
+        repeated calls with the same `n_samples` and `sampling_rate`.
+
     Examples
     --------
     Interpolate a magnitude spectrum, add an artificial linear phase and
@@ -801,24 +1154,124 @@ class InterpolateSpectrum():
         data = data.flatten()
         self._input = data
 
-        # get the required data for interpolation
+        # get the required data for interpolation. The components are
+        # stacked along the first dimension to interpolate all channels and
+        # components at once. The interpolation weights are real, i.e.,
+        # interpolating complex data separately interpolates the real and
+        # imaginary part
         if method == 'complex':
-            self._data = [np.real(data.freq), np.imag(data.freq)]
+            self._data = [data.freq]
         elif method == 'magnitude_phase':
             self._data = [np.abs(data.freq),
                           pf.dsp.phase(data, unwrap=True)]
         else:
             self._data = [np.abs(data.freq)]
+        self._data_stacked = np.concatenate(self._data)
 
         # frequencies for interpolation (store for testing)
         self._f_in = data.frequencies.copy()
 
+        # interpolation weights and their size in bytes per target length
+        # and sampling rate
+        self._weights = {}
+        self._weights_nbytes = {}
+
     def __call__(self, n_samples, sampling_rate, show=False):
         """
         Interpolate a Signal with n_samples length.
         (see class docstring) for more information.
         """
 
+        # interpolate the data
+        interpolated = self._interpolate(n_samples, sampling_rate)
+
+        return self._get_signal(interpolated, n_samples, sampling_rate, show)
+
+    def interpolate_lengths(self, n_samples, sampling_rate):
+        """
+        Interpolate Signals with different lengths at once.
+
+        The interpolation weights of all lengths are cached, which makes
+        repeated calls faster.
+
+        Parameters
+        ----------
+        n_samples : array like
+            Lengths of the interpolated time signals in samples.
+        sampling_rate : number, array like
+            Sampling rate of the output signals in Hz. Either a single value
+            that is used for all lengths or one value per length.
+
+        Returns
+        -------
+        signals : list
+            List of :py:class:`~pyfar.Signal` objects with one signal per
+            entry in `n_samples`.
+        """
+
+        n_samples = np.atleast_1d(n_samples)
+        if n_samples.ndim != 1:
+            raise ValueError("n_samples must be a number or 1D array like")
+        sampling_rate = np.broadcast_to(sampling_rate, n_samples.shape)
+
+        return [self._get_signal(self._interpolate(int(n), sr), int(n), sr)
+                for n, sr in zip(n_samples, sampling_rate)]
+
+    def _interpolate(self, n_samples, sampling_rate):
+        """
+        Interpolate the stacked data for an output Signal with `n_samples`
+        length and `sampling_rate`.
+        """
+
+        weights = self._get_weights(n_samples, sampling_rate)
+        if weights is not None:
+            return self._data_stacked @ weights
+
+        # interpolate the data directly if the weights are too large
+        interpolated = np.empty(
+            (self._data_stacked.shape[0], self._f_query.size),
+            dtype=self._data_stacked.dtype)
+        for idx, (k, ids) in enumerate(zip(self._kind, self._get_ranges())):
+            if not np.any(ids):
+                continue
+            fill_value = np.nan if idx == 1 else "extrapolate"
+            interpolated[:, ids] = interp1d(
+                self._f_base, self._data_stacked, k,
+                fill_value=fill_value)(self._f_query[ids])
+
+        return interpolated
+
+    def _get_ranges(self):
+        """
+        Get the output frequencies below, within, and above the input
+        frequencies.
+        """
+
+        # frequency range
+        self._freq_range = [self._f_base[0], self._f_base[-1]]
+
+        # get interpolation ranges
+        id_below = self._f_query < self._freq_range[0]
+        id_within = np.logical_and(self._f_query >= self._freq_range[0],
+                                   self._f_query <= self._freq_range[1])
+        id_above = self._f_query > self._freq_range[1]
+
+        return id_below, id_within, id_above
+
+    def _get_weights(self, n_samples, sampling_rate):
+        """
+        Get the interpolation weights for an output Signal with `n_samples`
+        length and `sampling_rate`.
+
+        All interpolation kinds are linear in the data. The interpolation can
+        thus be done by a matrix multiplication of the input data with the
+        weights of shape ``(n_in, n_fft)``. The weights are sparse if only
+        kinds that use the two neighboring input frequencies are required.
+        Otherwise, they are dense and ``None`` is returned if they would
+        exceed ``_MAX_DENSE_WEIGHTS`` elements. The weights are cached for
+        repeated calls.
+        """
+
         # length of half sided spectrum and highest frequency
         n_fft = n_samples//2 + 1
         f_max = sampling_rate / n_samples * (n_fft - 1)
@@ -832,41 +1285,73 @@ class InterpolateSpectrum():
             self._f_query = np.log10(np.arange(1, n_fft+1))
             self._f_base = np.log10(self._f_in / f_max * (n_fft - 1) + 1)
 
-        # frequency range
-        self._freq_range = [self._f_base[0], self._f_base[-1]]
+        key = (n_samples, sampling_rate)
+        if key in self._weights:
+            # move to the end to discard the least recently used weights
+            self._weights[key] = self._weights.pop(key)
+            return self._weights[key]
+
+        ranges = self._get_ranges()
+        n_in = self._f_base.size
+        if all(k in _LOCAL_KINDS
+               for k, ids in zip(self._kind, ranges) if np.any(ids)):
+            # interpolate two vectors that are one at the even and odd input
+            # frequencies. This yields the weights of the two neighboring
+            # input frequencies of each output frequency
+            parity = np.zeros((2, n_in))
+            parity[0, ::2] = 1
+            parity[1, 1::2] = 1
+            rows, cols, values = [], [], []
+            for idx, (k, ids) in enumerate(zip(self._kind, ranges)):
+                if not np.any(ids):
+                    continue
+                f_query = self._f_query[ids]
+                fill_value = np.nan if idx == 1 else "extrapolate"
+                values.append(interp1d(
+                    self._f_base, parity, k, fill_value=fill_value)(
+                        f_query).flatten())
+                lower = np.clip(
+                    np.searchsorted(self._f_base, f_query) - 1, 0, n_in - 2)
+                rows += [lower + lower % 2, lower + 1 - lower % 2]
+                cols += [np.flatnonzero(ids)] * 2
+            weights = sparse.csr_array(
+                (np.concatenate(values),
+                 (np.concatenate(rows), np.concatenate(cols))),
+                shape=(n_in, n_fft))
+            nbytes = weights.data.nbytes + weights.indices.nbytes + \
+                weights.indptr.nbytes
+        elif n_in * n_fft <= _MAX_DENSE_WEIGHTS:
+            # interpolate the identity to get the weights
+            identity = np.eye(n_in)
+            weights = np.empty((n_in, n_fft))
+            for idx, (k, ids) in enumerate(zip(self._kind, ranges)):
+                if not np.any(ids):
+                    continue
+                fill_value = np.nan if idx == 1 else "extrapolate"
+                weights[:, ids] = interp1d(
+                    self._f_base, identity, k, fill_value=fill_value)(
+                        self._f_query[ids])
+            nbytes = weights.nbytes
+        else:
+            return None
 
-        # get the interpolators
-        self._interpolators = []
-        for d in self._data:
-            interpolators = []
-            for idx, k in enumerate(self._kind):
-                if idx == 1:
-                    interpolators.append(interp1d(self._f_base, d, k))
-                else:
-                    interpolators.append(interp1d(
-                        self._f_base, d, k, fill_value="extrapolate"))
-            self._interpolators.append(interpolators)
+        # cache weights for a limited amount of memory
+        self._weights[key] = weights
+        self._weights_nbytes[key] = nbytes
+        while sum(self._weights_nbytes.values()) > _MAX_CACHED_WEIGHTS_BYTES:
+            oldest = next(iter(self._weights))
+            self._weights.pop(oldest)
+            self._weights_nbytes.pop(oldest)
 
-        # get interpolation ranges
-        id_below = self._f_query < self._freq_range[0]
-        id_within = np.logical_and(self._f_query >= self._freq_range[0],
-                                   self._f_query <= self._freq_range[1])
-        id_above = self._f_query > self._freq_range[1]
+        return weights
 
-        # interpolate the data
-        interpolated = []
-        for data in self._interpolators:
-            data_interpolated = np.concatenate((
-                (data[0](self._f_query[id_below])),
-                (data[1](self._f_query[id_within])),
-                (data[2](self._f_query[id_above]))),
-                axis=-1)
-            interpolated.append(data_interpolated)
+    def _get_signal(self, interpolated, n_samples, sampling_rate, show=False):
+        """Get the output Signal from the stacked interpolated data."""
+
+        interpolated = np.split(interpolated, len(self._data))
 
         # get half sided spectrum
-        if self._method == "complex":
-            freq = interpolated[0] + 1j * interpolated[1]
-        elif self._method == 'magnitude_phase':
+        if self._method == 'magnitude_phase':
             freq = interpolated[0] * np.exp(-1j * interpolated[1])
         else:
             freq = interpolated[0]
@@ -2,7 +2,7 @@
 Input and output module for pyfar.
 """
 
-from .io import (read, write,
+from .io import (read, write, list_contents, FarWriter,
                  read_sofa, convert_sofa,
                  read_audio, write_audio,
                  audio_subtypes, audio_formats, default_audio_subtype,
@@ -12,6 +12,8 @@ from .io import (read, write,
 __all__ = [
     'read',
     'write',
+    'list_contents',
+    'FarWriter',
     'read_sofa',
     'convert_sofa',
     'read_audio',
@@ -35,6 +35,20 @@ three basic encoding/decoding types:
         type-hint as a pair into the JSON-form
             [str, str] e.g. ['$ndarray', '/my_obj/_signal']
 
+Arrays that are written in chunks are split along the first axis into
+several zip-paths. This is done for large arrays if writing with compression
+and when appending channels with `io.FarWriter.append`. The zip-paths, the
+sizes of the chunks along the first axis, and the compression of the chunks
+are stored in the JSON-form
+            [str, dict] e.g. ['$ndarray_chunks',
+                              {'paths': ['/my_obj/_data/0', ...],
+                               'sizes': [100, ...],
+                               'compression': 'zlib'}]
+Compressed chunks are compressed with zlib and written to the zip-archive
+without further compression. This makes it possible to compress and
+decompress them in parallel (see `_write_ndarray_chunks`). Files containing
+`$ndarray_chunks` can not be read with pyfar versions up to 0.7.2.
+
 Numpy-types can be stored directly in the zipfile. In this case type hints,
 such as `$ndarray`, become the name of the node in the zipfile.
 
@@ -134,11 +148,56 @@ Names, Type Hints and Zippath
 import io
 import sys
 import json
+import time
+import zlib
+import struct
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from zipfile import ZipInfo, ZIP_STORED, ZIP64_LIMIT
 import numpy as np
 from copy import deepcopy
 
+# Alignment of uncompressed arrays in bytes. Aligned arrays can be memory
+# mapped without copying the data (see `_decode_ndarray`)
+_ALIGNMENT = 64
+# Header ID of the extra field that is used for padding zip members
+# (same as used by Android's zipalign)
+_PADDING_HEADER_ID = 0xD935
+# Size of the blocks in bytes in which arrays are written to the zipfile
+_BLOCK_SIZE = 2**24
+# Approximate size of chunks in bytes if writing large arrays with compression
+_CHUNK_SIZE = 2**22
+# Minimum number of compressed chunks that are processed in parallel threads
+_PARALLEL_MIN_CHUNKS = 4
+# Functions that read the header of the .npy format for each format version
+_NPY_HEADER_READERS = {(1, 0): np.lib.format.read_array_header_1_0,
+                       (2, 0): np.lib.format.read_array_header_2_0}
+
+# thread pool that is shared by all reads and writes (see _get_executor)
+_executor = None
+
+
+def _get_executor():
+    """Return a thread pool for compression that is created only once."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=multiprocessing.cpu_count())
+    return _executor
+
+
+def _map(func, n_chunks, items):
+    """
+    Apply `func` to all `items` of compressed chunks. This is done in parallel
+    threads if there are enough chunks to outweigh the overhead of the
+    threads.
+    """
+    if n_chunks >= _PARALLEL_MIN_CHUNKS and multiprocessing.cpu_count() > 1:
+        return _get_executor().map(func, items)
+    return map(func, items)
 
-def _decode(obj, zipfile):
+
+def _decode(obj, zipfile, mmap=False):
     """
     This function is exclusively used by `io.read` and enables recursive
     decoding for objects of varying depth.
@@ -150,18 +209,20 @@ def _decode(obj, zipfile):
     zipfile: zipfile-object
         The zipfile object is looped in the recursive structure
         e.g. to decode ndarrays when they occur.
+    mmap : bool
+        Memory map uncompressed ndarrays (see `_decode_ndarray`).
     """
     if isinstance(obj, dict):
         for key in obj.keys():
-            _inner_decode(obj, key, zipfile)
+            _inner_decode(obj, key, zipfile, mmap)
     elif isinstance(obj, (list, tuple, set, frozenset)):
         for i in range(0, len(obj)):
-            _inner_decode(obj, i, zipfile)
+            _inner_decode(obj, i, zipfile, mmap)
 
     return obj
 
 
-def _inner_decode(obj, key, zipfile):
+def _inner_decode(obj, key, zipfile, mmap=False):
     """
     This function is exclusively used by `_codec._encode` and casts the obj
     in case it was not JSON-serializable back into ther original type
@@ -180,17 +241,21 @@ def _inner_decode(obj, key, zipfile):
     zipfile: zipfile
         The zipfile object is looped in the recursive structure
         e.g. to encode ndarrays when they occur
+    mmap : bool
+        Memory map uncompressed ndarrays (see `_decode_ndarray`).
     """
     if not _is_type_hint(obj[key]):
-        _decode(obj[key], zipfile)
+        _decode(obj[key], zipfile, mmap)
     elif _is_pyfar_type(obj[key][0][1:]):
         PyfarType = _str_to_type(obj[key][0][1:])
         obj[key] = PyfarType._decode(obj[key][1])
-        _decode(obj[key].__dict__, zipfile)
+        _decode(obj[key].__dict__, zipfile, mmap)
     elif obj[key][0][1:] == 'dtype':
         obj[key] = getattr(np, obj[key][1])
     elif obj[key][0][1:] == 'ndarray':
-        obj[key] = _decode_ndarray(obj[key][1], zipfile)
+        obj[key] = _decode_ndarray(obj[key][1], zipfile, mmap)
+    elif obj[key][0][1:] == 'ndarray_chunks':
+        obj[key] = _decode_ndarray_chunks(obj[key][1], zipfile, mmap)
     elif obj[key][0][1:] == 'complex':
         obj[key] = complex(obj[key][1][0], obj[key][1][1])
     elif obj[key][0][1:] == 'tuple':
@@ -217,19 +282,172 @@ def _decode_numpy_scalar(obj, key):
         obj[key] = numpy_scalar(obj[key][1])
 
 
-def _decode_ndarray(obj, zipfile):
+def _decode_ndarray(obj, zipfile, mmap=False):
     """This function is exclusively used by `io._inner_decode` and
-    decodes `numpy.ndarrays` from a memfile.
+    decodes `numpy.ndarrays` from the zipfile.
+
+    If `mmap` is ``True`` and the array is stored without compression in a
+    zipfile that was opened from a file name, a copy-on-write
+    `numpy.memmap` is returned that reads the data from the file on access.
+    """
+    if mmap and zipfile.filename is not None and \
+            zipfile.getinfo(obj).compress_type == ZIP_STORED:
+        ndarray = _memmap_ndarray(zipfile.getinfo(obj), zipfile.filename)
+        if ndarray is not None:
+            return ndarray
+
+    # Numpy.load reads from the zip member without buffering it in memory
+    with zipfile.open(obj) as member:
+        return np.load(member, allow_pickle=False)
+
+
+def _memmap_ndarray(zinfo, filename):
+    """
+    Memory map an uncompressed `numpy.ndarray` from a zipfile.
+
+    Parameters
+    ----------
+    zinfo : zipfile.ZipInfo
+        The info of the zip member containing the array.
+    filename : str
+        The name of the zipfile.
+
+    Returns
+    -------
+    ndarray : numpy.memmap, None
+        The memory mapped array or ``None`` if the array can not be memory
+        mapped.
+    """
+    with open(filename, 'rb') as file:
+        # skip the local file header (it can differ from the central
+        # directory)
+        file.seek(zinfo.header_offset)
+        header = file.read(30)
+        if header[:4] != b'PK\x03\x04':
+            return None
+        n_name, n_extra = struct.unpack('<HH', header[26:])
+        file.seek(zinfo.header_offset + 30 + n_name + n_extra)
+
+        # read the header of the .npy format
+        version = np.lib.format.read_magic(file)
+        if version not in _NPY_HEADER_READERS:
+            return None
+        shape, fortran_order, dtype = _NPY_HEADER_READERS[version](file)
+        offset = file.tell()
+
+    if dtype.hasobject or not shape or 0 in shape:
+        return None
+
+    return np.memmap(filename, dtype=dtype, mode='c', offset=offset,
+                     shape=shape, order='F' if fortran_order else 'C')
+
+
+def _decode_ndarray_chunks(chunks, zipfile, mmap=False, index=None):
+    """
+    This function is exclusively used by `io._inner_decode` and decodes
+    `numpy.ndarrays` that were written in chunks by `_write_ndarray_chunks`.
+
+    Parameters
+    ----------
+    chunks : dict
+        The zip-paths, sizes, and compression of the chunks.
+    zipfile : zipfile
+        The zipfile from where we'd like to read data.
+    mmap : bool
+        Memory map uncompressed chunks (see `_decode_ndarray`).
+    index : slice, int, array like, optional
+        Index along the first axis of the array. Only the chunks that contain
+        the selected data are decoded. The default ``None`` decodes all
+        chunks.
+
+    Returns
+    -------
+    ndarray : numpy.ndarray
+        The concatenated chunks.
+    """
+    paths = chunks['paths']
+    sizes = np.asarray(chunks['sizes'], dtype=int)
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+
+    # find the chunks containing the selected data
+    if index is None:
+        selected = np.arange(len(paths))
+    else:
+        index = np.atleast_1d(np.arange(offsets[-1])[index])
+        chunk_index = np.searchsorted(offsets, index, side='right') - 1
+        selected = np.unique(chunk_index)
+        if not selected.size:
+            selected = np.zeros(1, dtype=int)
+
+    def decode_chunk(idx):
+        if chunks['compression'] == 'zlib':
+            return _buffer_ndarray(zlib.decompress(zipfile.read(paths[idx])))
+        return _decode_ndarray(paths[idx], zipfile, mmap)
+
+    # decompress in parallel. zlib releases the GIL. Uncompressed chunks are
+    # read directly
+    n_compressed = len(selected) if chunks['compression'] == 'zlib' else 0
+    ndarray = np.concatenate(list(_map(decode_chunk, n_compressed, selected)))
+
+    if index is not None:
+        # map the index to the concatenated chunks
+        starts = np.concatenate(([0], np.cumsum(sizes[selected])))
+        ndarray = ndarray[index - offsets[chunk_index] + starts[
+            np.searchsorted(selected, chunk_index)]]
+
+    return ndarray
+
+
+def _buffer_ndarray(buffer):
+    """
+    Return a read-only `numpy.ndarray` from bytes in the .npy format.
+
+    Other than `numpy.load`, the data is not copied. This saves a copy if the
+    array is concatenated with other arrays afterwards.
+    """
+    memfile = io.BytesIO(buffer)
+    version = np.lib.format.read_magic(memfile)
+    if version not in _NPY_HEADER_READERS:
+        return np.load(io.BytesIO(buffer), allow_pickle=False)
+    shape, fortran_order, dtype = _NPY_HEADER_READERS[version](memfile)
+    if dtype.hasobject:
+        return np.load(io.BytesIO(buffer), allow_pickle=False)
+
+    return np.frombuffer(
+        buffer, dtype=dtype, count=int(np.prod(shape)),
+        offset=memfile.tell()).reshape(
+            shape, order='F' if fortran_order else 'C')
+
+
+def _decode_ndarray_index(obj, zipfile, mmap=False, index=None):
+    """
+    Decode the part of an encoded `numpy.ndarray` selected by the index
+    along the first axis.
+
+    Parameters
+    ----------
+    obj : list
+        The type hint and reference of the array, e.g.,
+        ``['$ndarray', 'my_obj/_data']``.
+    zipfile : zipfile
+        The zipfile from where we'd like to read data.
+    mmap : bool
+        Memory map uncompressed arrays (see `_decode_ndarray`).
+    index : slice, int, array like
+        Index along the first axis of the array. An integer does not remove
+        the first axis.
     """
-    # Numpy.load is applied on a memory file instead of a physical file
-    memfile = io.BytesIO()
-    nd_bytes = zipfile.read(obj)
-    memfile.write(nd_bytes)
-    memfile.seek(0)
-    return np.load(memfile, allow_pickle=False)
+    if obj[0][1:] == 'ndarray_chunks':
+        return _decode_ndarray_chunks(obj[1], zipfile, mmap, index)
+
+    ndarray = _decode_ndarray(obj[1], zipfile, mmap)
+    if not isinstance(index, slice):
+        index = np.atleast_1d(index)
+    return ndarray[index]
 
 
-def _decode_object_json_aided(name, type_hint, zipfile):
+def _decode_object_json_aided(
+        name, type_hint, zipfile, mmap=False, channels=None):
     """
     Decodes composed objects with the help of JSON.
 
@@ -241,10 +459,20 @@ def _decode_object_json_aided(name, type_hint, zipfile):
         The object's type hint, starts with '$'.
     zipfile: zipfile
         The zipfile from where we'd like to read data.
+    mmap : bool
+        Memory map uncompressed ndarrays (see `_decode_ndarray`).
+    channels : slice, int, array like, optional
+        Index along the first dimension of the `cshape` of audio objects.
+        Only the selected channels are decoded. The default ``None`` decodes
+        all channels.
     """
     json_str = zipfile.read(f'{name}/{type_hint}').decode('UTF-8')
     obj_dict_encoded = json.loads(json_str)
-    obj_dict = _decode(obj_dict_encoded, zipfile)
+    if channels is not None and \
+            type_hint[1:] in ['Signal', 'TimeData', 'FrequencyData']:
+        obj_dict_encoded['_data'] = _decode_ndarray_index(
+            obj_dict_encoded['_data'], zipfile, mmap, channels)
+    obj_dict = _decode(obj_dict_encoded, zipfile, mmap)
     ObjType = _str_to_type(type_hint[1:])
     try:
         return ObjType._decode(obj_dict)
@@ -316,8 +544,7 @@ def _inner_encode(obj, key, zip_path, zipfile):
     if _is_dtype(obj[key]):
         obj[key] = ['$dtype', obj[key].__name__]
     elif isinstance(obj[key], np.ndarray):
-        zipfile.writestr(zip_path, _encode_ndarray(obj[key]))
-        obj[key] = ['$ndarray', zip_path]
+        obj[key] = _write_ndarray(obj[key], zip_path, zipfile)
     elif _is_pyfar_type(obj[key]):
         obj[key] = [f'${type(obj[key]).__name__}', obj[key]._encode()]
         _encode(obj[key][1], zip_path, zipfile)
@@ -345,18 +572,152 @@ def _encode_ndarray(ndarray):
 
     Returns
     -------
-    bytes : bytes
-        The bytes that were written by `numpy.save` into a memfile.
+    header : bytes
+        The header of the .npy format as written by `numpy.save`.
+    data : numpy.array
+        A flat `numpy.uint8` view of the array data that follows the header.
+        The array data is only copied if it is not contiguous.
 
     Note
     ----
     * Do not allow pickling. It is not safe!
     """
-    # `Numpy.save` is applied on a memory file instead of a physical file
-    memfile = io.BytesIO()
-    np.save(memfile, ndarray, allow_pickle=False)
-    memfile.seek(0)
-    return memfile.read()
+    if ndarray.dtype.hasobject:
+        raise ValueError("Object arrays cannot be saved without pickling.")
+
+    # header is written to a memory file, the data is returned as it is
+    header = io.BytesIO()
+    header_data = np.lib.format.header_data_from_array_1_0(ndarray)
+    try:
+        np.lib.format.write_array_header_1_0(header, header_data)
+    except ValueError:
+        # version 2.0 is required for very large headers
+        header = io.BytesIO()
+        np.lib.format.write_array_header_2_0(header, header_data)
+
+    if header_data['fortran_order']:
+        ndarray = ndarray.T
+    data = np.ascontiguousarray(ndarray).reshape(-1).view(np.uint8)
+
+    return header.getvalue(), data
+
+
+def _write_ndarray(ndarray, zip_path, zipfile, chunks=True):
+    """
+    Write an encoded `numpy.ndarray` to the zipfile.
+
+    The data is written in blocks directly to the zipfile to avoid copying
+    large arrays in memory.
+    Uncompressed arrays are aligned to `_ALIGNMENT` bytes within the file by
+    padding the extra field of the local file header. This makes it possible
+    to memory map them when reading (see `_decode_ndarray`). The header of
+    the .npy format is already padded to a multiple of 64 bytes by numpy.
+
+    Parameters
+    ----------
+    ndarray: numpy.array
+        The numpy array that should be written.
+    zip_path: str
+        The path of the array inside the zipfile.
+    zipfile: zipfile
+        The zipfile where we'd like to write data.
+    chunks : bool
+        Write arrays with at least two dimensions that are larger than
+        `_CHUNK_SIZE` in chunks if the zipfile uses compression (see
+        `_write_ndarray_chunks`). The default is ``True``.
+
+    Returns
+    -------
+    reference : list
+        The type hint and reference to the array, i.e.,
+        ``['$ndarray', zip_path]`` or ``['$ndarray_chunks', chunks]``.
+    """
+    if chunks and zipfile.compression != ZIP_STORED and \
+            ndarray.ndim > 1 and ndarray.nbytes > _CHUNK_SIZE:
+        return ['$ndarray_chunks',
+                _write_ndarray_chunks(ndarray, zip_path, zipfile)]
+
+    header, data = _encode_ndarray(ndarray)
+
+    zinfo = ZipInfo(zip_path, date_time=time.localtime(time.time())[:6])
+    zinfo.compress_type = zipfile.compression
+    zinfo.external_attr = 0o600 << 16
+    # zipfile uses the size to decide if Zip64 extensions are required
+    zinfo.file_size = len(header) + data.size
+
+    if zinfo.compress_type == ZIP_STORED:
+        # size of the local file header without extra field. zipfile adds a
+        # Zip64 extra field of 20 bytes for large members.
+        header_size = 30 + len(zip_path.encode('utf-8'))
+        if zinfo.file_size * 1.05 > ZIP64_LIMIT:
+            header_size += 20
+        # the extra field requires a header of 4 bytes
+        padding = -(zipfile.start_dir + header_size) % _ALIGNMENT
+        if padding < 4:
+            padding += _ALIGNMENT
+        zinfo.extra = struct.pack('<HH', _PADDING_HEADER_ID, padding - 4) + \
+            bytes(padding - 4)
+
+    with zipfile.open(zinfo, 'w') as member:
+        member.write(header)
+        for start in range(0, data.size, _BLOCK_SIZE):
+            member.write(data[start:start + _BLOCK_SIZE])
+
+    return ['$ndarray', zip_path]
+
+
+def _write_ndarray_chunks(ndarray, zip_path, zipfile, start=0):
+    """
+    Write an encoded `numpy.ndarray` in chunks to the zipfile.
+
+    The array is split along the first axis. If the zipfile uses compression,
+    the array is split into chunks of about `_CHUNK_SIZE` bytes that are
+    compressed with zlib in parallel and written to the zipfile without
+    further compression. Otherwise, the array is written as a single chunk.
+
+    Parameters
+    ----------
+    ndarray: numpy.array
+        The numpy array that should be written.
+    zip_path: str
+        The chunks are written to `zip_path/0`, `zip_path/1`, etc.
+    zipfile: zipfile
+        The zipfile where we'd like to write data.
+    start : int
+        The number of the first chunk. The default is ``0``.
+
+    Returns
+    -------
+    chunks : dict
+        The zip-paths, sizes, and compression of the chunks.
+    """
+    ndarray = np.atleast_1d(ndarray)
+    compress = zipfile.compression != ZIP_STORED
+
+    n_chunks = int(np.ceil(ndarray.nbytes / _CHUNK_SIZE)) if compress else 1
+    n_chunks = min(max(n_chunks, 1), max(ndarray.shape[0], 1))
+    edges = np.linspace(0, ndarray.shape[0], n_chunks + 1).astype(int)
+    chunks = {
+        'paths': [f'{zip_path}/{start + idx}' for idx in range(n_chunks)],
+        'sizes': np.diff(edges).tolist(),
+        'compression': 'zlib' if compress else None}
+
+    if not compress:
+        _write_ndarray(ndarray, chunks['paths'][0], zipfile, chunks=False)
+        return chunks
+
+    def compress_chunk(idx):
+        header, data = _encode_ndarray(ndarray[edges[idx]:edges[idx + 1]])
+        compressor = zlib.compressobj()
+        return compressor.compress(header) + compressor.compress(data) + \
+            compressor.flush()
+
+    # compress in parallel. zlib releases the GIL.
+    compressed = _map(compress_chunk, n_chunks, range(n_chunks))
+    for path, data in zip(chunks['paths'], compressed):
+        zipfile.writestr(path, data, compress_type=ZIP_STORED)
+
+    return chunks
 
 
 def _encode_object_json_aided(obj, name, zipfile):
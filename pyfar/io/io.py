@@ -10,12 +10,14 @@ data stored in a SOFA file.
 """
 import os.path
 import pathlib
+import uuid
+from collections.abc import Mapping
 
 import warnings
 import pyfar as pf
 import sofar as sf
 import zipfile
-import io
+import json
 import numpy as np
 import re
 
@@ -32,6 +34,7 @@ except (ModuleNotFoundError, OSError):
 from pyfar import Signal, FrequencyData, Coordinates, TimeData
 from . import _codec as codec
 import pyfar.classes.filter as fo
+from pyfar._utils import rename_arg
 
 
 def read_sofa(filename, verify=True, verbose=True):
@@ -201,7 +204,7 @@ def _sofa_pos(pos_type, coordinates):
             )
 
 
-def read(filename):
+def read(filename, names=None, lazy=False, mmap=False, channels=None):
     """
     Read any compatible pyfar object or numpy array (.far file) from disk.
 
@@ -209,12 +212,43 @@ def read(filename):
     ----------
     filename : string, Path
         Input file. If no extension is provided, .far-suffix is added.
+    names : list of strings, optional
+        Names of the objects that are read. Only these objects are decoded,
+        which is faster and requires less memory if a file contains many
+        large objects. Use :py:func:`list_contents` to get the names of all
+        objects in a file. The default ``None`` reads all objects.
+    lazy : bool, optional
+        If ``True``, the objects are not read when calling this function
+        but when they are accessed for the first time. The default is
+        ``False``.
+    mmap : bool, optional
+        If ``True``, numpy arrays that were written without compression are
+        memory mapped instead of being read into memory. This includes the
+        data of pyfar objects, e.g., of :py:class:`~pyfar.Signal` and
+        :py:class:`~pyfar.Coordinates`. Data is only read from the file when
+        it is accessed, which makes it possible to quickly open very large
+        files. Changing the data does not change the file (copy-on-write).
+        Arrays written with compression are read into memory. The default is
+        ``False``.
+    channels : slice, int, array like, optional
+        Read only the selected channels of audio objects, i.e.,
+        :py:class:`~pyfar.Signal`, :py:class:`~pyfar.TimeData`, and
+        :py:class:`~pyfar.FrequencyData`. The channels are selected along the
+        first dimension of the `cshape`, e.g., ``channels=slice(100, 200)``
+        is equivalent to ``signal[100:200]``. Large data written with
+        compression is stored in chunks and only the chunks that contain the
+        selected channels are decompressed. Other objects are not affected.
+        The default ``None`` reads all channels.
 
     Returns
     -------
     collection: dict
         Contains pyfar objects like
-        ``{ 'name1': 'obj1', 'name2': 'obj2' ... }``.
+        ``{ 'name1': 'obj1', 'name2': 'obj2' ... }``. If `lazy` is ``True``
+        this is a read-only dict-like object that decodes and stores the
+        objects on first access. The file must not be changed or deleted
+        before all required objects were accessed in this case. The same
+        applies to memory mapped data if `mmap` is ``True``.
 
     Examples
     --------
@@ -223,70 +257,206 @@ def read(filename):
     >>> collection = pyfar.read('my_objs.far')
     >>> my_signal = collection['my_signal']
     >>> my_orientations = collection['my_orientations']
+
+    Read only the signal
+
+    >>> my_signal = pyfar.read('my_objs.far', names=['my_signal'])['my_signal']
+
+    Memory map the data instead of reading it
+
+    >>> collection = pyfar.read('my_objs.far', mmap=True)
+
+    Read only the channels 100 to 199 of the signal
+
+    >>> my_signal = pyfar.read(
+    ...     'my_objs.far', names=['my_signal'],
+    ...     channels=slice(100, 200))['my_signal']
     """
     # Check for .far file extension
     filename = pathlib.Path(filename).with_suffix('.far')
 
-    collection = {}
-    pyfar_version = None
-    with open(filename, 'rb') as f:
-        zip_buffer = io.BytesIO()
-        zip_buffer.write(f.read())
-        with zipfile.ZipFile(zip_buffer) as zip_file:
-            zip_paths = zip_file.namelist()
-            obj_names_hints = [
-                path.split('/')[:2] for path in zip_paths if '/$' in path]
-
-            # read build in data and look for pyfar version
-            for name, hint in obj_names_hints:
-                if hint[1:] != 'BuiltinsWrapper':
-                    continue
-                obj = codec._decode_object_json_aided(name, hint, zip_file)
-                if 'pyfar.__version__' in obj:
-                    pyfar_version = obj['pyfar.__version__']
-                    del obj['pyfar.__version__']
-                if obj:
-                    collection[name] = obj
-
-            # check version (writing the version was introduced in 0.5.3)
-            if pyfar_version is None:
-                pyfar_version = "<0.5.3"
-
-            # read remaining data (pyfar objects and numpy arrays)
-            for name, hint in obj_names_hints:
-                if hint[1:] == 'BuiltinsWrapper':
-                    continue
-                try:
-                    if codec._is_pyfar_type(hint[1:]):
-                        obj = codec._decode_object_json_aided(
-                            name, hint, zip_file)
-                    elif hint == '$ndarray':
-                        obj = codec._decode_ndarray(f'{name}/{hint}', zip_file)
-                    else:
-                        raise TypeError((
-                            '.far-file contains unknown types. This might '
-                            'occur when writing and reading files with '
-                            'different versions of Pyfar.'))
-                    collection[name] = obj
-                except Exception as e:  # noqa
-                    # check for more specific pyfar errors that could be raised
-                    if "You must implement" in str(e) and \
-                            ("encode" in str(e) or "decode" in str(e)):
-                        raise e
-                    # raise general error with version hint
-                    raise TypeError((
-                        f"'{name}' object in {filename} was written with "
-                        f"pyfar {pyfar_version} and could not be read with "
-                        f"pyfar {pf.__version__}.")) from e
-
-        if 'builtin_wrapper' in collection:
-            for key, value in collection['builtin_wrapper'].items():
-                collection[key] = value
-            collection.pop('builtin_wrapper')
+    if lazy:
+        return _LazyCollection(filename, names, mmap, channels)
+
+    # the archive is read from the file and not buffered to read only the
+    # required data
+    with zipfile.ZipFile(filename) as zip_file:
+        collection, obj_names_hints, pyfar_version = _read_far_directory(
+            zip_file, filename, names)
+
+        # read remaining data (pyfar objects and numpy arrays)
+        for name, hint in obj_names_hints.items():
+            collection[name] = _read_far_object(
+                zip_file, filename, name, hint, pyfar_version, mmap, channels)
 
     return collection
 
 
+def list_contents(filename):
+    """
+    List the objects contained in a .far file without reading them.
+
+    Parameters
+    ----------
+    filename : string, Path
+        Input file. If no extension is provided, .far-suffix is added.
+
+    Returns
+    -------
+    contents : dict
+        The names of the objects are the keys and their types are the values,
+        e.g., ``{'my_signal': 'Signal', 'my_array': 'ndarray', 'n': 'int'}``.
+
+    Examples
+    --------
+    >>> pyfar.io.list_contents('my_objs.far')
+    """
+    # Check for .far file extension
+    filename = pathlib.Path(filename).with_suffix('.far')
+
+    with zipfile.ZipFile(filename) as zip_file:
+        builtins, obj_names_hints, _ = _read_far_directory(
+            zip_file, filename)
+
+    contents = {name: type(obj).__name__ for name, obj in builtins.items()}
+    for name, hint in obj_names_hints.items():
+        contents[name] = hint[1:]
+
+    return contents
+
+
+def _read_far_directory(zip_file, filename, names=None):
+    """
+    Read the builtins and the pyfar version and get the names and type hints
+    of all remaining objects from the directory of a .far file.
+
+    Parameters
+    ----------
+    zip_file : zipfile.ZipFile
+        The opened .far file.
+    filename : Path
+        The name of the file used in error messages.
+    names : list of strings, optional
+        Names of the objects that are returned. The default ``None`` returns
+        all objects.
+
+    Returns
+    -------
+    builtins : dict
+        The builtins contained in the file.
+    obj_names_hints : dict
+        The names of the remaining objects as keys and their type hints as
+        values.
+    pyfar_version : str
+        The version of pyfar that was used to write the file.
+    """
+    obj_names_hints = dict(
+        path.split('/')[:2] for path in zip_file.namelist() if '/$' in path)
+
+    # read build in data and look for pyfar version
+    builtins = {}
+    pyfar_version = None
+    for name, hint in obj_names_hints.items():
+        if hint[1:] != 'BuiltinsWrapper':
+            continue
+        obj = codec._decode_object_json_aided(name, hint, zip_file)
+        if 'pyfar.__version__' in obj:
+            pyfar_version = obj['pyfar.__version__']
+            del obj['pyfar.__version__']
+        if name == 'builtin_wrapper':
+            builtins.update(obj)
+        elif obj:
+            builtins[name] = obj
+    obj_names_hints = {name: hint for name, hint in obj_names_hints.items()
+                       if hint[1:] != 'BuiltinsWrapper'}
+
+    # check version (writing the version was introduced in 0.5.3)
+    if pyfar_version is None:
+        pyfar_version = "<0.5.3"
+
+    # select requested objects
+    if names is not None:
+        if isinstance(names, str):
+            names = [names]
+        for name in names:
+            if name not in builtins and name not in obj_names_hints:
+                raise ValueError(f"'{name}' is not contained in {filename}")
+        builtins = {
+            name: obj for name, obj in builtins.items() if name in names}
+        obj_names_hints = {
+            name: hint for name, hint in obj_names_hints.items()
+            if name in names}
+
+    return builtins, obj_names_hints, pyfar_version
+
+
+def _read_far_object(
+        zip_file, filename, name, hint, pyfar_version, mmap=False,
+        channels=None):
+    """Decode a pyfar object or numpy array from an opened .far file."""
+    try:
+        if codec._is_pyfar_type(hint[1:]):
+            obj = codec._decode_object_json_aided(
+                name, hint, zip_file, mmap, channels)
+        elif hint == '$ndarray':
+            obj = codec._decode_ndarray(f'{name}/{hint}', zip_file, mmap)
+        else:
+            raise TypeError((
+                '.far-file contains unknown types. This might '
+                'occur when writing and reading files with '
+                'different versions of Pyfar.'))
+    except Exception as e:  # noqa
+        # check for more specific pyfar errors that could be raised
+        if "You must implement" in str(e) and \
+                ("encode" in str(e) or "decode" in str(e)):
+            raise e
+        # raise general error with version hint
+        raise TypeError((
+            f"'{name}' object in {filename} was written with "
+            f"pyfar {pyfar_version} and could not be read with "
+            f"pyfar {pf.__version__}.")) from e
+
+    return obj
+
+
+class _LazyCollection(Mapping):
+    """
+    Read-only dict-like collection of the objects in a .far file that are
+    decoded on first access. See :py:func:`read`.
+    """
+
+    def __init__(self, filename, names=None, mmap=False, channels=None):
+        self._filename = filename
+        self._mmap = mmap
+        self._channels = channels
+        with zipfile.ZipFile(filename) as zip_file:
+            self._objs, self._obj_names_hints, self._pyfar_version = \
+                _read_far_directory(zip_file, filename, names)
+        self._names = list(self._objs) + list(self._obj_names_hints)
+
+    def __getitem__(self, name):
+        if name not in self._objs:
+            if name not in self._obj_names_hints:
+                raise KeyError(name)
+            with zipfile.ZipFile(self._filename) as zip_file:
+                self._objs[name] = _read_far_object(
+                    zip_file, self._filename, name,
+                    self._obj_names_hints[name], self._pyfar_version,
+                    self._mmap, self._channels)
+        return self._objs[name]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __repr__(self):
+        loaded = [name for name in self._names if name in self._objs]
+        return (f"lazy collection of {len(self)} objects from "
+                f"{self._filename} ({len(loaded)} loaded): {self._names}")
+
+
 def write(filename, compress=False, **objs):
     """
     Write any compatible pyfar object or numpy array and often used builtin
@@ -300,7 +470,11 @@ def write(filename, compress=False, **objs):
     compress : bool
         Default is ``False`` (uncompressed).
         Compressed files take less disk space but need more time for writing
-        and reading.
+        and reading. Large multi-channel data is split into chunks that are
+        compressed in parallel and can be read separately (see
+        :py:func:`read`). Files with chunked data can not be read with pyfar
+        versions up to 0.7.2. Numpy arrays in uncompressed files are stored
+        aligned to 64 bytes and can be memory mapped when reading.
     **objs:
         Objects to be saved as key-value arguments, e.g.,
         ``name1=object1, name2=object2``.
@@ -321,33 +495,199 @@ def write(filename, compress=False, **objs):
     """
     # Check for .far file extension
     filename = pathlib.Path(filename).with_suffix('.far')
-    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
-    zip_buffer = io.BytesIO()
-    builtin_wrapper = codec.BuiltinsWrapper()
-    with zipfile.ZipFile(zip_buffer, "a", compression) as zip_file:
-        # write pyfar version
-        builtin_wrapper["pyfar.__version__"] = pf.__version__
-        # write requested data
+    with FarWriter(filename, compress) as writer:
         for name, obj in objs.items():
-            if codec._is_pyfar_type(obj):
-                codec._encode_object_json_aided(obj, name, zip_file)
-            elif codec._is_numpy_type(obj):
-                codec._encode({f'${type(obj).__name__}': obj}, name, zip_file)
-            elif type(obj) in codec._supported_builtin_types():
-                builtin_wrapper[name] = obj
-            else:
-                error = (
-                    f'Objects of type {type(obj)} cannot be written to disk.')
-                if isinstance(obj, fo.Filter):
-                    error = f'{error}. Consider casting to {fo.Filter}'
-                raise TypeError(error)
-
-        if len(builtin_wrapper) > 0:
+            writer.add(name, obj)
+
+
+class FarWriter():
+    """
+    Write objects to a .far file one after another.
+
+    Other than :py:func:`write`, the objects are directly written to the file
+    when they are added. This requires less memory when writing large data
+    and makes it possible to append channels to a :py:class:`~pyfar.Signal`
+    during long measurements. The file can be read with :py:func:`read`
+    after the writer was closed. Files with appended Signals can not be read
+    with pyfar versions up to 0.7.2.
+
+    Parameters
+    ----------
+    filename : string, Path
+        Full path or filename. If now extension is provided, .far-suffix
+        will be add to filename. An existing file is overwritten when the
+        writer is closed. If an error occurs inside the context manager, the
+        existing file is kept and no file is written.
+    compress : bool
+        Default is ``False`` (uncompressed). See :py:func:`write`.
+
+    Examples
+    --------
+    Write objects to a file and append the channels of a Signal that are
+    recorded one after another
+
+    >>> import pyfar as pf
+    >>> with pf.io.FarWriter('my_objs.far') as writer:
+    ...     writer.add('comment', 'noise recorded in 26 channels')
+    ...     for _ in range(26):
+    ...         recording = pf.signals.noise(1024)
+    ...         writer.append('recordings', recording)
+    >>> recordings = pf.io.read('my_objs.far')['recordings']
+    >>> recordings.cshape
+    (26,)
+    """
+
+    def __init__(self, filename, compress=False):
+        """Open the file for writing."""
+        self._filename = pathlib.Path(filename).with_suffix('.far')
+        # write to a temporary file in the same directory that replaces the
+        # target only if all objects were written. This keeps existing files
+        # if writing fails and does not leave incomplete files
+        self._temporary = self._filename.with_name(
+            f'.{self._filename.stem}.{uuid.uuid4().hex}.far')
+        compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        self._zip_file = zipfile.ZipFile(self._temporary, 'w', compression)
+        self._builtin_wrapper = codec.BuiltinsWrapper()
+        # write pyfar version
+        self._builtin_wrapper["pyfar.__version__"] = pf.__version__
+        self._names = set()
+        # encoded objects, meta data and zip paths of appended chunks
+        self._appended = {}
+
+    def __enter__(self):
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the file or discard it if an error occurred."""
+        if exc_type is None:
+            self.close()
+        else:
+            self._discard()
+
+    @property
+    def filename(self):
+        """The name of the file."""
+        return self._filename
+
+    def add(self, name, obj):
+        """
+        Write an object to the file.
+
+        Parameters
+        ----------
+        name : str
+            The name of the object. Must be unique within the file.
+        obj : any
+            Any object that can be written with :py:func:`write`.
+        """
+        self._check_name(name)
+
+        if codec._is_pyfar_type(obj):
+            codec._encode_object_json_aided(obj, name, self._zip_file)
+        elif isinstance(obj, np.ndarray):
+            # read expects a single zip-path for arrays
+            codec._write_ndarray(
+                obj, f'{name}/$ndarray', self._zip_file, chunks=False)
+        elif codec._is_numpy_type(obj):
+            codec._encode(
+                {f'${type(obj).__name__}': obj}, name, self._zip_file)
+        elif type(obj) in codec._supported_builtin_types():
+            self._builtin_wrapper[name] = obj
+        else:
+            error = (
+                f'Objects of type {type(obj)} cannot be written to disk.')
+            if isinstance(obj, fo.Filter):
+                error = f'{error}. Consider casting to {fo.Filter}'
+            raise TypeError(error)
+
+        self._names.add(name)
+
+    def append(self, name, signal):
+        """
+        Append the channels of a Signal to a Signal in the file.
+
+        The data of the Signal is directly written to the file. The Signal
+        is stored with the meta data of the first Signal that is appended.
+        The channels are concatenated along the first dimension of the
+        `cshape` when reading the file.
+
+        Parameters
+        ----------
+        name : str
+            The name of the Signal in the file. A new Signal is added to the
+            file in the first call with a name that was not used before.
+        signal : Signal
+            The Signal whose channels are appended. The `sampling_rate`,
+            `n_samples`, `fft_norm`, `complex` flag, `dtype` and `cshape[1:]`
+            must be the same for all appended Signals.
+        """
+        if not isinstance(signal, Signal):
+            raise TypeError(
+                f'Only Signal objects can be appended but {name} is of type '
+                f'{type(signal)}')
+
+        meta = (signal.sampling_rate, signal.n_samples, signal.fft_norm,
+                signal.complex, signal.dtype, signal.cshape[1:])
+
+        if name not in self._appended:
+            self._check_name(name)
+            # encode the meta data, the data is written in chunks
+            obj_dict = signal._encode()
+            data = obj_dict['_data']
+            obj_dict['_data'] = None
+            obj_dict = codec._encode(obj_dict, name, self._zip_file)
+            self._appended[name] = (
+                obj_dict, meta, {'paths': [], 'sizes': []})
+            self._names.add(name)
+        else:
+            if meta != self._appended[name][1]:
+                raise ValueError(
+                    f"The sampling_rate, n_samples, fft_norm, complex flag, "
+                    f"dtype, and cshape[1:] of Signals appended to '{name}' "
+                    "must match")
+            data = signal._encode()['_data']
+
+        chunks = self._appended[name][2]
+        new_chunks = codec._write_ndarray_chunks(
+            data, f'{name}/_data', self._zip_file, len(chunks['paths']))
+        chunks['paths'] += new_chunks['paths']
+        chunks['sizes'] += new_chunks['sizes']
+        chunks['compression'] = new_chunks['compression']
+
+    def close(self):
+        """
+        Finish writing the file.
+
+        This is called when leaving the context manager.
+        """
+        if self._zip_file.fp is None:
+            return
+
+        try:
+            # write the appended Signals that reference all chunks
+            for name, (obj_dict, _, chunks) in self._appended.items():
+                obj_dict['_data'] = ['$ndarray_chunks', chunks]
+                self._zip_file.writestr(
+                    f'{name}/$Signal', json.dumps(obj_dict))
+
             codec._encode_object_json_aided(
-                builtin_wrapper, 'builtin_wrapper', zip_file)
+                self._builtin_wrapper, 'builtin_wrapper', self._zip_file)
+            self._zip_file.close()
+            self._temporary.replace(self._filename)
+        except Exception:
+            self._discard()
+            raise
+
+    def _discard(self):
+        """Close and delete the temporary file without writing the file."""
+        self._zip_file.close()
+        self._temporary.unlink(missing_ok=True)
 
-    with open(filename, 'wb') as f:
-        f.write(zip_buffer.getvalue())
+    def _check_name(self, name):
+        """Raise an error if the name was already used."""
+        if name in self._names:
+            raise ValueError(f"An object named '{name}' was already written")
 
 
 def read_audio(filename, dtype='float64', **kwargs):
@@ -508,7 +848,7 @@ def audio_formats():
     return soundfile.available_formats()
 
 
-@pf._utils.rename_arg(
+@rename_arg(
         {"format" : "audio_format"},
         "'format' will be deprecated in "
         "pyfar 0.9.0 in favor of 'audio_format'")
@@ -540,7 +880,7 @@ def audio_subtypes(audio_format=None):
     return soundfile.available_subtypes(format=audio_format)
 
 
-@pf._utils.rename_arg(
+@rename_arg(
         {"format" : "audio_format"},
         "'format' will be deprecated in "
         "pyfar 0.9.0 in favor of 'audio_format'")
@@ -146,7 +146,8 @@ class PlotParameter(object):
                  colorbar=True,
                  orientation='vertical', indices=None,     # 2D plots
                  method='pcolormesh',
-                 mode='real', side='right'):               # complex audio data
+                 mode='real', side='right',                # complex audio data
+                 decimate='auto'):                         # long time data
 
         # set plot type
         self._plot_type = ['line', '2d']
@@ -174,6 +175,7 @@ class PlotParameter(object):
         self.method = method
         self.mode = mode
         self.side = side
+        self.decimate = decimate
 
         # set axis types based on `plot`
         self.update(plot)
@@ -831,7 +833,8 @@ class Interaction(object):
                     self.all_axes = self.ax = _line._time(
                         self.signal, prm.dB_time, prm.log_prefix_time,
                         prm.log_reference, prm.unit_time, self.ax,
-                        mode=prm.mode, **self.kwargs_line)
+                        mode=prm.mode, decimate=prm.decimate,
+                        **self.kwargs_line)
                 elif self.params.plot_type == "2d":
                     self.params.update('time_2d')
                     self.all_axes, _, self.all_bars = _two_d._time_2d(
@@ -902,7 +905,8 @@ class Interaction(object):
                         self.signal, prm.dB_time, prm.dB_freq,
                         prm.log_prefix_time, prm.log_prefix_freq,
                         prm.log_reference, prm.xscale, prm.unit_time, self.ax,
-                        mode=prm.mode, side=prm.side, **self.kwargs_line)
+                        mode=prm.mode, side=prm.side, decimate=prm.decimate,
+                        **self.kwargs_line)
                     self.ax = self.all_axes[0]
                 elif self.params.plot_type == "2d":
                     self.params.update('time_freq_2d')
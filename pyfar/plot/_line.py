@@ -9,15 +9,22 @@ from .ticker import (
     MultipleFractionFormatter)
 from matplotlib.ticker import NullFormatter
 
+#: Number of samples above which time plots are decimated if
+#: ``decimate='auto'``.
+_DECIMATION_THRESHOLD = 100_000
+
 
 def _time(signal, dB=False, log_prefix=20, log_reference=1, unit="s",
-          ax=None, mode='real', **kwargs):
+          ax=None, mode='real', decimate='auto', **kwargs):
     """Plot the time data of a signal."""
 
     # check input
     if not isinstance(signal, (Signal, TimeData)):
         raise TypeError('Input data has to be of type: Signal or TimeData.')
     _utils._check_time_unit(unit)
+    if decimate not in ['auto', True, False]:
+        raise ValueError(
+            f"decimate is {decimate} but must be 'auto', True, or False.")
 
     # prepare input
     kwargs = _utils._return_default_colors_rgb(**kwargs)
@@ -32,14 +39,16 @@ def _time(signal, dB=False, log_prefix=20, log_reference=1, unit="s",
     data, y_label = _utils._assert_and_match_data_to_mode(data, signal, mode)
 
     # auto detect the time unit
+    times = signal.times
     if unit in [None, "auto"]:
-        unit = _utils._time_auto_unit(signal.times[..., -1])
+        unit = _utils._time_auto_unit(times[..., -1])
     # set the unit
     if unit == 'samples':
         times = np.arange(signal.n_samples)
     else:
         factor, unit = _utils._deal_time_units(unit)
-        times = signal.times * factor
+        if factor != 1:
+            times = times * factor
 
     # prepare figure
     _, ax = _utils._prepare_plot(ax)
@@ -53,11 +62,38 @@ def _time(signal, dB=False, log_prefix=20, log_reference=1, unit="s",
                       ax.get_xlim())
 
     # plot data
-    ax.plot(times, data, **kwargs)
+    if decimate == 'auto':
+        decimate = signal.n_samples > _DECIMATION_THRESHOLD
+    if decimate:
+        _plot_decimated(ax, times, data, **kwargs)
+    else:
+        ax.plot(times, data, **kwargs)
 
     return ax
 
 
+def _plot_decimated(ax, times, data, **kwargs):
+    """
+    Plot the min/max envelope of the data with one bin per pixel of the axes
+    width and recompute it for the visible time range whenever the x-limits
+    change, e.g., when zooming or panning.
+    """
+
+    def n_bins():
+        return ax.get_window_extent().width
+
+    lines = ax.plot(*_utils._min_max_decimation(
+        times, data, (times[0], times[-1]), n_bins()), **kwargs)
+
+    def update(ax):
+        times_decimated, data_decimated = _utils._min_max_decimation(
+            times, data, ax.get_xlim(), n_bins())
+        for line, line_data in zip(lines, data_decimated.T):
+            line.set_data(times_decimated, line_data)
+
+    ax.callbacks.connect('xlim_changed', update)
+
+
 def _freq(signal, dB=True, log_prefix=None, log_reference=1, freq_scale='log',
           ax=None, side='right', **kwargs):
     """
@@ -259,7 +295,7 @@ def _group_delay(signal, unit="s", freq_scale='log', ax=None, side='right',
 def _time_freq(signal, dB_time=False, dB_freq=True, log_prefix_time=20,
                log_prefix_freq=None, log_reference=1, freq_scale='log',
                unit="s", ax=None, side='right', mode='real',
-               **kwargs):
+               decimate='auto', **kwargs):
     """
     Plot the time signal and magnitude spectrum in a 2 by 1 subplot layout.
     """
@@ -268,7 +304,7 @@ def _time_freq(signal, dB_time=False, dB_freq=True, log_prefix_time=20,
     kwargs = _utils._return_default_colors_rgb(**kwargs)
 
     _time(signal, dB_time, log_prefix_time, log_reference, unit, ax[0],
-          mode, **kwargs)
+          mode, decimate, **kwargs)
     _freq(signal, dB_freq, log_prefix_freq, log_reference, freq_scale, ax[1],
           side, **kwargs)
     fig.align_ylabels()
@@ -204,6 +204,63 @@ def _get_quad_mesh_from_axis(ax):
     return qm
 
 
+def _min_max_decimation(times, data, limits, n_bins):
+    """
+    Decimate time data to its min/max envelope inside the axis limits.
+
+    The samples inside `limits` are split into `n_bins` bins and each bin is
+    represented by its minimum and maximum. Plotting the envelope looks the
+    same as plotting all samples if `n_bins` is at least the width of the axes
+    in pixels, but the number of plotted points does not depend on the length
+    of the data.
+
+    Parameters
+    ----------
+    times : numpy.ndarray
+        The sorted times of the samples of shape ``(n_samples, )``.
+    data : numpy.ndarray
+        The data of shape ``(n_samples, n_channels)``.
+    limits : array like
+        The lower and upper limit of the visible time range.
+    n_bins : int
+        The number of bins.
+
+    Returns
+    -------
+    times : numpy.ndarray
+        The times of the decimated data. The first and last visible samples
+        are repeated for each bin.
+    data : numpy.ndarray
+        The decimated data of shape ``(n_points, n_channels)``. The data is
+        returned without decimation if the visible range contains less than
+        ``4 * n_bins`` samples.
+    """
+    # visible samples including one sample outside the limits on each side
+    start, stop = np.searchsorted(times, np.sort(limits))
+    start = max(start - 1, 0)
+    stop = min(stop + 1, times.size)
+    n_bins = max(int(n_bins), 1)
+
+    if stop - start <= 4 * n_bins:
+        return times[start:stop], data[start:stop]
+
+    # bins of (almost) equal size and their min/max values, ignoring NaNs
+    edges = start + np.arange(n_bins) * (stop - start) // n_bins
+    data = data[start:stop]
+    data_min = np.fmin.reduceat(data, edges - start, axis=0)
+    data_max = np.fmax.reduceat(data, edges - start, axis=0)
+
+    # place minimum and maximum of each bin at its first sample and end with
+    # the last visible sample
+    times = np.append(np.repeat(times[edges], 2), times[stop - 1])
+    data = np.concatenate((
+        np.stack((data_min, data_max), axis=1).reshape(
+            2 * n_bins, *data.shape[1:]),
+        data[-1:]))
+
+    return times, data
+
+
 def _time_auto_unit(time_max):
     """
     Automatically set the unit for time axis according to the absolute maximum
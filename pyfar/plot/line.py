@@ -5,7 +5,7 @@ from . import _interaction as ia
 
 
 def time(signal, dB=False, log_prefix=20, log_reference=1, unit="s",
-         ax=None, style='light', mode='real', **kwargs):
+         ax=None, style='light', mode='real', decimate='auto', **kwargs):
     """Plot the time signal.
 
     Plots ``signal.time`` and passes keyword arguments (`kwargs`) to
@@ -56,6 +56,13 @@ def time(signal, dB=False, log_prefix=20, log_reference=1, unit="s",
         part or absolute value of the time data is plotted. ``'imag'`` and
         ``'abs'``` can only be used for complex Signals.
         The default is ``real``.
+    decimate : bool, str, optional
+        Plot the minimum and maximum of the time data within bins with the
+        width of one pixel instead of all samples. This makes plotting long
+        signals fast and looks the same as plotting all samples. The bins are
+        updated if the visible time range changes, e.g., by zooming or
+        panning. ``'auto'`` decimates signals with more than 100,000
+        samples. The default is ``'auto'``.
     **kwargs
         Keyword arguments that are passed to :py:func:`matplotlib.pyplot.plot`.
 
@@ -76,12 +83,13 @@ def time(signal, dB=False, log_prefix=20, log_reference=1, unit="s",
 
     with context(style):
         ax = _line._time(signal.flatten(), dB, log_prefix, log_reference, unit,
-                         ax, mode, **kwargs)
+                         ax, mode, decimate, **kwargs)
 
     # manage interaction
     plot_parameter = ia.PlotParameter(
         'time', dB_time=dB, log_prefix_time=log_prefix,
-        log_reference=log_reference, unit_time=unit, mode=mode)
+        log_reference=log_reference, unit_time=unit, mode=mode,
+        decimate=decimate)
     interaction = ia.Interaction(
         signal, ax, None, style, plot_parameter, **kwargs)
     ax.interaction = interaction
@@ -313,7 +321,7 @@ def group_delay(signal, unit="s", freq_scale='log', ax=None, style='light',
 def time_freq(signal, dB_time=False, dB_freq=True, log_prefix_time=20,
               log_prefix_freq=None, log_reference=1, freq_scale='log',
               unit="s", ax=None, style='light',
-              mode='real', side='right', **kwargs):
+              mode='real', side='right', decimate='auto', **kwargs):
     """
     Plot the time signal and magnitude spectrum (2 by 1 subplot).
 
@@ -378,6 +386,13 @@ def time_freq(signal, dB_time=False, dB_freq=True, log_prefix_time=20,
         frequencies, or ``'left'`` to plot the left-sided spectrum containing
         the negative frequencies (only possible for complex Signals). The
         default is ``'right'``.
+    decimate : bool, str, optional
+        Plot the minimum and maximum of the time data within bins with the
+        width of one pixel instead of all samples. This makes plotting long
+        signals fast and looks the same as plotting all samples. The bins are
+        updated if the visible time range changes, e.g., by zooming or
+        panning. ``'auto'`` decimates signals with more than 100,000
+        samples. The default is ``'auto'``.
     **kwargs
         Keyword arguments that are passed to :py:func:`matplotlib.pyplot.plot`.
 
@@ -399,7 +414,7 @@ def time_freq(signal, dB_time=False, dB_freq=True, log_prefix_time=20,
         ax = _line._time_freq(signal.flatten(), dB_time, dB_freq,
                               log_prefix_time, log_prefix_freq,
                               log_reference, freq_scale, unit, ax,
-                              mode=mode, side=side,
+                              mode=mode, side=side, decimate=decimate,
                               **kwargs)
 
     # manage interaction
@@ -407,7 +422,7 @@ def time_freq(signal, dB_time=False, dB_freq=True, log_prefix_time=20,
         'time_freq', dB_time=dB_time, dB_freq=dB_freq,
         log_prefix_time=log_prefix_time, log_prefix_freq=log_prefix_freq,
         log_reference=log_reference, xscale=freq_scale, unit_time=unit,
-        mode=mode, side=side)
+        mode=mode, side=side, decimate=decimate)
     interaction = ia.Interaction(
         signal, ax, None, style, plot_parameter, **kwargs)
     ax[0].interaction = interaction
@@ -13,7 +13,8 @@ from .spatial import SphericalVoronoi, calculate_sph_voronoi_weights
 from .samplings import (
     cart_equidistant_cube, sph_dodecahedron, sph_icosahedron, sph_equiangular,
     sph_gaussian, sph_extremal, sph_t_design, sph_equal_angle,
-    sph_great_circle, sph_lebedev, sph_fliege, sph_equal_area)
+    sph_great_circle, sph_lebedev, sph_fliege, sph_equal_area,
+    set_cache_size, clear_cache)
 
 
 __all__ = [
@@ -31,4 +32,6 @@ __all__ = [
     'sph_great_circle',
     'sph_lebedev',
     'sph_fliege',
-    'sph_equal_area']
+    'sph_equal_area',
+    'set_cache_size',
+    'clear_cache']
@@ -89,40 +89,46 @@ def point_set_polar(dimension, N):
         n_collars = np.size(n_regions) - 2
 
         points_s = np.zeros((dimension, N))
-        point_n = 2
 
-        offset = 0
-
-        for collar_n in range(0, n_collars):
-            # a_top is the colatitude of the top of the current collar.
-            a_top = a_cap[collar_n]
-
-            # a_bot is the colatitude of the bottom of the current collar.
-            a_bot = a_cap[collar_n+1]
-
-            # n_in_collar is the number of regions in the current collar.
-            n_in_collar = n_regions[collar_n+1]
-
-            points_l = point_set_polar(dimension - 1, n_in_collar)
-
-            a_point = (a_top + a_bot)/2
-
-            point_l_n = np.arange(0, np.size(points_l), dtype=int)
-            # points_l = points_l[np.newaxis]
-
-            if dimension == 2:
-                points_s[0:dimension-1, point_n+point_l_n-1] = \
-                    np.mod(points_l[point_l_n] + 2*np.pi*offset, 2*np.pi)
-
-                offset += circle_offset(n_in_collar, n_regions[2+collar_n])
+        if n_collars > 0:
+            # number of regions in each collar and the following zone
+            n_in_collar = np.asarray(n_regions[1:-1], dtype=int)
+            n_next = np.asarray(n_regions[2:], dtype=int)
+
+            # the offsets of the collars wrap around in multiples of whole
+            # rotations and can only be accumulated sequentially
+            increments = (1/n_next - 1/n_in_collar)/2 + \
+                np.gcd(n_in_collar, n_next) / (2*n_in_collar*n_next)
+            offsets = np.zeros(n_collars)
+            offset = 0
+            for collar_n, increment in enumerate(increments.tolist()):
+                offsets[collar_n] = offset
+                offset += increment
                 offset -= np.floor(offset)
-            else:
-                points_s[0:dimension-2, point_n+point_l_n-1] = \
-                    points_l[:, point_l_n]
 
-            points_s[dimension-1, point_n+point_l_n-1] = a_point
-            # point_n = point_n + points_l.shape[1]
-            point_n += np.size(points_l)
+            # collar index and index inside the collar of each point
+            collar = np.repeat(np.arange(n_collars), n_in_collar)
+            point_l_n = np.arange(N - 2) - \
+                np.repeat(np.cumsum(n_in_collar) - n_in_collar, n_in_collar)
+
+            # equally spaced points on the circle of each collar as returned
+            # by point_set_polar(1, n_in_collar)
+            n = n_in_collar[collar]
+            start = 2*np.pi / n
+            step = np.zeros(n_collars)
+            step[n_in_collar > 1] = \
+                (2*np.pi - 2*np.pi / n_in_collar[n_in_collar > 1]) / \
+                (n_in_collar[n_in_collar > 1] - 1)
+            points_l = point_l_n * step[collar] + start
+            points_l[point_l_n == n - 1] = 2*np.pi
+            points_l -= np.pi / n
+
+            points_s[0, 1:-1] = np.mod(
+                points_l + 2*np.pi*offsets[collar], 2*np.pi)
+
+            # the colatitude of each point is the center of its collar
+            a_cap = np.asarray(a_cap)
+            points_s[1, 1:-1] = ((a_cap[:-2] + a_cap[1:-1])/2)[collar]
 
         points_s[:, -1] = np.zeros(dimension)
         points_s[-1, -1] = np.pi
@@ -253,12 +259,12 @@ def ideal_region_list(dimension, N, c_polar, n_collars):
     if n_collars > 0:
         a_fitting = (np.pi - 2*c_polar) / n_collars
         ideal_region_area = area_of_ideal_region(dimension, N)
-        for collar_n in range(1, n_collars+1):
-            ideal_collar_area = area_of_collar(
-                dimension,
-                c_polar + (collar_n - 1) * a_fitting,
-                c_polar + collar_n * a_fitting)
-            r_regions[collar_n] = ideal_collar_area / ideal_region_area
+        collar_n = np.arange(1, n_collars+1)
+        ideal_collar_area = area_of_collar(
+            dimension,
+            c_polar + (collar_n - 1) * a_fitting,
+            c_polar + collar_n * a_fitting)
+        r_regions[1:-1] = ideal_collar_area / ideal_region_area
 
     r_regions[-1] = 1
 
@@ -291,9 +297,12 @@ def round_to_naturals(N, r_regions):
     n_regions = np.zeros(r_regions.shape, dtype=int)
     discrepancy = 0
 
-    for zone_n in range(0, np.size(r_regions)):
-        n_regions[zone_n] = np.rint(r_regions[zone_n] + discrepancy)
-        discrepancy += (r_regions[zone_n] - n_regions[zone_n])
+    # the rounding depends on the accumulated discrepancy and is done on
+    # Python floats, which is much faster than indexing the arrays
+    for zone_n, r_region in enumerate(r_regions.ravel().tolist()):
+        n_region = round(r_region + discrepancy)
+        discrepancy += (r_region - n_region)
+        n_regions.flat[zone_n] = n_region
 
     return n_regions
 
@@ -328,11 +337,10 @@ def cap_colats(dimension, N, c_polar, n_regions):
     c_caps[0] = c_polar
     ideal_region_area = area_of_ideal_region(dimension, N)
     n_collars = np.size(n_regions) - 2
-    subtotal_n_regions = 1
 
-    for collar_n in range(1, n_collars+1):
-        subtotal_n_regions += n_regions[collar_n]
-        c_caps[collar_n] = sradius_of_cap(
+    if n_collars > 0:
+        subtotal_n_regions = 1 + np.cumsum(n_regions[1:n_collars+1])
+        c_caps[1:n_collars+1] = sradius_of_cap(
             dimension, subtotal_n_regions*ideal_region_area)
 
     c_caps[-1] = np.pi
@@ -587,7 +595,8 @@ def polar2cart(points_polar):
 
     """
     points_cart = np.zeros((points_polar.shape[0]+1, points_polar.shape[1]))
-    points_cart[0, :] = np.cos(points_polar[0, :]) * np.sin(points_polar[1, :])
-    points_cart[1, :] = np.sin(points_polar[0, :]) * np.sin(points_polar[1, :])
+    sin_theta = np.sin(points_polar[1, :])
+    points_cart[0, :] = np.cos(points_polar[0, :]) * sin_theta
+    points_cart[1, :] = np.sin(points_polar[0, :]) * sin_theta
     points_cart[2, :] = np.cos(points_polar[1, :])
     return points_cart
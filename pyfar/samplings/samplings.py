@@ -1,15 +1,124 @@
 """Module for spherical sampling grids."""
+from collections import OrderedDict
+import functools
+import inspect
 import numpy as np
 import urllib3
 from urllib3.exceptions import InsecureRequestWarning
 import warnings
 import os
+import threading
 import scipy.io as sio
 import pyfar
 from pyfar.classes.warnings import PyfarDeprecationWarning
 
 from . import external
 
+# least recently used sampling grids (see _cached_sampling)
+_cache = OrderedDict()
+_cache_size = 32
+# guards changes of the cache from multiple threads
+_cache_lock = threading.Lock()
+
+
+def set_cache_size(maxsize):
+    """
+    Set the number of sampling grids that are cached.
+
+    The functions :py:func:`sph_equiangular`, :py:func:`sph_gaussian`,
+    :py:func:`sph_extremal`, :py:func:`sph_t_design`, :py:func:`sph_lebedev`,
+    :py:func:`sph_fliege`, and :py:func:`sph_equal_area` keep the most
+    recently created grids in a cache and return copies of the cached grids
+    when they are called again with the same parameters. The least recently
+    used grids are removed from the cache if it is full.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of cached grids. ``0`` disables the cache. The
+        default cache size is ``32``.
+    """
+    global _cache_size
+    if not isinstance(maxsize, int) or maxsize < 0:
+        raise ValueError("maxsize must be a non-negative integer.")
+    with _cache_lock:
+        _cache_size = maxsize
+        while len(_cache) > _cache_size:
+            _cache.popitem(last=False)
+
+
+def clear_cache():
+    """
+    Remove all grids from the sampling cache.
+
+    See :py:func:`set_cache_size` for more information.
+    """
+    with _cache_lock:
+        _cache.clear()
+
+
+def _cache_key(value):
+    """Return a hashable representation of a function argument."""
+    if isinstance(value, np.ndarray):
+        return (np.ndarray, value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_cache_key(v) for v in value))
+    hash(value)
+    return (type(value), value)
+
+
+def _cached_sampling(replacement):
+    """
+    Cache the sampling grids returned by the decorated function based on its
+    arguments.
+
+    Copies of the cached grids are returned, so that the cached grids can not
+    be changed. The deprecation warning in favor of
+    ``spharpy.samplings.<replacement>`` is raised on every call before the
+    cache is checked.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            warnings.warn((
+                "This function will be deprecated in pyfar 0.8.0 in favor "
+                f"of spharpy.samplings.{replacement}."),
+                    PyfarDeprecationWarning, stacklevel=2)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            try:
+                key = (func.__name__, ) + tuple(
+                    (name, _cache_key(value))
+                    for name, value in bound.arguments.items())
+            except TypeError:
+                return func(*args, **kwargs)
+
+            with _cache_lock:
+                sampling = _cache.get(key)
+                if sampling is not None:
+                    _cache.move_to_end(key)
+
+            if sampling is None:
+                # the lock is not held while the grid is computed, which
+                # might take long or require downloads
+                sampling = func(*args, **kwargs)
+                # do not cache the list of available grids
+                if sampling is not None:
+                    with _cache_lock:
+                        if _cache_size > 0:
+                            _cache[key] = sampling
+                            while len(_cache) > _cache_size:
+                                _cache.popitem(last=False)
+
+            return None if sampling is None else sampling.copy()
+
+        return wrapper
+
+    return decorator
+
 
 def cart_equidistant_cube(n_points):
     """
@@ -170,6 +279,7 @@ def sph_icosahedron(radius=1.):
     return sampling
 
 
+@_cached_sampling('equiangular')
 def sph_equiangular(n_points=None, sh_order=None, radius=1.):
     """
     Generate an equiangular sampling of the sphere.
@@ -206,11 +316,6 @@ def sph_equiangular(n_points=None, sh_order=None, radius=1.):
            Berlin, Heidelberg, Germany: Springer, 2015.
 
     """
-    warnings.warn((
-        "This function will be deprecated in pyfar 0.8.0 in favor "
-        "of spharpy.samplings.equiangular."),
-            PyfarDeprecationWarning, stacklevel=2)
-
     if (n_points is None) and (sh_order is None):
         raise ValueError(
             "Either the n_points or sh_order needs to be specified.")
@@ -262,6 +367,7 @@ def sph_equiangular(n_points=None, sh_order=None, radius=1.):
     return sampling
 
 
+@_cached_sampling('gaussian')
 def sph_gaussian(n_points=None, sh_order=None, radius=1.):
     """
     Generate sampling of the sphere based on the Gaussian quadrature.
@@ -298,11 +404,6 @@ def sph_gaussian(n_points=None, sh_order=None, radius=1.):
            Berlin, Heidelberg, Germany: Springer, 2015.
 
     """
-    warnings.warn((
-        "This function will be deprecated in pyfar 0.8.0 in favor "
-        "of spharpy.samplings.gaussian."),
-            PyfarDeprecationWarning, stacklevel=2)
-
     if (n_points is None) and (sh_order is None):
         raise ValueError(
             "Either the n_points or sh_order needs to be specified.")
@@ -349,6 +450,7 @@ def sph_gaussian(n_points=None, sh_order=None, radius=1.):
     return sampling
 
 
+@_cached_sampling('hyperinterpolation')
 def sph_extremal(n_points=None, sh_order=None, radius=1.):
     """
     Return a Hyperinterpolation sampling grid.
@@ -391,11 +493,6 @@ def sph_extremal(n_points=None, sh_order=None, radius=1.):
     .. [#]  https://web.maths.unsw.edu.au/~rsw/Sphere/MaxDet/
 
     """
-    warnings.warn((
-        "This function will be deprecated in pyfar 0.8.0 in favor "
-        "of spharpy.samplings.hyperinterpolation."),
-            PyfarDeprecationWarning, stacklevel=2)
-
     if (n_points is None) and (sh_order is None):
         for o in range(1, 100):
             print(f"SH order {o}, number of points {(o + 1)**2}")
@@ -449,6 +546,7 @@ def sph_extremal(n_points=None, sh_order=None, radius=1.):
     return sampling
 
 
+@_cached_sampling('spherical_t_design')
 def sph_t_design(degree=None, sh_order=None, criterion='const_energy',
                  radius=1.):
     r"""
@@ -513,10 +611,6 @@ def sph_t_design(degree=None, sh_order=None, criterion='const_energy',
     .. [#]  http://web.maths.unsw.edu.au/~rsw/Sphere/EffSphDes/sf.html
 
     """
-    warnings.warn((
-        "This function will be deprecated in pyfar 0.8.0 in favor "
-        "of spharpy.samplings.spherical_t_design."),
-            PyfarDeprecationWarning, stacklevel=2)
 
     # check input
     if (degree is None) and (sh_order is None):
@@ -751,6 +845,7 @@ def sph_great_circle(elevation=np.linspace(-90, 90, 19), gcd=10, radius=1,
     return sampling
 
 
+@_cached_sampling('hyperinterpolation')
 def sph_lebedev(n_points=None, sh_order=None, radius=1.):
     """
     Return Lebedev spherical sampling grid.
@@ -793,11 +888,6 @@ def sph_lebedev(n_points=None, sh_order=None, radius=1.):
         getlebedevsphere
 
     """
-    warnings.warn((
-        "This function will be deprecated in pyfar 0.8.0 in favor "
-        "of spharpy.samplings.hyperinterpolation."),
-            PyfarDeprecationWarning, stacklevel=2)
-
     # possible degrees
     degrees = np.array([6, 14, 26, 38, 50, 74, 86, 110, 146, 170, 194, 230,
                         266, 302, 350, 434, 590, 770, 974, 1202, 1454, 1730,
@@ -855,6 +945,7 @@ def sph_lebedev(n_points=None, sh_order=None, radius=1.):
     return sampling
 
 
+@_cached_sampling('fliege')
 def sph_fliege(n_points=None, sh_order=None, radius=1.):
     """
     Return Fliege-Maier spherical sampling grid.
@@ -957,11 +1048,6 @@ def sph_fliege(n_points=None, sh_order=None, radius=1.):
            Vol. 19, pp. 317–334, Apr. 1999, doi: 10.1093/imanum/19.2.317.
     .. [#] https://audiogroup.web.th-koeln.de/SOFiA_wiki/DOWNLOAD.html
     """
-    warnings.warn((
-        "This function will be deprecated in pyfar 0.8.0 in favor "
-        "of spharpy.samplings.fliege."),
-            PyfarDeprecationWarning, stacklevel=2)
-
     # possible values for n_points and sh_order
     points = np.array([4, 9, 16, 25, 36, 49, 64, 81, 100, 121, 144, 169, 196,
                        225, 256, 289, 324, 361, 400, 441, 484, 529, 576, 625,
@@ -1025,6 +1111,7 @@ def sph_fliege(n_points=None, sh_order=None, radius=1.):
     return sampling
 
 
+@_cached_sampling('equal_area')
 def sph_equal_area(n_points, radius=1.):
     """
     Sampling based on partitioning into faces with equal area.
@@ -1054,11 +1141,6 @@ def sph_equal_area(n_points, radius=1.):
             area and small diameter,” Electronic Transactions on Numerical
             Analysis, vol. 25, no. 12, pp. 309–327, 2006.
     """
-    warnings.warn((
-        "This function will be deprecated in pyfar 0.8.0 in favor "
-        "of spharpy.samplings.equal_area."),
-            PyfarDeprecationWarning, stacklevel=2)
-
     point_set = external.eq_point_set(2, n_points)
     sampling = pyfar.Coordinates(
         point_set[0] * radius, point_set[1] * radius, point_set[2] * radius,
@@ -283,3 +283,14 @@ def test__repr__(capfd):
     out, _ = capfd.readouterr()
     assert ("FrequencyData:\n"
             "(1,) channels with 3 frequencies") in out
+
+
+def test_dtype():
+    """Test storing frequency data with single precision."""
+    data = pf.FrequencyData([1, 2j, 3], [0, 1, 2], dtype='float32')
+    assert data.dtype == np.float32
+    assert data.freq.dtype == np.complex64
+    data.freq = [1., 2., 3.]
+    assert data.freq.dtype == np.float32
+    assert data[0].dtype == np.float32
+    assert pf.FrequencyData([1, 2], [0, 1]).freq.dtype == np.float64
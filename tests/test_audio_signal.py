@@ -825,3 +825,146 @@ def test_frequencies():
     signal = Signal([0, 1, 2, 4], sampling_rate=sampling_rate, is_complex=True)
     desired = np.array([-24000, -12000, 0, 12000])
     npt.assert_allclose(signal.frequencies, desired)
+
+
+def test_cache_domains_default():
+    """Test that only the current domain is stored by default."""
+    signal = pf.signals.impulse(8)
+    signal.domain = 'freq'
+    assert not Signal.cache_domains
+    assert signal.cache_nbytes == 0
+    assert signal.time.flags.writeable
+
+
+@pytest.mark.parametrize('is_complex', [True, False])
+def test_cache_domains(is_complex, monkeypatch):
+    """Test switching domains without repeated FFTs."""
+    signal = Signal(
+        np.arange(1, 9), 44100, is_complex=is_complex, fft_norm='amplitude')
+    signal.cache_domains = True
+    time = signal.time.copy()
+    freq = signal.freq_raw.copy()
+    assert signal.cache_nbytes == time.nbytes
+
+    # switching the domain does not transform the data again, calling the
+    # FFT would raise a TypeError
+    for name in ['rfft', 'irfft', 'fft', 'ifft']:
+        monkeypatch.setattr(pf.dsp.fft, name, None)
+    npt.assert_array_equal(signal.time, time)
+    npt.assert_array_equal(signal.freq_raw, freq)
+    npt.assert_array_equal(signal.time, time)
+
+    # data is read-only while both domains are kept
+    with pytest.raises(ValueError, match="read-only"):
+        signal.time[0, 0] = 1
+
+
+def test_cache_domains_input_stays_writeable():
+    """Test that caching does not make arrays of the caller read-only."""
+    data = np.arange(1., 9.)
+    signal = Signal(data, 44100)
+    signal.cache_domains = True
+    time = signal.time
+    signal.domain = 'freq'
+    assert data.flags.writeable
+    assert time.flags.writeable
+
+    # changing the arrays of the caller does not change the cache
+    data[:] = 0
+    time[:] = 0
+    npt.assert_allclose(signal.time, np.atleast_2d(np.arange(1., 9.)))
+
+
+@pytest.mark.parametrize('setter', ['time', 'freq', 'freq_raw', 'item'])
+def test_cache_domains_invalidation(setter):
+    """Test that setting data discards the cached domain."""
+    signal = pf.signals.noise(8, rms=[1, 1], seed=1)
+    signal.cache_domains = True
+    signal.domain = 'freq'
+    signal.domain = 'time'
+
+    new = pf.signals.noise(8, rms=[1, 1], seed=2)
+    if setter == 'item':
+        signal[0] = new[0]
+        desired = np.concatenate((new.time[:1], signal.time[1:]))
+    else:
+        setattr(signal, setter, getattr(new, setter))
+        desired = new.time
+    assert signal.cache_nbytes == 0
+
+    npt.assert_allclose(signal.time, desired, atol=1e-15)
+    npt.assert_allclose(signal.freq_raw, np.fft.rfft(desired), atol=1e-15)
+
+
+def test_cache_domains_copy_and_equality():
+    """Test that the cache is neither copied nor compared."""
+    signal = pf.signals.impulse(8)
+    signal.cache_domains = True
+    other = signal.copy()
+    signal.domain = 'freq'
+
+    copied = signal.copy()
+    assert copied.cache_nbytes == 0
+    assert copied.freq_raw.flags.writeable
+    assert signal == copied
+    other.domain = 'freq'
+    assert other == signal
+
+
+def test_dtype_default():
+    """Test that the precision follows the input data by default."""
+    assert Signal.default_dtype is None
+    assert Signal([1, 2, 3], 44100).dtype == np.float64
+    signal = Signal(np.ones(4, dtype=np.float32), 44100)
+    assert signal.dtype == np.float32
+    assert signal.freq_raw.dtype == np.complex64
+
+
+@pytest.mark.parametrize('is_complex', [True, False])
+@pytest.mark.parametrize(
+    'fft_norm', ['none', 'unitary', 'amplitude', 'rms', 'power', 'psd'])
+def test_dtype_float32(is_complex, fft_norm):
+    """Test that single precision is kept when switching domains."""
+    if is_complex and fft_norm in ['rms', 'power', 'psd']:
+        pytest.skip('FFT normalization not valid for complex signals')
+    data = pf.signals.noise(
+        1000, rms=[1, 1], seed=1).time.astype(complex if is_complex else float)
+    signal = Signal(
+        data, 44100, fft_norm=fft_norm, is_complex=is_complex,
+        dtype='float32')
+    real_type = np.complex64 if is_complex else np.float32
+    assert signal.dtype == np.float32
+    assert signal.time.dtype == real_type
+    assert signal.freq.dtype.kind in ['f', 'c']
+    assert signal.freq.dtype.itemsize == (8 if fft_norm not in [
+        'power', 'psd'] else 4)
+
+    # setting the frequency data keeps the precision. The phase is lost for
+    # 'power' and 'psd' normalization
+    signal.freq = signal.freq
+    assert signal.freq_raw.dtype == np.complex64
+    assert signal.time.dtype == real_type
+    if fft_norm not in ['power', 'psd']:
+        npt.assert_allclose(signal.time, data, atol=1e-5)
+
+    # the precision is passed on to items
+    assert signal[0].dtype == np.float32
+
+
+def test_dtype_global_default(monkeypatch):
+    """Test setting the precision for all signals."""
+    monkeypatch.setattr(Signal, 'default_dtype', 'float32')
+    assert Signal([1, 2, 3], 44100).time.dtype == np.float32
+    signal = Signal([1, 2, 3], 44100, domain='freq', n_samples=4)
+    assert signal.freq_raw.dtype == np.complex64
+    # the dtype parameter overrides the default
+    assert Signal([1, 2, 3], 44100, dtype='float64').dtype == np.float64
+    # the default of other audio classes is not changed
+    assert pf.TimeData([1, 2, 3], [0, 1, 2]).dtype == np.float64
+
+
+def test_dtype_error():
+    with pytest.raises(ValueError, match="dtype must be"):
+        Signal([1, 2, 3], 44100, dtype='int32')
+    with pytest.raises(ValueError, match="dtype must be"):
+        Signal([1, 2, 3], 44100, dtype='foo')
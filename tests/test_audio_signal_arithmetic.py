@@ -1062,3 +1062,185 @@ def test_audio_object_and_number(audio_object, operation):
 
     result = operation((audio_object, 1), domain=domain)
     assert type(result) is type(audio_object)
+
+
+@pytest.mark.parametrize('domain', ['time', 'freq'])
+def test_operands_are_not_changed(domain):
+    """Test that reading operands in another domain does not change them."""
+    x = pf.signals.impulse(4, amplitude=[1, 2])
+    y = pf.Signal([1, 0, 0, 0], 44100, is_complex=True)
+    other_domain = 'freq' if domain == 'time' else 'time'
+    x.domain = other_domain
+    y.domain = other_domain
+
+    z = pf.add((x, y), domain)
+    assert x.domain == other_domain
+    assert not x.complex
+    assert y.domain == other_domain
+    npt.assert_allclose(z.time, [[2, 0, 0, 0], [3, 0, 0, 0]], atol=1e-15)
+
+    # single operand returns a copy
+    z = pf.add((x, ), other_domain)
+    assert not np.shares_memory(z._data, x._data)
+
+
+@pytest.mark.parametrize('operation', [
+    pf.add, pf.subtract, pf.multiply, pf.divide, pf.power])
+@pytest.mark.parametrize('domain', ['time', 'freq'])
+def test_arithmetic_out(operation, domain):
+    """Test writing the result of an operation to an existing object."""
+    rng = np.random.default_rng(1)
+    x = pf.Signal(rng.uniform(1, 2, (2, 16)), 44100)
+    y = pf.Signal(rng.uniform(1, 2, 16), 44100)
+    desired = operation((x, y, 2), domain)
+
+    # write to object that is not part of the operation
+    out = pf.signals.impulse(16, amplitude=[1, 1])
+    out.fft_norm = desired.fft_norm
+    result = operation((x, y, 2), domain, out=out)
+    assert result is out
+    npt.assert_allclose(out.time, desired.time)
+
+    # write to object that is part of the operation
+    x.domain = domain
+    memory = x._data
+    result = operation((x, y, 2), domain, out=x)
+    assert result is x
+    assert np.shares_memory(memory, x._data)
+    npt.assert_allclose(x.time, desired.time)
+
+
+@pytest.mark.parametrize('audio_type', [pf.Signal, pf.TimeData])
+def test_arithmetic_out_aliased_operand(audio_type):
+    """Test writing to out if out is not the first operand."""
+    args = (44100, ) if audio_type is pf.Signal else ([0, 1, 2, 3], )
+    a = audio_type([1., 1, 1, 1], *args)
+    b = audio_type([1., 0, 1, 2], *args)
+    c = audio_type([2., 2, 2, 2], *args)
+
+    result = pf.add((b, c, a), 'time', out=a)
+    assert result is a
+    npt.assert_allclose(a.time, [[4, 3, 4, 5]])
+
+    # single operand
+    result = pf.add((b, ), 'time', out=a)
+    assert result is a
+    npt.assert_allclose(a.time, [[1, 0, 1, 2]])
+
+
+def test_arithmetic_out_unchanged_on_error():
+    """Test that out is not changed if the result is not numeric."""
+    x = pf.Signal([1., 2, 3, 4], 44100)
+    with pytest.raises(ValueError, match="must be numeric"):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x /= pf.Signal([0., 0, 0, 0], 44100)
+    npt.assert_allclose(x.time, [[1, 2, 3, 4]])
+
+
+@pytest.mark.parametrize('out', [False, True])
+def test_arithmetic_trusted_result(monkeypatch, out):
+    """Test that numeric results of signals are not checked again."""
+    calls = []
+    check = Signal._check_input_values_are_numeric
+    monkeypatch.setattr(
+        Signal, '_check_input_values_are_numeric',
+        staticmethod(lambda data: calls.append(data) or check(data)))
+    x = pf.Signal([1., 2, 3, 4], 44100)
+    y = pf.Signal([1., 1, 2, 2], 44100)
+    calls.clear()
+
+    result = pf.divide((x, y, 2), 'time', out=x if out else None)
+    npt.assert_allclose(result.time, [[.5, 1, .75, 1]])
+    assert calls == []
+    assert '_trusted_values' not in result.__dict__
+
+    # inf and NaN operands and results are still checked
+    result = pf.divide((x, np.inf), 'time', out=x if out else None)
+    npt.assert_allclose(result.time, [[0, 0, 0, 0]])
+    assert len(calls) == 1
+    with pytest.raises(ValueError, match="must be numeric"):
+        with np.errstate(over='ignore'):
+            pf.multiply((y, 1e308, 10), 'time', out=y if out else None)
+    npt.assert_allclose(y.time, [[1, 1, 2, 2]])
+
+
+def test_arithmetic_out_errors():
+    x = pf.signals.impulse(4, amplitude=[1, 1])
+
+    with pytest.raises(ValueError, match="out must be of the same type"):
+        pf.add((x, x), out=pf.FrequencyData([1, 2], [1, 2]))
+    with pytest.raises(ValueError, match="The FFT normalization of out"):
+        pf.divide((x, x), out=pf.signals.noise(4, rms=[1, 1]))
+    with pytest.raises(ValueError, match="out must be complex"):
+        pf.add((x, x), out=pf.Signal(np.ones((2, 4)), 44100, is_complex=True))
+    with pytest.raises(ValueError, match="The shape of the result"):
+        pf.add((x, x), out=pf.signals.impulse(4))
+    with pytest.raises(ValueError, match="can not be written to out"):
+        pf.add((pf.TimeData([1, 2], [0, 1]), 1j), 'time',
+               out=pf.TimeData([1, 2], [0, 1]))
+
+
+@pytest.mark.parametrize('audio_object', [
+    pf.Signal([1, 2, 3], 44100),
+    pf.FrequencyData([1, 2, 3], [0, 1, 3]),
+    pf.TimeData([1, 2, 3], [1, 2, 3])])
+def test_inplace_operators(audio_object):
+    """Test in-place operators."""
+    x = audio_object.copy()
+    x_id = id(x)
+    x += x
+    x -= audio_object
+    x *= 2
+    x /= 2
+    x **= 2
+    assert id(x) == x_id
+    desired = audio_object ** 2
+    npt.assert_allclose(x._data, desired._data, atol=1e-14)
+
+
+def test_inplace_operators_fallback():
+    """
+    Test in-place operators that can not write the result to the left
+    operand and return a new object instead.
+    """
+    # cshape changes
+    x = pf.signals.impulse(4)
+    x_id = id(x)
+    x += pf.signals.impulse(4, amplitude=[1, 1])
+    assert id(x) != x_id
+    assert x.cshape == (2, )
+
+    # fft_norm changes
+    x = pf.signals.noise(4, seed=1)
+    x /= x
+    assert x.fft_norm == 'none'
+
+    # real data gets complex
+    x = pf.Signal([1, 2], 44100)
+    x *= pf.Signal([1j, 2j], 44100, is_complex=True)
+    assert x.complex
+    npt.assert_allclose(x.time, [[5j, 4j]], atol=1e-15)
+
+
+@pytest.mark.parametrize('domain', ['time', 'freq'])
+def test_arithmetic_single_precision(domain):
+    """Test that arithmetic operations keep single precision."""
+    x = pf.signals.noise(1000, rms=[1, 1], seed=1)
+    y = pf.signals.noise(1000, seed=2)
+    x32 = Signal(x.time, 44100, dtype='float32')
+    y32 = Signal(y.time, 44100, dtype='float32')
+
+    for operation in [pf.add, pf.subtract, pf.multiply]:
+        result = operation((x32, y32, 2), domain)
+        assert result.dtype == np.float32
+        assert result.time.dtype == np.float32
+        desired = operation((x, y, 2), domain).time
+        npt.assert_allclose(
+            result.time, desired, atol=1e-5 * np.max(np.abs(desired)))
+
+    # arrays do not change the precision of the result
+    assert (x32 * np.ones(2)).dtype == np.float32
+    assert (FrequencyData([1, 2], [0, 1], dtype='float32') + 1j).freq.dtype \
+        == np.complex64
+    # mixed precision results in double precision
+    assert (x32 + y).dtype == np.float64
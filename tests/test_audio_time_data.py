@@ -313,3 +313,18 @@ def test__repr__(capfd):
     out, _ = capfd.readouterr()
     assert ("TimeData:\n"
             "(1,) channels with 3 samples") in out
+
+
+@pytest.mark.parametrize('is_complex', [True, False])
+def test_dtype(is_complex):
+    """Test storing time data with single precision."""
+    data = pf.TimeData([1, 2, 3], [0, 1, 2], is_complex=is_complex,
+                       dtype='float32')
+    assert data.dtype == np.float32
+    assert data.time.dtype == (np.complex64 if is_complex else np.float32)
+
+    # setting data and the complex flag keeps the precision
+    data.time = np.array([1., 2., 3.])
+    data.complex = not is_complex
+    assert data.time.dtype == (np.float32 if is_complex else np.complex64)
+    assert data[0].dtype == np.float32
@@ -207,6 +207,10 @@ def test_find_within_error():
     with pytest.raises(ValueError, match=match):
         coords.find_within(find, 1, return_sorted=-1)
 
+    match = 'return_csr must be a bool.'
+    with pytest.raises(ValueError, match=match):
+        coords.find_within(find, 1, return_csr=-1)
+
     find.radius = .1
     radius_tol = 0.1
     match = ('find_within only works if all points have the same radius. '
@@ -276,3 +280,94 @@ def test_find_within_tol_radius():
         radius_tol=0.011)
     # all points with positive z-coordinates must be found
     npt.assert_array_equal(coords[spatial_mask], coords[coords.z >= 0])
+
+
+def test_kdtree_cache():
+    """Test that the kd-tree is cached and rebuilt if the points change."""
+    coords = pf.Coordinates(np.arange(6), 0, 0)
+    find = pf.Coordinates(4, 0, 0)
+
+    coords.find_nearest(find)
+    kdtree = coords._kdtree
+    assert kdtree is not None
+    coords.find_within(find, 1)
+    assert coords._kdtree is kdtree
+
+    # copies and slices do not contain the tree of the original object
+    assert coords.copy()._kdtree is None
+    assert coords[:3]._kdtree is None
+
+    # changing the points discards the tree
+    coords.x = np.arange(6) + 1
+    assert coords._kdtree is None
+    i, _ = coords.find_nearest(find)
+    assert i[0] == 3
+
+    coords.find_nearest(find)
+    coords.rotate('z', 180)
+    assert coords._kdtree is None
+    i, d = coords.find_nearest(pf.Coordinates(-1, 0, 0))
+    assert i[0] == 0
+    npt.assert_allclose(d, 0, atol=1e-15)
+
+
+def test_find_nearest_multi_dim_index_mapping():
+    """Test mapping of flat indices to multi-dimensional indices."""
+    coords = pf.Coordinates(np.arange(24).reshape(2, 3, 4), 0, 0)
+    find = pf.Coordinates([[5.1, 23], [0, 13.9]], 0, 0)
+
+    i, _ = coords.find_nearest(find)
+    npt.assert_array_equal(i[0], [[0, 1], [0, 1]])
+    npt.assert_array_equal(i[1], [[1, 2], [0, 0]])
+    npt.assert_array_equal(i[2], [[1, 3], [0, 2]])
+
+    i, _ = coords.find_nearest(find, k=2)
+    npt.assert_array_equal(coords[i[0]].x, [[5, 23], [0, 14]])
+    npt.assert_array_equal(coords[i[1]].x, [[6, 22], [1, 13]])
+
+
+def test_find_within_multi_dim_index_mapping():
+    """Test mapping of flat indices to multi-dimensional indices."""
+    coords = pf.Coordinates(np.arange(24).reshape(2, 3, 4), 0, 0)
+
+    # multiple hits
+    index = coords.find_within(pf.Coordinates(13, 0, 0), 1)
+    npt.assert_array_equal(index[0], [1, 1, 1])
+    npt.assert_array_equal(index[1], [0, 0, 0])
+    npt.assert_array_equal(index[2], [0, 1, 2])
+
+    # no hits
+    index = coords.find_within(pf.Coordinates(30, 0, 0), 1)
+    assert len(index) == coords.cdim
+    assert coords[index].csize == 0
+
+    # multi-dimensional query points
+    find = pf.Coordinates([[2, 30], [0, 23]], 0, 0)
+    index = coords.find_within(find, 1)
+    assert len(index) == find.csize
+    npt.assert_array_equal(coords[index[0]].x, [1, 2, 3])
+    assert coords[index[1]].csize == 0
+    npt.assert_array_equal(coords[index[2]].x, [0, 1])
+    npt.assert_array_equal(coords[index[3]].x, [22, 23])
+
+
+@pytest.mark.parametrize('shape', [(24, ), (2, 3, 4)])
+@pytest.mark.parametrize('find', [
+    pf.Coordinates(13, 0, 0),
+    pf.Coordinates([2, 30, 0, 23], 0, 0),
+    pf.Coordinates([[2, 30], [0, 23]], 0, 0)])
+def test_find_within_return_csr(shape, find):
+    """Test CSR-like return format against the default format."""
+    coords = pf.Coordinates(np.arange(24).reshape(shape), 0, 0)
+
+    offsets, index = coords.find_within(find, 1, return_csr=True)
+    assert offsets.shape == (find.csize + 1, )
+    assert len(index) == coords.cdim
+    assert offsets[-1] == index[0].size
+
+    index_desired = coords.find_within(find, 1)
+    if find.csize == 1:
+        index_desired = [index_desired]
+    for i in range(find.csize):
+        index_csr = tuple(idx[offsets[i]:offsets[i+1]] for idx in index)
+        assert coords[index_csr] == coords[index_desired[i]]
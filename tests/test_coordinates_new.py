@@ -656,3 +656,39 @@ def test_angle_conversion_deg2rad():
     rad = deg2rad(deg)
     # check output values
     npt.assert_allclose(rad, np.atleast_2d([np.pi, 2*np.pi, 1]))
+
+
+def test_converted_points_cache():
+    """Test that converted points are cached until the points change."""
+    coords = Coordinates([1, 0, -1], [0, 1, 0], 0)
+    azimuth = coords.azimuth
+    cached = coords._converted['spherical_colatitude']
+    npt.assert_allclose(azimuth, [0, np.pi/2, np.pi])
+    npt.assert_equal(coords.radius, 1)
+    assert coords._converted['spherical_colatitude'] is cached
+
+    # returned values are writable copies of the read-only cache
+    assert not cached.flags.writeable
+    azimuth[:] = 1
+    spherical_colatitude = coords.spherical_colatitude
+    spherical_colatitude[:] = 1
+    npt.assert_allclose(coords.azimuth, [0, np.pi/2, np.pi])
+    cartesian = coords.cartesian
+    cartesian[:] = 0
+    npt.assert_equal(coords.x, [1, 0, -1])
+
+    # copies and slices do not contain the cache of the original object
+    assert coords.copy()._converted is None
+    npt.assert_allclose(coords[1:].azimuth, [np.pi/2, np.pi])
+
+    # all ways of changing the points discard the cache
+    coords.z = [1, 0, 0]
+    npt.assert_allclose(coords.colatitude, [np.pi/4, np.pi/2, np.pi/2])
+    coords.azimuth = 0
+    npt.assert_allclose(coords.x, [1, 1, 1])
+    coords.rotate('z', 90)
+    npt.assert_allclose(coords.lateral, [np.pi/4, np.pi/2, np.pi/2])
+    coords.radius = 2
+    npt.assert_allclose(
+        coords.cartesian, [[0, np.sqrt(2), np.sqrt(2)], [0, 2, 0], [0, 2, 0]],
+        atol=1e-15)
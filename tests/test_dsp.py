@@ -800,6 +800,19 @@ def test_impulse_response_delay_multidim():
     npt.assert_allclose(start_sample_est, start_sample, atol=1e-2)
 
 
+@pytest.mark.parametrize(("N", "processes"), [(1, None), (2, None), (2, 2)])
+def test_impulse_response_delay_order_and_processes(N, processes):
+    """Test polynomial orders, process pool, and channels without energy."""
+    delay_samples = np.array([[20, 40], [60, 0]])
+    ir = pf.signals.impulse(128, delay_samples, [[1, -1], [.5, 0]])
+
+    start_samples = dsp.find_impulse_response_delay(
+        ir, N=N, processes=processes)
+    npt.assert_allclose(
+        start_samples.flatten()[:3], delay_samples.flatten()[:3], atol=1e-6)
+    assert np.isnan(start_samples[1, 1])
+
+
 @pytest.mark.parametrize("shape", [(4, 1), (1, 4), (1, ), (1, 1)])
 def test_impulse_response_delay_cshape(shape):
     """
@@ -1086,3 +1099,74 @@ def test_convolve_method_error():
 
     with pytest.raises(ValueError, match='Invalid method'):
         dsp.convolve(x, y, method='invalid')
+
+
+@pytest.mark.parametrize("partition_sizes", [
+    None, [16, 16, 32, 32, 64], [16, 32, 64, 128]])
+@pytest.mark.parametrize(("ir_cshape", "cshape"), [
+    ((), ()), ((2, 1), (3, )), ((2, ), (1, ))])
+def test_partitioned_convolver(partition_sizes, ir_cshape, cshape):
+    """Test block-wise convolution against the full linear convolution."""
+    rng = np.random.default_rng(1)
+    impulse_response = rng.standard_normal((*ir_cshape, 500))
+    data = rng.standard_normal((*cshape, 16 * 50))
+
+    convolver = dsp.PartitionedConvolver(
+        impulse_response, 16, partition_sizes)
+    convolved = np.concatenate(
+        [convolver.process(block) for block in np.split(data, 10, axis=-1)],
+        axis=-1)
+
+    out_cshape = np.broadcast_shapes(ir_cshape, cshape)
+    desired = sgn.oaconvolve(
+        np.broadcast_to(data, (*out_cshape, data.shape[-1])),
+        np.broadcast_to(impulse_response, (*out_cshape, 500)),
+        axes=-1)[..., :data.shape[-1]]
+    npt.assert_allclose(convolved, desired, atol=1e-12)
+
+    # partitions cover the impulse response and the last size is repeated
+    assert sum(convolver.partition_sizes) >= 500
+    if partition_sizes is not None:
+        assert convolver.partition_sizes[:len(partition_sizes)] == \
+            partition_sizes
+
+    # convolver starts from silence after a reset
+    convolver.reset()
+    npt.assert_allclose(
+        convolver.process(data[..., :16]), desired[..., :16], atol=1e-12)
+
+
+def test_partitioned_convolver_signal():
+    """Test convolving Signal objects."""
+    impulse_response = pf.signals.noise(100, seed=1)
+    signal = pf.signals.noise(64, seed=2)
+    convolver = dsp.PartitionedConvolver(impulse_response, 32)
+
+    convolved = convolver.process(signal)
+    assert isinstance(convolved, pf.Signal)
+    npt.assert_allclose(
+        convolved.time,
+        dsp.convolve(signal, impulse_response).time[..., :64], atol=1e-12)
+
+    with pytest.raises(ValueError, match="The sampling rates do not match"):
+        convolver.process(pf.signals.noise(32, sampling_rate=48000))
+
+
+def test_partitioned_convolver_errors():
+    with pytest.raises(ValueError, match="must be real-valued"):
+        dsp.PartitionedConvolver(np.ones(10) * 1j, 4)
+    with pytest.raises(ValueError, match="block_size must be"):
+        dsp.PartitionedConvolver(np.ones(10), 0)
+    with pytest.raises(ValueError, match="multiples of the block_size"):
+        dsp.PartitionedConvolver(np.ones(10), 4, [4, 6])
+    with pytest.raises(ValueError, match="must not start before sample 12"):
+        dsp.PartitionedConvolver(np.ones(100), 4, [4, 16])
+
+    convolver = dsp.PartitionedConvolver(np.ones((2, 10)), 4)
+    with pytest.raises(ValueError, match="must be a multiple"):
+        convolver.process(np.ones(6))
+    with pytest.raises(ValueError, match="can not be broadcasted"):
+        convolver.process(np.ones((3, 4)))
+    convolver.process(np.ones(4))
+    with pytest.raises(ValueError, match="does not match"):
+        convolver.process(np.ones((2, 4)))
@@ -3,10 +3,16 @@ import numpy as np
 import numpy.testing as npt
 import matplotlib.pyplot as plt
 import os
+from scipy import sparse
+from scipy.interpolate import interp1d
+from scipy.ndimage import correlate1d
+from scipy.signal.windows import get_window
 import pyfar as pf
 from pyfar.dsp import (InterpolateSpectrum,
                        smooth_fractional_octave,
                        fractional_time_shift)
+from pyfar.dsp import interpolation
+from pyfar.dsp.interpolation import _smoothing_operators
 
 
 def test_smooth_fractional_octave_assertions():
@@ -114,6 +120,44 @@ def test_smooth_fractional_octave_input_signal_shape(amplitudes):
     npt.assert_allclose(np.abs(smoothed.freq), np.abs(signal.freq), atol=.02)
 
 
+@pytest.mark.parametrize("window", ["boxcar", "hann"])
+def test_smooth_fractional_octave_against_reference(window):
+    """
+    Test the vectorized smoothing against a channel-wise reference using
+    scipy.interpolate.interp1d and scipy.ndimage.
+    """
+    signal = pf.Signal(
+        np.random.default_rng(1).normal(size=(3, 2, 256)), 44100)
+    smoothed, (n_window, _) = smooth_fractional_octave(
+        signal, 3, window=window)
+
+    # channel-wise reference
+    N = signal.n_bins
+    n_lin = np.arange(N) + 1
+    n_log = N**(np.arange(N) / (N - 1))
+    weights = get_window(window, n_window, fftbins=False)
+    weights /= np.sum(weights)
+    reference = np.abs(signal.freq_raw).reshape(-1, N)
+    for nn in range(reference.shape[0]):
+        data = interp1d(n_lin, reference[nn], "cubic")(n_log)
+        data = correlate1d(data, weights, mode="nearest")
+        reference[nn] = interp1d(n_log, data, "cubic")(n_lin)
+
+    npt.assert_allclose(
+        smoothed.freq_raw, reference.reshape(signal.cshape + (N, )),
+        atol=1e-10)
+
+
+def test_smooth_fractional_octave_cached_operators():
+    """Test if smoothing operators are reused for signals of equal length."""
+    _smoothing_operators.cache_clear()
+    smooth_fractional_octave(pf.signals.impulse(64), 3)
+    smooth_fractional_octave(pf.signals.impulse(64, amplitude=[1, 2]), 3)
+    info = _smoothing_operators.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
 def test_fractional_time_shift_assertions():
     """Test if the assertions are raised correctly."""
 
@@ -237,6 +281,43 @@ def test_fractional_delay_mode_cyclic(delay):
     npt.assert_allclose(group_delay, (16+delay) % 32, atol=.05)
 
 
+@pytest.mark.parametrize("mode", ["linear", "cyclic"])
+@pytest.mark.parametrize("is_complex", [False, True])
+def test_fractional_time_shift_frequency_integer(mode, is_complex):
+    """Test frequency method against time_shift for integer shifts."""
+    rng = np.random.default_rng(1)
+    data = rng.standard_normal((2, 3, 64))
+    if is_complex:
+        data = data + 1j * rng.standard_normal((2, 3, 64))
+    signal = pf.Signal(data, 44100, is_complex=is_complex)
+    shift = [3, -5, 40]
+
+    delayed = fractional_time_shift(signal, shift, mode=mode,
+                                    method="frequency")
+    npt.assert_allclose(
+        delayed.time, pf.dsp.time_shift(signal, shift, mode).time,
+        atol=1e-12)
+
+
+@pytest.mark.parametrize("delay", [10.4, [10.4, 5.7]])
+def test_fractional_time_shift_frequency(delay):
+    """Test the linear phase of the frequency method (exact if cyclic)."""
+    signal = pf.signals.impulse(128, 64, amplitude=[1, 1])
+    delayed = fractional_time_shift(
+        signal, delay, mode="cyclic", method="frequency")
+
+    # the Nyquist bin is real and can not contain a fractional delay
+    phase = np.exp(-2j * np.pi * signal.frequencies / signal.sampling_rate
+                   * np.atleast_2d(delay).T)
+    npt.assert_allclose(delayed.freq[..., :-1],
+                        (signal.freq * phase)[..., :-1], atol=1e-12)
+
+
+def test_fractional_time_shift_method_assertion():
+    with pytest.raises(ValueError, match="The method is 'sinc'"):
+        fractional_time_shift(pf.signals.impulse(32), .5, method="sinc")
+
+
 def test_interpolate_spectrum_init():
     """Test return objects."""
     fd = pf.FrequencyData([1, .5], [100, 200])
@@ -399,3 +480,91 @@ def test_interpolate_spectrum_show():
     _ = interpolator(10, 10, show=True)
 
     plt.close()
+
+
+@pytest.mark.parametrize("method", ["complex", "magnitude_phase", "magnitude"])
+@pytest.mark.parametrize("kind", [
+    ("linear", "linear", "linear"), ("nearest", "cubic", "previous")])
+def test_interpolate_spectrum_interpolate_lengths(method, kind):
+    """
+    Test interpolating to multiple lengths against separate interpolation.
+    """
+    rng = np.random.default_rng(1)
+    data = pf.FrequencyData(
+        rng.normal(size=(3, 6)) + 1j * rng.normal(size=(3, 6)),
+        [100, 200, 400, 800, 1600, 3200])
+    interpolator = InterpolateSpectrum(data, method, kind)
+
+    signals = interpolator.interpolate_lengths(
+        [64, 127, 256], [8e3, 44100, 44100])
+    for signal, n_samples, sampling_rate in zip(
+            signals, [64, 127, 256], [8e3, 44100, 44100]):
+        reference = interpolator(n_samples, sampling_rate)
+        assert signal.n_samples == n_samples
+        assert signal.sampling_rate == sampling_rate
+        npt.assert_allclose(signal.freq, reference.freq, atol=1e-14)
+
+
+def test_interpolate_spectrum_cached_weights():
+    """Test if interpolation weights are cached per target."""
+    data = pf.FrequencyData([1, 2], [1, 2])
+    interpolator = InterpolateSpectrum(
+        data, "magnitude", ("linear", "linear", "linear"))
+
+    signal = interpolator(12, 6)
+    weights = interpolator._weights[(12, 6)]
+    assert interpolator(12, 6) == signal
+    assert interpolator._weights[(12, 6)] is weights
+    interpolator(24, 6)
+    assert len(interpolator._weights) == 2
+
+
+@pytest.mark.parametrize("kind", [
+    ("nearest", "linear", "previous"), ("zero", "nearest-up", "slinear"),
+    ("linear", "cubic", "nearest")])
+def test_interpolate_spectrum_weights_memory(kind, monkeypatch):
+    """
+    Test sparse weights, direct interpolation of large data, and the memory
+    limit of the cached weights.
+    """
+    rng = np.random.default_rng(1)
+    data = pf.FrequencyData(
+        rng.normal(size=(3, 6)) + 1j * rng.normal(size=(3, 6)),
+        [100, 200, 400, 800, 1600, 3200])
+    interpolator = InterpolateSpectrum(data, "complex", kind)
+    reference = interpolator(256, 44100)
+    weights = interpolator._weights[(256, 44100)]
+    if "cubic" in kind:
+        assert isinstance(weights, np.ndarray)
+    else:
+        # at most two input frequencies contribute to each output frequency
+        assert sparse.issparse(weights)
+        assert weights.nnz <= 2 * 129
+
+    # interpolate directly if the weights get too large
+    monkeypatch.setattr(interpolation, "_MAX_DENSE_WEIGHTS", 0)
+    interpolator = InterpolateSpectrum(data, "complex", kind)
+    signal = interpolator(256, 44100)
+    npt.assert_allclose(signal.freq, reference.freq, atol=1e-14)
+    assert len(interpolator._weights) == int("cubic" not in kind)
+
+    # least recently used weights are discarded if the memory is exceeded
+    monkeypatch.setattr(interpolation, "_MAX_DENSE_WEIGHTS", 2**21)
+    interpolator = InterpolateSpectrum(data, "complex", kind)
+    for n_samples in [64, 256]:
+        interpolator(n_samples, 44100)
+    nbytes = sum(interpolator._weights_nbytes.values())
+    monkeypatch.setattr(interpolation, "_MAX_CACHED_WEIGHTS_BYTES", nbytes)
+    interpolator = InterpolateSpectrum(data, "complex", kind)
+    for n_samples in [64, 128, 64, 256]:
+        interpolator(n_samples, 44100)
+    assert list(interpolator._weights) == [(64, 44100), (256, 44100)]
+    assert sum(interpolator._weights_nbytes.values()) == nbytes
+
+
+def test_interpolate_spectrum_interpolate_lengths_assertions():
+    data = pf.FrequencyData([1, 2], [1, 2])
+    interpolator = InterpolateSpectrum(
+        data, "magnitude", ("linear", "linear", "linear"))
+    with pytest.raises(ValueError, match="n_samples must be a number"):
+        interpolator.interpolate_lengths([[12, 24]], 6)
@@ -178,3 +178,78 @@ def test_resample_suppress_aliasing():
     # below -50 dB possibly due to the finite length of the signal)
     idx_stop = diff.find_nearest_frequency(22050 * 1.05)
     assert np.all(mag[..., idx_stop + 1:] < -50)
+
+
+@pytest.mark.parametrize('post_filter', [True, False])
+@pytest.mark.parametrize('sampling_rates', [
+    (44100, 48000), (48000, 44100), (48000, 16000)])
+def test_resampler(sampling_rates, post_filter):
+    """Test that the resampler matches resample for multiple signals."""
+    resampler = pf.dsp.Resampler(*sampling_rates, post_filter=post_filter)
+    assert resampler.sampling_rate_in == sampling_rates[0]
+    assert resampler.sampling_rate_out == sampling_rates[1]
+    for seed in range(2):
+        signal = pf.signals.noise(
+            1000, rms=[1, 2], seed=seed, sampling_rate=sampling_rates[0])
+        desired = pf.dsp.resample(
+            signal, sampling_rates[1], post_filter=post_filter)
+        resampled = resampler(signal)
+        assert isinstance(resampled, pf.Signal)
+        assert resampled.sampling_rate == sampling_rates[1]
+        np.testing.assert_array_equal(resampled.time, desired.time)
+        # arrays are resampled as well
+        np.testing.assert_array_equal(resampler(signal.time), desired.time)
+
+
+@pytest.mark.parametrize('sampling_rates', [
+    (44100, 48000), (48000, 44100), (48000, 96000)])
+def test_resampler_process(sampling_rates):
+    """Test that block-wise resampling matches resampling at once."""
+    resampler = pf.dsp.Resampler(*sampling_rates)
+    signal = pf.signals.noise(
+        1000, rms=[[1, 2]], seed=1, sampling_rate=sampling_rates[0])
+    desired = resampler(signal).time
+
+    # append zeros to get the delayed end of the signal
+    data = np.concatenate((signal.time, np.zeros((1, 2, 200))), axis=-1)
+    blocks = np.array_split(data, 7, axis=-1)
+    resampled = np.concatenate(
+        [resampler.process(block) for block in blocks], axis=-1)
+    assert resampled.shape[-1] == np.ceil(
+        1200 * resampler.up / resampler.down)
+    delay = resampler.delay
+    np.testing.assert_allclose(
+        resampled[..., delay:delay + desired.shape[-1]], desired, atol=1e-12)
+
+    # starting a new stream after reset
+    resampler.reset()
+    first = resampler.process(blocks[0])
+    np.testing.assert_array_equal(first, resampled[..., :first.shape[-1]])
+
+
+def test_resampler_process_signal_and_post_filter():
+    """Test block-wise resampling of Signals with causal post filter."""
+    signal = pf.signals.noise(900, rms=[1, 2], seed=1, sampling_rate=44100)
+    resampler = pf.dsp.Resampler(44100, 48000, post_filter=True)
+    complete = resampler.process(signal)
+    resampler.reset()
+    blocks = [pf.Signal(block, 44100, fft_norm=signal.fft_norm)
+              for block in np.array_split(signal.time, 3, axis=-1)]
+    resampled = [resampler.process(block) for block in blocks]
+    assert all(isinstance(block, pf.Signal) for block in resampled)
+    np.testing.assert_allclose(
+        np.concatenate([block.time for block in resampled], axis=-1),
+        complete.time, atol=1e-12)
+
+
+def test_resampler_errors():
+    with pytest.raises(ValueError, match="match_amplitude is"):
+        pf.dsp.Resampler(44100, 48000, match_amplitude='foo')
+    resampler = pf.dsp.Resampler(44100, 48000, match_amplitude='freq')
+    with pytest.raises(ValueError, match='match_amplitude must be "time"'):
+        resampler(pf.signals.noise(10, sampling_rate=44100))
+    with pytest.raises(ValueError, match="sampling rate of the signal"):
+        resampler(pf.signals.impulse(10, sampling_rate=48000))
+    resampler.process(np.ones((2, 10)))
+    with pytest.raises(ValueError, match="does not match"):
+        resampler.process(np.ones(10))
@@ -102,6 +102,26 @@ def test_eq_point_set_polar():
     npt.assert_almost_equal(points_polar, reference)
 
 
+def test_eq_point_set_polar_collars():
+    # grids without collars
+    npt.assert_equal(eq.point_set_polar(2, 1), [[0], [np.pi]])
+    npt.assert_equal(eq.point_set_polar(2, 2), [[0, 0], [0, np.pi]])
+
+    # points are equally spaced on each collar
+    N = 10000
+    s_cap, n_regions = eq.caps(2, N)
+    points_polar = eq.point_set_polar(2, N)
+    assert points_polar.shape == (2, N)
+    start = 1
+    for collar_n, n_in_collar in enumerate(n_regions[1:-1]):
+        collar = points_polar[:, start:start + n_in_collar]
+        npt.assert_equal(collar[1], (s_cap[collar_n] + s_cap[collar_n+1])/2)
+        npt.assert_allclose(
+            np.diff(np.sort(collar[0])), 2*np.pi / n_in_collar)
+        start += n_in_collar
+    assert start == N - 1
+
+
 def test_eq_point_set():
     reference = np.array(
         [[0, 0.632455532033676, -0.632455532033676, -0.632455532033676,
@@ -484,3 +484,22 @@ def test_check_conjugate_symmetry():
     data = np.array([1+1j, 2+2j, 3+3j, 4+4j, 5+5j])
     assert not fft._check_conjugate_symmetry(
         fft.fft(data, n_samples, sampling_rate, fft_norm))
+
+
+@pytest.mark.parametrize(
+    'fft_norm', ['none', 'unitary', 'amplitude', 'rms', 'power', 'psd'])
+def test_fft_single_precision(fft_norm):
+    """Test that the transforms keep single precision."""
+    data = np.random.default_rng(1).standard_normal((2, 1024))
+    spec = fft.rfft(data.astype(np.float32), 1024, 44100, fft_norm)
+    assert spec.dtype.itemsize == (8 if spec.dtype.kind == 'c' else 4)
+
+    # numerical error compared to double precision
+    desired = fft.rfft(data, 1024, 44100, fft_norm)
+    npt.assert_allclose(spec, desired, rtol=1e-5, atol=1e-5 * np.max(
+        np.abs(desired)))
+    inverse = fft.irfft(spec, 1024, 44100, fft_norm)
+    assert inverse.dtype == np.float32
+    if fft_norm not in ['power', 'psd']:
+        # the phase is lost for 'power' and 'psd'
+        npt.assert_allclose(inverse, data, atol=1e-5)
@@ -289,6 +289,59 @@ def test_filter_fir_init_state(impulse):
     npt.assert_allclose(filt.state, desired)
 
 
+@pytest.mark.parametrize("n_taps", [3, 1000])
+@pytest.mark.parametrize("is_complex", [False, True])
+def test_filter_fir_process_fft(n_taps, is_complex):
+    """Test fast convolution against direct filtering including the state."""
+    rng = np.random.default_rng(1)
+    coeff = rng.standard_normal((2, n_taps))
+    data = rng.standard_normal((3, 3000))
+    if is_complex:
+        data = data + 1j * rng.standard_normal((3, 3000))
+    signal = pf.Signal(data, 44100, is_complex=is_complex)
+
+    direct = fo.FilterFIR(coeff, 44100)
+    direct.processing_method = 'direct'
+    fft = fo.FilterFIR(coeff, 44100)
+    fft.processing_method = 'fft'
+
+    # without state
+    npt.assert_allclose(
+        fft.process(signal).time, direct.process(signal).time, atol=1e-12)
+
+    # block-wise with state and blocks shorter and longer than the order
+    blocks = np.split(data, [10, 500, 2000], axis=-1)
+    for filt in [direct, fft]:
+        filt.state = np.zeros((2, 3, n_taps - 1), dtype=data.dtype)
+    expected = np.concatenate(list(direct.process_blocks(blocks)), axis=-1)
+    actual = np.concatenate(list(fft.process_blocks(blocks)), axis=-1)
+    npt.assert_allclose(actual, expected, atol=1e-12)
+    npt.assert_allclose(fft.state, direct.state, atol=1e-12)
+
+
+def test_filter_fir_process_fft_mixed_methods():
+    """Test switching the processing method during block-wise filtering."""
+    rng = np.random.default_rng(1)
+    filt = fo.FilterFIR(rng.standard_normal(600), 44100)
+    data = rng.standard_normal(4000)
+    expected = filt.process(pf.Signal(data, 44100)).time
+
+    filt.init_state((1, ), 'zeros')
+    filt.processing_method = 'fft'
+    first = filt.process(pf.Signal(data[:2000], 44100)).time
+    filt.processing_method = 'direct'
+    second = filt.process(pf.Signal(data[2000:], 44100)).time
+    npt.assert_allclose(
+        np.concatenate((first, second), axis=-1), expected, atol=1e-12)
+
+
+def test_filter_fir_processing_method_assertion(impulse):
+    filt = fo.FilterFIR([1, 1/2, 0], impulse.sampling_rate)
+    filt.processing_method = 'fast'
+    with pytest.raises(ValueError, match="processing_method is 'fast'"):
+        filt.process(impulse)
+
+
 def test_filter_fir_process_sampling_rate_mismatch(impulse):
     coeff = np.array([1, 1/2, 0])
     filt = fo.FilterFIR(coeff, impulse.sampling_rate-1)
@@ -482,6 +535,160 @@ def test_blockwise_processing(Filter):
     npt.assert_array_equal(np.atleast_2d(complete.time[0, 3:]), block_b.time)
 
 
+@pytest.mark.parametrize('state', [True, False])
+def test_process_multi_channel_threads(state, monkeypatch):
+    """Test processing filter channels in parallel threads."""
+    signal = pf.signals.noise(100, rms=[1, 2, 3], seed=1)
+    sos = pf.dsp.filter.fractional_octave_bands(
+        None, 1, 44100, (500, 4000), order=4)
+    if state:
+        sos.init_state(signal.cshape, 'step')
+    sequential = sos.copy()
+
+    monkeypatch.setattr(fo, '_PARALLEL_MIN_SAMPLES', 0)
+    monkeypatch.setattr(fo.multiprocessing, 'cpu_count', lambda: 4)
+    parallel = sos.process(signal)
+    # the thread pool is shared by all calls
+    assert fo._get_executor() is fo._get_executor()
+    monkeypatch.setattr(fo.multiprocessing, 'cpu_count', lambda: 1)
+    desired = sequential.process(signal)
+
+    npt.assert_array_equal(parallel.time, desired.time)
+    if state:
+        npt.assert_array_equal(sos.state, sequential.state)
+
+
+def test_process_out():
+    """Test processing into pre-allocated memory."""
+    signal = pf.signals.noise(100, rms=[1, 2], seed=1)
+    signal.comment = 'noise'
+    signal.fft_norm = 'rms'
+    filter_object = fo.FilterFIR([[1, -1], [1, .5]], 44100)
+
+    out = np.zeros((2, 2, 100))
+    filtered = filter_object.process(signal, out=out)
+    assert np.shares_memory(filtered.time, out)
+    assert filtered.comment == 'noise'
+    assert filtered.fft_norm == 'rms'
+    npt.assert_array_equal(filtered.time, filter_object.process(signal).time)
+
+    # single channel filter with squeezed out
+    out = np.zeros((2, 100))
+    filtered = fo.FilterFIR([[1, -1]], 44100).process(signal, out=out)
+    assert np.shares_memory(filtered.time, out)
+
+    with pytest.raises(ValueError, match="out must be of shape"):
+        filter_object.process(signal, out=np.zeros((2, 100)))
+    for dtype in [np.float32, int]:
+        with pytest.raises(ValueError, match="out must be of dtype float64"):
+            filter_object.process(signal, out=np.zeros((2, 2, 100), dtype))
+
+
+@pytest.mark.parametrize('filter_object', [
+    (fo.FilterFIR([[1, -1], [1, .5]], 44100)),
+    (fo.FilterIIR([[[1, -1], [1, -.5]], [[1, 0], [1, .5]]], 44100)),
+    (fo.FilterSOS([[[1, -1, 0, 1, -.5, 0]], [[1, 0, 0, 1, .5, 0]]], 44100))])
+@pytest.mark.parametrize('use_signal', [True, False])
+def test_process_blocks(filter_object, use_signal):
+    """Test if block-wise processing matches processing the entire signal."""
+    signal = pf.signals.noise(100, rms=[1, 2, 3], seed=1)
+    complete = filter_object.copy().process(signal)
+
+    blocks = np.array_split(signal.time, 4, axis=-1)
+    if use_signal:
+        blocks = [pf.Signal(block, 44100) for block in blocks]
+    filtered = [block.time if use_signal else block
+                for block in filter_object.process_blocks(blocks)]
+
+    npt.assert_allclose(np.concatenate(filtered, axis=-1), complete.time)
+    # state was initialized and carried to the end of the signal
+    assert filter_object.state.shape[1] == 3
+
+
+def test_process_blocks_out():
+    """Test writing into a caller-provided output buffer."""
+    signal = pf.signals.noise(100, rms=[1, 2], seed=1)
+    filter_object = fo.FilterSOS([[[1, -1, 0, 1, -.5, 0]]], 44100)
+    complete = filter_object.copy().process(signal)
+
+    out = np.zeros((2, 30))
+    filtered = []
+    for block in filter_object.process_blocks(
+            np.array_split(signal.time, 4, axis=-1), out=out):
+        assert np.shares_memory(block, out)
+        filtered.append(block.copy())
+
+    npt.assert_allclose(np.concatenate(filtered, axis=-1), complete.time)
+
+    # buffer too small
+    with pytest.raises(ValueError, match="out must be of shape"):
+        next(filter_object.process_blocks([signal.time], out=out))
+    # buffer of wrong dtype
+    with pytest.raises(ValueError, match="out must be of dtype float64"):
+        next(filter_object.process_blocks(
+            [signal.time[..., :30]], out=out.astype(np.float32)))
+
+
+def test_process_blocks_sampling_rate_mismatch():
+    filter_object = fo.FilterFIR([[1, -1]], 48000)
+    with pytest.raises(ValueError, match="The sampling rates"):
+        next(filter_object.process_blocks([pf.signals.impulse(10)]))
+
+
+@pytest.mark.parametrize('use_signal', [True, False])
+@pytest.mark.parametrize('partition_sizes', [None, [8, 8, 16]])
+def test_process_partitioned(use_signal, partition_sizes):
+    """Test if partitioned processing matches processing the entire signal."""
+    coefficients = pf.signals.noise(60, rms=[1, 2], seed=2).time
+    filter_object = fo.FilterFIR(coefficients, 44100)
+    signal = pf.signals.noise(96, rms=[1, 2, 3], seed=1)
+    complete = filter_object.copy().process(signal)
+
+    blocks = np.split(signal.time, 4, axis=-1)
+    if use_signal:
+        blocks = [pf.Signal(block, 44100) for block in blocks]
+    filtered = [block.time if use_signal else block
+                for block in filter_object.process_partitioned(
+                    blocks, 8, partition_sizes)]
+
+    npt.assert_allclose(
+        np.concatenate(filtered, axis=-1), complete.time, atol=1e-12)
+    # the filter state is not used
+    assert filter_object.state is None
+
+
+@pytest.mark.parametrize('filter_object', [
+    (fo.FilterFIR([[1, -1], [1, .5]], 44100)),
+    (fo.FilterIIR([[[1, -1], [1, -.5]], [[1, 0], [1, .5]]], 44100)),
+    (fo.FilterSOS([[[1, -1, 0, 1, -.5, 0]], [[1, 0, 0, 1, .5, 0]]], 44100))])
+def test_process_single_precision(filter_object):
+    """Test that filtering keeps single precision."""
+    signal = pf.signals.noise(100, rms=[1, 2, 3], seed=1)
+    single = pf.Signal(signal.time, 44100, dtype='float32')
+
+    filtered = filter_object.copy().process(single)
+    assert filtered.dtype == np.float32
+    assert filtered.time.dtype == np.float32
+    npt.assert_allclose(
+        filtered.time, filter_object.copy().process(signal).time, atol=1e-5)
+
+    filtered = next(filter_object.process_blocks([single]))
+    assert filtered.time.dtype == np.float32
+
+
+def test_process_partitioned_single_channel():
+    filter_object = fo.FilterFIR([[1, -1, .5]], 44100)
+    signal = pf.signals.noise(16, seed=1)
+    filtered = next(filter_object.process_partitioned([signal], 4))
+    assert filtered.cshape == (1, )
+    npt.assert_allclose(
+        filtered.time, filter_object.process(signal).time, atol=1e-12)
+
+    with pytest.raises(ValueError, match="The sampling rates"):
+        next(filter_object.process_partitioned(
+            [pf.signals.impulse(4, sampling_rate=48000)], 4))
+
+
 def test_blockwise_processing_with_coefficients_exchange():
     # input signal
     input_data = pf.Signal([1, 2, 3, 4, 0], 44100)
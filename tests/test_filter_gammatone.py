@@ -128,6 +128,62 @@ def test_gammatone_bands_reset_state():
     npt.assert_array_equal(imag_b.time, imag.time[:, :, -2**11:])
 
 
+@pytest.mark.parametrize("output", ["complex", "real", "envelope"])
+def test_gammatone_bands_output(output):
+    """Test the different outputs against the complex output."""
+    GFB = pf.dsp.filter.GammatoneBands([0, 22050])
+    signal = pf.signals.noise(2**10, rms=[1, 2], seed=1)
+    real, imag = GFB.process(signal)
+
+    filtered = GFB.process(signal, output=output)
+    if output == "complex":
+        npt.assert_array_equal(filtered[0].time, real.time)
+        npt.assert_array_equal(filtered[1].time, imag.time)
+    elif output == "real":
+        npt.assert_array_equal(filtered.time, real.time)
+    else:
+        npt.assert_allclose(
+            filtered.time, np.sqrt(real.time**2 + imag.time**2))
+
+
+def test_gammatone_bands_threads(monkeypatch):
+    """Test processing the bands in parallel threads."""
+    import pyfar.classes.filter as fo
+    GFB = pf.dsp.filter.GammatoneBands([0, 22050])
+    signal = pf.signals.noise(2**10, rms=[1, 2], seed=1)
+
+    monkeypatch.setattr(fo, '_PARALLEL_MIN_SAMPLES', 0)
+    monkeypatch.setattr(fo.multiprocessing, 'cpu_count', lambda: 4)
+    parallel = GFB.process(signal, reset=True)
+    monkeypatch.setattr(fo.multiprocessing, 'cpu_count', lambda: 1)
+    desired = GFB.process(signal, reset=True)
+
+    for idx in range(2):
+        npt.assert_array_equal(parallel[idx].time, desired[idx].time)
+
+
+@pytest.mark.parametrize("output", ["complex", "real", "envelope"])
+def test_gammatone_bands_process_blocks(output):
+    """Test block-wise processing against processing in one block."""
+    GFB = pf.dsp.filter.GammatoneBands([0, 22050])
+    signal = pf.signals.noise(2**12, rms=[1, 2], seed=1)
+    reference = GFB.process(signal, output=output)
+
+    # filter in blocks of different length
+    blocks = [pf.Signal(block, 44100) for block in np.split(
+        signal.time, [1000, 3000], axis=-1)]
+    filtered = list(GFB.process_blocks(blocks, output=output))
+
+    if output == "complex":
+        for idx in range(2):
+            npt.assert_allclose(np.concatenate(
+                [f[idx].time for f in filtered], axis=-1),
+                reference[idx].time, atol=1e-14)
+    else:
+        npt.assert_allclose(np.concatenate(
+            [f.time for f in filtered], axis=-1), reference.time, atol=1e-14)
+
+
 def test_gammatone_bands_assertions():
     """Test all assertions."""
 
@@ -154,6 +210,10 @@ def test_gammatone_bands_assertions():
     with pytest.raises(ValueError, match="The sampling rates"):
         GFB.process(pf.Signal([1, 2, 3], 48000))
 
+    # invalid output
+    with pytest.raises(ValueError, match="output is 'imag'"):
+        GFB.process(pf.Signal([1, 2, 3], 44100), output="imag")
+
 
 def test_gammatone_bands_repr():
     """Test string representation."""
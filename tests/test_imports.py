@@ -4,6 +4,9 @@ tests will give hints in case a single export breaks, whereas im `import pyfar`
 would fail completely and make possible issues harder to find.
 """
 import importlib
+import subprocess
+import sys
+import pytest
 
 
 def test_import_importlib():
@@ -46,3 +49,75 @@ def test_import_functions():
     from pyfar import divide                 # noqa: F401
     from pyfar import power                  # noqa: F401
     from pyfar import matrix_multiplication  # noqa: F401
+
+
+def _imported_modules(statement):
+    """Return the modules that are imported after executing `statement`."""
+    result = subprocess.run(
+        [sys.executable, "-c",
+         f"import sys; {statement}; print(' '.join(sys.modules))"],
+        capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def _import_times(statement):
+    """
+    Return the import times of the modules that are imported after executing
+    `statement` in microseconds obtained from ``python -X importtime``. The
+    times do not include the time for importing sub-modules.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_time, _, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        times[name] = times.get(name, 0) + int(self_time)
+    return times
+
+
+def test_import_pyfar_time():
+    """
+    Guard against regressions of the import time of pyfar. Only the time of
+    pyfar's own modules is checked to be independent of the import time of
+    the dependencies. The bound is generous to avoid failures on slow
+    machines.
+    """
+    times = _import_times("import pyfar")
+    for module in ["scipy.signal", "matplotlib", "deepdiff"]:
+        assert module not in times
+    pyfar_time = sum(time for name, time in times.items()
+                     if name == "pyfar" or name.startswith("pyfar."))
+    assert pyfar_time < 1e6
+
+
+def test_import_pyfar_lazy_submodules():
+    """Test that heavy sub-modules and dependencies are imported lazily."""
+    modules = _imported_modules("import pyfar")
+    for module in [
+            "pyfar.plot", "pyfar.samplings", "pyfar.io", "pyfar.signals",
+            "pyfar.dsp.dsp", "pyfar.dsp.filter", "matplotlib", "sofar",
+            "soundfile", "urllib3", "scipy.signal", "deepdiff"]:
+        assert module not in modules
+
+    # sub-modules and their functions are available upon access
+    modules = _imported_modules(
+        "import pyfar; pyfar.plot.time; pyfar.dsp.filter.butterworth; "
+        "pyfar.samplings.sph_lebedev; pyfar.io.read; pyfar.signals.sine; "
+        "pyfar.dsp.dsp.phase; pyfar.dsp.interpolation.resample")
+    for module in ["pyfar.plot", "pyfar.dsp.filter", "pyfar.samplings",
+                   "pyfar.io", "pyfar.signals", "pyfar.dsp.dsp",
+                   "pyfar.dsp.interpolation"]:
+        assert module in modules
+
+    import pyfar
+    with pytest.raises(AttributeError, match="has no attribute 'nope'"):
+        _ = pyfar.nope
+    with pytest.raises(AttributeError, match="has no attribute 'nope'"):
+        _ = pyfar.dsp.nope
+    assert {"plot", "io", "signals"} <= set(dir(pyfar))
+    assert set(pyfar.dsp.__all__) <= set(dir(pyfar.dsp))
+
@@ -9,6 +9,7 @@ from pyfar.testing.stub_utils import stub_str_to_type, stub_is_pyfar_type
 import os.path
 import pathlib
 import soundfile
+import zipfile
 import re
 
 from pyfar import io
@@ -160,6 +161,17 @@ def test_write_anyObj_TypeError(any_obj, tmpdir):
         io.write(filename, any_obj=any_obj)
 
 
+def test_write_error_keeps_existing_file(tmpdir):
+    """Test that an existing file is kept if writing fails."""
+    filename = os.path.join(tmpdir, 'data.far')
+    io.write(filename, a=1)
+    with pytest.raises(TypeError):
+        io.write(filename, a=2, bad=object())
+    assert io.read(filename)['a'] == 1
+    # no temporary files are left
+    assert os.listdir(tmpdir) == ['data.far']
+
+
 @patch('pyfar.io._codec._str_to_type', new=stub_str_to_type())
 @patch('pyfar.io._codec._is_pyfar_type', new=stub_is_pyfar_type())
 def test_write_NoEncode_NotImplemented(no_encode_obj, tmpdir):
@@ -531,6 +543,295 @@ def test_write_read_multiplePyfarObjectsWithCompression(
     assert dict_of_builtins.items() <= actual.items()
 
 
+@pytest.mark.parametrize('lazy', [False, True])
+def test_read_names(sine, coordinates, tmpdir, lazy):
+    """Test reading selected objects."""
+    filename = os.path.join(tmpdir, 'names.far')
+    io.write(filename, signal=sine, coordinates=coordinates,
+             array=np.arange(3), number=1, string='a')
+
+    actual = io.read(filename, names=['signal', 'number'], lazy=lazy)
+    assert list(actual.keys()) == ['number', 'signal']
+    assert actual['signal'] == sine
+    assert actual['number'] == 1
+
+    actual = io.read(filename, names='array', lazy=lazy)
+    assert list(actual.keys()) == ['array']
+    npt.assert_equal(actual['array'], np.arange(3))
+
+    with pytest.raises(ValueError, match="'noise' is not contained in"):
+        io.read(filename, names=['signal', 'noise'], lazy=lazy)
+
+
+def test_read_lazy(sine, coordinates, tmpdir):
+    """Test that lazy reading decodes the objects on first access."""
+    filename = os.path.join(tmpdir, 'lazy.far')
+    io.write(filename, signal=sine, coordinates=coordinates, number=1)
+
+    with patch('pyfar.io._codec._decode_object_json_aided',
+               wraps=io._codec._decode_object_json_aided) as decode:
+        actual = io.read(filename, lazy=True)
+        # only the builtins are decoded
+        assert decode.call_count == 1
+        assert len(actual) == 3
+        assert set(actual) == {'signal', 'coordinates', 'number'}
+        assert actual['number'] == 1
+        assert decode.call_count == 1
+
+        assert actual['signal'] == sine
+        assert decode.call_count == 2
+        # objects are decoded only once
+        assert actual['signal'] is actual['signal']
+        assert decode.call_count == 2
+
+        assert actual['coordinates'] == coordinates
+        assert decode.call_count == 3
+
+    assert dict(actual) == io.read(filename)
+    with pytest.raises(KeyError):
+        actual['noise']
+
+
+def test_list_contents(sine, tmpdir):
+    filename = os.path.join(tmpdir, 'contents.far')
+    io.write(filename, signal=sine, array=np.arange(3), number=1,
+             string='a')
+    contents = io.list_contents(filename)
+    assert contents == {'number': 'int', 'string': 'str',
+                        'signal': 'Signal', 'array': 'ndarray'}
+
+
+def test_write_aligned_arrays(sine, coordinates, tmpdir):
+    """Test that uncompressed arrays are aligned to 64 bytes."""
+    filename = os.path.join(tmpdir, 'aligned.far')
+    io.write(filename, signal=sine, coordinates=coordinates,
+             array=np.arange(3, dtype=np.int8),
+             **{'array_ü': np.arange(5.)})
+
+    with zipfile.ZipFile(filename) as zip_file:
+        # all members except for the JSON files of the objects
+        infos = [info for info in zip_file.infolist()
+                 if not info.filename.split('/')[-1].startswith('$')
+                 or info.filename.endswith('/$ndarray')]
+        assert len(infos) > 3
+        for info in infos:
+            array = io._codec._memmap_ndarray(info, filename)
+            assert array.offset % 64 == 0
+            npt.assert_equal(
+                array, np.load(zip_file.open(info), allow_pickle=False))
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_read_mmap(sine, coordinates, frequency_data, tmpdir, lazy):
+    """Test reading memory mapped arrays."""
+    filename = os.path.join(tmpdir, 'mmap.far')
+    array = np.arange(6.).reshape(2, 3, order='F')
+    io.write(filename, signal=sine, coordinates=coordinates,
+             frequency_data=frequency_data, array=array)
+
+    actual = io.read(filename, mmap=True, lazy=lazy)
+    assert isinstance(actual['signal']._data, np.memmap)
+    assert isinstance(actual['frequency_data']._data, np.memmap)
+    assert isinstance(actual['coordinates']._x, np.memmap)
+    assert isinstance(actual['array'], np.memmap)
+    assert actual['signal'] == sine
+    assert actual['frequency_data'] == frequency_data
+    assert actual['coordinates'] == coordinates
+    npt.assert_equal(actual['array'], array)
+    assert actual['array'].flags.f_contiguous
+
+    # changing the data does not change the file
+    actual['array'][0, 0] = 10
+    npt.assert_equal(io.read(filename, mmap=True)['array'], array)
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_far_writer(sine, coordinates, tmpdir, compress):
+    """Test writing objects with FarWriter."""
+    filename = os.path.join(tmpdir, 'far_writer')
+    with io.FarWriter(filename, compress) as writer:
+        writer.add('signal', sine)
+        writer.add('coordinates', coordinates)
+        writer.add('array', np.arange(3))
+        writer.add('number', 1)
+        assert writer.filename == pathlib.Path(filename + '.far')
+
+    actual = io.read(filename)
+    assert actual['signal'] == sine
+    assert actual['coordinates'] == coordinates
+    npt.assert_equal(actual['array'], np.arange(3))
+    assert actual['number'] == 1
+
+    # closing again does nothing
+    writer.close()
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_far_writer_append(tmpdir, compress):
+    """Test appending channels of Signals with FarWriter."""
+    filename = os.path.join(tmpdir, 'far_writer_append.far')
+    signals = [pyfar.signals.noise(
+        128, rms=np.ones((n, 2)), sampling_rate=48000, seed=n)
+        for n in [1, 3, 2]]
+    for idx, signal in enumerate(signals):
+        signal.comment = f'signal {idx}'
+    time = np.concatenate([signal.time for signal in signals])
+    # the domain does not matter
+    signals[1].domain = 'freq'
+
+    with io.FarWriter(filename, compress) as writer:
+        for signal in signals:
+            writer.append('recordings', signal)
+        writer.append('single', signals[0])
+        writer.add('number', 1)
+
+    actual = io.read(filename)
+    assert isinstance(actual['recordings'], Signal)
+    assert actual['recordings'].cshape == (6, 2)
+    npt.assert_allclose(actual['recordings'].time, time, atol=1e-14)
+    assert actual['recordings'].comment == 'signal 0'
+    assert actual['recordings'].fft_norm == 'rms'
+    assert actual['single'] == signals[0]
+    assert actual['number'] == 1
+    # the Signals were not changed
+    assert signals[1].domain == 'freq'
+
+    actual = io.read(filename, names=['recordings'], lazy=True, mmap=True)
+    assert actual['recordings'].cshape == (6, 2)
+
+
+def test_far_writer_errors(sine, tmpdir):
+    filename = os.path.join(tmpdir, 'far_writer_errors.far')
+    with io.FarWriter(filename) as writer:
+        writer.add('signal', sine)
+        writer.append('recordings', sine)
+
+        with pytest.raises(ValueError, match="'signal' was already written"):
+            writer.add('signal', sine)
+        with pytest.raises(ValueError, match="'signal' was already written"):
+            writer.append('signal', sine)
+        with pytest.raises(ValueError, match="'recordings' was already"):
+            writer.add('recordings', sine)
+        with pytest.raises(TypeError, match="Only Signal objects"):
+            writer.append('array', np.arange(3))
+        with pytest.raises(ValueError, match="appended to 'recordings'"):
+            writer.append('recordings', Signal(sine.time, 48000))
+        with pytest.raises(ValueError, match="appended to 'recordings'"):
+            writer.append('recordings', Signal(
+                sine.time, sine.sampling_rate, dtype=np.float32))
+
+    # the file is complete despite the errors
+    assert io.list_contents(filename) == {
+        'signal': 'Signal', 'recordings': 'Signal'}
+
+
+def test_far_writer_error_keeps_existing_file(sine, tmpdir):
+    """Test that an error inside the context manager keeps existing files."""
+    filename = os.path.join(tmpdir, 'data.far')
+    io.write(filename, a=1)
+
+    def record():
+        with io.FarWriter(filename) as writer:
+            writer.append('recordings', sine)
+            raise RuntimeError('recording failed')
+
+    with pytest.raises(RuntimeError, match='recording failed'):
+        record()
+    assert io.read(filename) == {'a': 1}
+    # no temporary files are left
+    assert os.listdir(tmpdir) == ['data.far']
+
+
+@pytest.mark.parametrize('compress', [False, True])
+@pytest.mark.parametrize('channels', [
+    slice(3, 7), slice(None, None, -2), 4, [0, 9, 5], slice(5, 5)])
+def test_read_channels(tmpdir, monkeypatch, compress, channels):
+    """Test reading selected channels."""
+    # write large arrays in chunks of two channels
+    monkeypatch.setattr(io._codec, '_CHUNK_SIZE', 2 * 2 * 128 * 8)
+    filename = os.path.join(tmpdir, 'channels.far')
+    signal = pyfar.signals.noise(128, rms=np.ones((10, 2)), seed=1)
+    time_data = TimeData(signal.time, signal.times)
+    io.write(filename, compress=compress, signal=signal, time_data=time_data,
+             coordinates=Coordinates(np.arange(10), 0, 0))
+
+    if compress:
+        contents = zipfile.ZipFile(filename).namelist()
+        assert 'signal/_data/4' in contents
+        assert 'signal/_data/5' not in contents
+
+    actual = io.read(filename, channels=channels)
+    index = channels if isinstance(channels, slice) else \
+        np.atleast_1d(channels)
+    npt.assert_equal(actual['signal'].time, signal.time[index])
+    npt.assert_equal(actual['time_data'].time, signal.time[index])
+    assert actual['signal'].n_samples == 128
+    # only audio objects are affected
+    assert actual['coordinates'].csize == 10
+
+
+def test_read_channels_decompresses_selected_chunks(tmpdir, monkeypatch):
+    monkeypatch.setattr(io._codec, '_CHUNK_SIZE', 2 * 128 * 8)
+    # use multiple threads independent of the machine
+    monkeypatch.setattr(io._codec.multiprocessing, 'cpu_count', lambda: 4)
+    filename = os.path.join(tmpdir, 'channels.far')
+    signal = pyfar.signals.noise(128, rms=np.ones(10), seed=1)
+    io.write(filename, compress=True, signal=signal)
+
+    with patch('zlib.decompress', wraps=io._codec.zlib.decompress) as mock:
+        actual = io.read(filename, channels=slice(3, 5), lazy=True)
+        assert actual['signal'] == signal[3:5]
+        assert mock.call_count == 2
+
+        actual = io.read(filename, channels=slice(4, 6))
+        assert actual['signal'] == signal[4:6]
+        assert mock.call_count == 3
+
+        actual = io.read(filename)
+        assert actual['signal'] == signal
+        assert mock.call_count == 8
+
+    # the thread pool is shared by all reads and writes
+    assert io._codec._get_executor() is io._codec._get_executor()
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_far_writer_append_channels(tmpdir, monkeypatch, compress):
+    """Test reading selected channels of appended Signals."""
+    monkeypatch.setattr(io._codec, '_CHUNK_SIZE', 2 * 128 * 8)
+    filename = os.path.join(tmpdir, 'append_channels.far')
+    signal = pyfar.signals.noise(128, rms=np.ones(10), seed=1)
+    with io.FarWriter(filename, compress) as writer:
+        writer.append('signal', signal[:3])
+        writer.append('signal', signal[3:])
+        writer.add('array', np.ones((10, 128)))
+
+    assert io.read(filename)['signal'] == signal
+    npt.assert_equal(io.read(filename, channels=[2, 3, 9])['signal'].time,
+                     signal.time[[2, 3, 9]])
+    # arrays are not written in chunks
+    npt.assert_equal(io.read(filename)['array'], np.ones((10, 128)))
+
+
+def test_write_error_removes_file(sine, tmpdir):
+    filename = os.path.join(tmpdir, 'write_error.far')
+    with pytest.raises(TypeError, match="cannot be written to disk"):
+        io.write(filename, signal=sine, any_obj=object())
+    assert not os.path.isfile(filename)
+
+
+def test_read_mmap_compressed(sine, tmpdir):
+    """Test that compressed arrays are read into memory."""
+    filename = os.path.join(tmpdir, 'mmap_compressed.far')
+    io.write(filename, compress=True, signal=sine, array=np.arange(3))
+
+    actual = io.read(filename, mmap=True)
+    assert not isinstance(actual['signal']._data, np.memmap)
+    assert not isinstance(actual['array'], np.memmap)
+    assert actual['signal'] == sine
+    npt.assert_equal(actual['array'], np.arange(3))
+
+
 @patch('soundfile.read', return_value=(np.array([1., 2., 3.]), 1000))
 def test_read_audio_defaults(read_mock):
     """Test correct call of the wrapped soundfile.read() function."""
@@ -736,3 +1037,25 @@ def test__sofa_pos_error():
         "Position: Type 'bla' is not supported")
     with pytest.raises(ValueError, match=error_message):
         io.io._sofa_pos('bla', np.array([1, 2, 3]))
+
+
+def test_write_read_single_precision(tmpdir):
+    """Test that single precision data are written and read as such."""
+    filename = os.path.join(tmpdir, 'single.far')
+    signal = pyfar.Signal(
+        pyfar.signals.noise(100, rms=[1, 1], seed=1).time, 44100,
+        dtype='float32')
+    time_data = pyfar.TimeData([1, 2, 3], [0, 1, 2], dtype='float32')
+    freq_data = pyfar.FrequencyData([1, 2j, 3], [0, 1, 2], dtype='float32')
+    io.write(filename, signal=signal, time_data=time_data,
+             freq_data=freq_data, compress=True)
+
+    data = io.read(filename)
+    for name, obj in zip(['signal', 'time_data', 'freq_data'],
+                         [signal, time_data, freq_data]):
+        assert data[name].dtype == np.float32
+        assert data[name]._data.dtype == obj._data.dtype
+        assert data[name] == obj
+    assert data['signal'].freq_raw.dtype == np.complex64
+    assert io.read(filename, mmap=True)['signal'].time.dtype == np.float32
+
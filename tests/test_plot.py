@@ -232,6 +232,33 @@ def test_time_unit_assertion(sine):
     plt.close("all")
 
 
+@pytest.mark.parametrize('function', [(plot.time), (plot.time_freq)])
+def test_time_decimate(function):
+    """Test decimation of long signals and update on zoom."""
+    create_figure()
+    signal = pf.signals.noise(10000, seed=1)
+
+    # no decimation by default
+    ax = np.atleast_1d(function(signal, unit='samples'))[0]
+    assert ax.lines[0].get_xdata().size == signal.n_samples
+
+    # decimation to twice the pixel width
+    create_figure()
+    ax = np.atleast_1d(function(signal, unit='samples', decimate=True))[0]
+    n_bins = int(ax.get_window_extent().width)
+    assert ax.lines[0].get_xdata().size == 2 * n_bins + 1
+
+    # update after zooming (few visible samples are not decimated)
+    ax.set_xlim(10, 20)
+    npt.assert_equal(ax.lines[0].get_xdata(), np.arange(9, 21))
+    npt.assert_equal(ax.lines[0].get_ydata(), signal.time[0, 9:21])
+
+    with pytest.raises(ValueError, match="decimate is yes but must be"):
+        function(signal, decimate='yes')
+
+    plt.close("all")
+
+
 def test_line_custom_subplots(handsome_signal, handsome_signal_v2):
     """
     Test custom subplots in row, column, and mixed layout including hold
@@ -114,6 +114,30 @@ def test_time_auto_unit():
     assert plot._utils._time_auto_unit(2) == 's'
 
 
+def test_min_max_decimation():
+    """Test the min/max envelope and the visible range."""
+    times = np.arange(1000.)
+    data = np.stack((np.sin(times), -times), axis=-1)
+
+    # decimation of the full range
+    times_dec, data_dec = plot._utils._min_max_decimation(
+        times, data, (0, 999), 10)
+    assert times_dec.shape == (21, )
+    assert data_dec.shape == (21, 2)
+    npt.assert_equal(times_dec[:4], [0, 0, 100, 100])
+    npt.assert_equal(data_dec[:2, 1], [-99, 0])
+    npt.assert_equal(data_dec[-1], data[-1])
+    npt.assert_allclose(
+        [data_dec[:, 0].min(), data_dec[:, 0].max()],
+        [data[:, 0].min(), data[:, 0].max()])
+
+    # no decimation inside of a small range (inverted limits)
+    times_dec, data_dec = plot._utils._min_max_decimation(
+        times, data, (30.5, 10), 10)
+    npt.assert_equal(times_dec, times[9:32])
+    npt.assert_equal(data_dec, data[9:32])
+
+
 def test_default_colors():
     """Test default colors in plotstyles to match
     function used for displaying these.
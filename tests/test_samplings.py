@@ -259,6 +259,29 @@ def test_sph_lebedev():
     npt.assert_allclose(c.radius, 1.5, atol=1e-15)
 
 
+def test_sph_lebedev_quadrature():
+    """Test all stored Lebedev grids and that the cached grids are kept."""
+    degrees = [6, 14, 26, 38, 50, 74, 86, 110, 146, 170, 194, 230, 266, 302,
+               350, 434, 590, 770, 974, 1202, 1454, 1730, 2030, 2354, 2702,
+               3074, 3470, 3890, 4334, 4802, 5294, 5810]
+    for degree in degrees:
+        leb = samplings.external.lebedev_sphere(degree)
+        assert leb['x'].shape == (degree, )
+        npt.assert_allclose(leb['x']**2 + leb['y']**2 + leb['z']**2, 1)
+        # S x^2+y^2-z^2 ud Omega = 4 pi / 3
+        npt.assert_allclose(
+            np.sum((leb['x']**2 + leb['y']**2 - leb['z']**2) * leb['w']),
+            4 * np.pi / 3)
+
+        # returned grids are copies of the cached grid
+        leb['x'][:] = 0
+        assert np.all(samplings.external.lebedev_sphere(degree)['x'] ** 2
+                      + leb['y']**2 + leb['z']**2 > 0)
+
+    with pytest.raises(ValueError, match="Invalid degree"):
+        samplings.external.lebedev_sphere(7)
+
+
 def test_sph_fliege():
     # test without parameters
     assert samplings.sph_fliege() is None
@@ -300,3 +323,81 @@ def test_sph_equal_area():
     # test with user radius
     c = samplings.sph_equal_area(10, 1.5)
     npt.assert_allclose(c.radius, 1.5, atol=1e-15)
+
+
+@pytest.fixture()
+def _sampling_cache():
+    """Start with an empty sampling cache and restore its size afterwards."""
+    cache_size = samplings.samplings._cache_size
+    samplings.clear_cache()
+    yield
+    samplings.set_cache_size(cache_size)
+    samplings.clear_cache()
+
+
+@pytest.mark.usefixtures("_sampling_cache")
+def test_sampling_cache():
+    """Test that cached grids are returned as independent copies."""
+    with pytest.warns(pyfar.classes.warnings.PyfarDeprecationWarning):
+        c = samplings.sph_gaussian(sh_order=3)
+    # warnings are raised again if the grid is taken from the cache
+    with pytest.warns(pyfar.classes.warnings.PyfarDeprecationWarning):
+        c_cached = samplings.sph_gaussian(sh_order=3, radius=1)
+    assert c is not c_cached
+    npt.assert_equal(c_cached.cartesian, c.cartesian)
+    npt.assert_equal(c_cached.weights, c.weights)
+
+    # changing returned grids does not change the cached grid
+    c.radius = 2
+    c.weights[:] = 0
+    c_cached = samplings.sph_gaussian(sh_order=3)
+    npt.assert_allclose(c_cached.radius, 1)
+    npt.assert_allclose(np.sum(c_cached.weights), 1)
+
+    # grids with different parameters are cached separately
+    assert samplings.sph_gaussian(sh_order=3, radius=2).csize == c.csize
+    npt.assert_allclose(samplings.sph_gaussian(sh_order=3).radius, 1)
+    assert samplings.sph_gaussian((4, 8)).csize == 32
+
+    # least recently used grids are removed if the cache is full
+    samplings.set_cache_size(1)
+    assert len(samplings.samplings._cache) == 1
+    samplings.sph_lebedev(6)
+    assert len(samplings.samplings._cache) == 1
+    samplings.clear_cache()
+    assert len(samplings.samplings._cache) == 0
+
+    # disable cache
+    samplings.set_cache_size(0)
+    samplings.sph_lebedev(6)
+    assert len(samplings.samplings._cache) == 0
+
+    with pytest.raises(ValueError, match="non-negative integer"):
+        samplings.set_cache_size(-1)
+
+
+@pytest.mark.usefixtures("_sampling_cache")
+def test_sampling_cache_warning_on_error():
+    """Test that the deprecation warning is raised if the grid fails."""
+    with pytest.warns(pyfar.classes.warnings.PyfarDeprecationWarning,
+                      match="spharpy.samplings.fliege"):
+        with pytest.raises(ValueError, match="Invalid number of points"):
+            samplings.sph_fliege(30)
+    assert len(samplings.samplings._cache) == 0
+
+
+@pytest.mark.usefixtures("_sampling_cache")
+def test_sampling_cache_threads():
+    """Test using the sampling cache from multiple threads."""
+    from concurrent.futures import ThreadPoolExecutor
+    samplings.set_cache_size(2)
+    orders = [1, 2, 3, 4] * 25
+
+    with pytest.warns(pyfar.classes.warnings.PyfarDeprecationWarning):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            grids = list(executor.map(
+                lambda order: samplings.sph_gaussian(sh_order=order), orders))
+
+    for order, grid in zip(orders, grids):
+        assert grid.csize == 2 * (order + 1)**2
+    assert len(samplings.samplings._cache) <= 2